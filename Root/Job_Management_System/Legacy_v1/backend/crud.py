@@ -1,5 +1,21 @@
+from __future__ import annotations  # schema annotations below name a few schemas not yet defined
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
+from pydantic import ValidationError
+import numpy as np
 from . import models, schemas
+from .database import COMPACT_KEYS
+from .pagination import keyset_page
+from .services import workforce_summary
+
+def get_by_id(db: Session, model, row_id: str):
+    """
+    Row by its public string `id`, whatever the key layout.
+    With COMPACT_KEYS the high-volume tables are keyed by the integer `pk`, so Session.get(model, id) misses.
+    """
+    if COMPACT_KEYS and issubclass(model, models.HighVolumeKeyMixin):
+        return db.execute(select(model).where(model.id == row_id)).scalar_one_or_none()
+    return db.get(model, row_id)
 
 # Institution CRUD
 def get_institution(db: Session, institution_id: str):
@@ -8,6 +24,9 @@ def get_institution(db: Session, institution_id: str):
 def get_institutions(db: Session, skip: int = 0, limit: int = 100):
     return db.query(models.Institution).offset(skip).limit(limit).all()
 
+def get_institutions_page(db: Session, cursor: str = None, limit: int = 100):
+    return keyset_page(db.query(models.Institution), [models.Institution.id], cursor, limit)
+
 def create_institution(db: Session, institution: schemas.InstitutionCreate):
     db_institution = models.Institution(**institution.dict())
     db.add(db_institution)
@@ -30,6 +49,11 @@ def get_user(db: Session, user_id: str):
 def get_users(db: Session, institution_id: str, skip: int = 0, limit: int = 100):
     return db.query(models.User).filter(models.User.institution_id == institution_id).offset(skip).limit(limit).all()
 
+def get_users_page(db: Session, institution_id: str, cursor: str = None, limit: int = 100):
+    """Keyset page over (institution_id, id); served by ix_users_institution_cursor."""
+    query = db.query(models.User).filter(models.User.institution_id == institution_id)
+    return keyset_page(query, [models.User.id], cursor, limit)
+
 # Job CRUD
 # Job CRUD
 # def get_jobs(db: Session, institution_id: str, skip: int = 0, limit: int = 100):
@@ -77,7 +101,7 @@ def create_workload_entry(db: Session, entry: schemas.WorkloadEntryCreate):
 
 # Survey CRUD
 def create_survey_period(db: Session, survey: schemas.SurveyPeriodCreate, institution_id: str):
-    db_survey = models.SurveyPeriod(**survey.dict(), institution_id=institution_id)
+    db_survey = models.SurveyPeriod(**survey.dict(exclude={"institution_id"}), institution_id=institution_id)
     db.add(db_survey)
     db.commit()
     db.refresh(db_survey)
@@ -86,6 +110,75 @@ def create_survey_period(db: Session, survey: schemas.SurveyPeriodCreate, instit
 def get_survey_periods(db: Session, institution_id: str):
     return db.query(models.SurveyPeriod).filter(models.SurveyPeriod.institution_id == institution_id).all()
 
+ANNUAL_STANDARD_HOURS = 1920.0
+
+def create_workload_entries_bulk(db: Session, survey_period_id: str, rows: list):
+    """
+    Inserts many workload entries in one transaction (single executemany).
+    Invalid rows are reported by index and skipped; the rest of the batch is still saved.
+    Returns None if the survey period does not exist.
+    """
+    if not db.query(models.SurveyPeriod.id).filter(models.SurveyPeriod.id == survey_period_id).first():
+        return None
+
+    errors = []
+    valid = []  # (index, WorkloadEntryBulkItem)
+    for idx, row in enumerate(rows):
+        try:
+            item = schemas.WorkloadEntryBulkItem(**row)
+        except (ValidationError, TypeError) as e:
+            errors.append({"index": idx, "detail": str(e).splitlines()[0] if str(e) else "Invalid row"})
+            continue
+        if item.survey_period_id not in (None, survey_period_id):
+            errors.append({"index": idx, "detail": "Survey ID mismatch"})
+            continue
+        valid.append((idx, item))
+
+    # 참조 무결성: 사용자/업무 존재 여부를 행마다 조회하지 않고 IN 쿼리 두 번으로 확인
+    user_ids = {item.user_id for _, item in valid}
+    task_ids = {item.task_id for _, item in valid}
+    known_users = {r[0] for r in db.query(models.User.id).filter(models.User.id.in_(user_ids))} if user_ids else set()
+    known_tasks = {r[0] for r in db.query(models.JobTask.id).filter(models.JobTask.id.in_(task_ids))} if task_ids else set()
+
+    accepted = []
+    for idx, item in valid:
+        if item.user_id not in known_users:
+            errors.append({"index": idx, "detail": f"Unknown user_id '{item.user_id}'"})
+        elif item.task_id not in known_tasks:
+            errors.append({"index": idx, "detail": f"Unknown task_id '{item.task_id}'"})
+        elif not (np.isfinite(item.volume) and np.isfinite(item.standard_time)) or item.volume < 0 or item.standard_time < 0:
+            errors.append({"index": idx, "detail": "volume and standard_time must be non-negative numbers"})
+        else:
+            accepted.append(item)
+
+    ids = []
+    if accepted:
+        # Principle 3: FTE = (Standard Time * Volume) / 1920, computed for the whole batch at once
+        volume = np.fromiter((item.volume for item in accepted), dtype=np.float64, count=len(accepted))
+        standard_time = np.fromiter((item.standard_time for item in accepted), dtype=np.float64, count=len(accepted))
+        fte = np.where((volume > 0) & (standard_time > 0), volume * standard_time / ANNUAL_STANDARD_HOURS, 0.0)
+
+        ids = [models.generate_uuid() for _ in accepted]
+        params = [
+            {
+                "id": entry_id,
+                "survey_period_id": survey_period_id,
+                "user_id": item.user_id,
+                "task_id": item.task_id,
+                "volume": item.volume,
+                "standard_time": item.standard_time,
+                "fte": float(value),
+            }
+            for entry_id, item, value in zip(ids, accepted, fte.tolist())
+        ]
+        db.execute(insert(models.WorkloadEntry), params)
+        # Core executemany bypasses the flush listener
+        workforce_summary.refresh_for_users(db.connection(), {item.user_id for item in accepted})
+        db.commit()
+
+    errors.sort(key=lambda e: e["index"])
+    return {"inserted": len(ids), "failed": len(errors), "ids": ids, "errors": errors}
+
 def get_workload_entries(db: Session, survey_period_id: str):
     return db.query(models.WorkloadEntry).filter(models.WorkloadEntry.survey_period_id == survey_period_id).all()
 
@@ -1,27 +1,158 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+import logging
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Default to sqlite for local dev if DATABASE_URL not set
 # Prioritize PostgreSQL (recommended for production/platform usage)
 # If DATABASE_URL is not set, fallback to SQLite for local development.
 # To use with Postgres MCP, ensure the DATABASE_URL points to your Postgres instance.
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ai_native_hr.db")
 
-connect_args = {}
-if "sqlite" in SQLALCHEMY_DATABASE_URL:
-    connect_args = {"check_same_thread": False}
+# Read-only analytics engine (DATABASE_READ_URL)
+# 분석용 GET 라우터는 별도의 읽기 전용 엔진을 사용해 쓰기 잠금/쓰기 풀과 경쟁하지 않는다.
+# - Postgres : 읽기 복제본 URL 을 지정. 미지정 시 같은 DB 에 default_transaction_read_only 세션으로 별도 풀을 연다.
+# - SQLite   : 미지정 시 같은 파일을 mode=ro URI 로 연다.
+SQLALCHEMY_READ_DATABASE_URL = os.getenv("DATABASE_READ_URL") or None
+
+# Engine Profiles (DB_ENGINE_PROFILE)
+# - default    : 기존 동작 유지 (SQLAlchemy 기본 풀, SQLite 는 check_same_thread 만 해제)
+# - production : Postgres 커넥션 풀 튜닝 + SQLite WAL/pragma 적용
+#   WAL 모드에서는 읽기와 쓰기가 서로를 막지 않으므로 분석 조회와 설문 저장이 동시에 진행될 수 있다.
+DB_ENGINE_PROFILE = os.getenv("DB_ENGINE_PROFILE", "default")
+
+ENGINE_PROFILES = {
+    "default": {},
+    "production": {
+        # Postgres / server databases
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        # SQLite (applied on every new DBAPI connection)
+        "sqlite_pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+            "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-64000")),  # negative = KiB (64MB)
+            "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        },
+    },
+}
+
+# Compact surrogate keys (COMPACT_KEYS=true)
+# 대용량 테이블(workload_entries, job_tasks, work_items, job_evaluation_scores, performance_reviews)의
+# PK 를 정수(pk)로 바꾸고, 기존 문자열 id 는 UNIQUE 보조 컬럼으로 유지한다 (API 계약 불변).
+# 기존 DB 는 backend/migrate_compact_keys.py 로 전환한다.
+COMPACT_KEYS = os.getenv("COMPACT_KEYS", "false").lower() == "true"
+
+def _apply_sqlite_pragmas(engine, pragmas):
+    """Registers a connect hook so every pooled SQLite connection gets the same pragmas."""
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def _profile_options(database_url: str, profile: str, engine_kwargs: dict, read_only: bool = False):
+    """Resolves (connect_args, engine_kwargs, sqlite_pragmas) for a URL under the given profile."""
+    profile = profile or DB_ENGINE_PROFILE
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown DB_ENGINE_PROFILE '{profile}'. Choose one of: {', '.join(ENGINE_PROFILES)}")
+    settings = ENGINE_PROFILES[profile]
+
+    is_sqlite = database_url.startswith("sqlite")
+    connect_args = dict(engine_kwargs.pop("connect_args", {}))
+    pragmas = {}
+
+    if is_sqlite:
+        connect_args.setdefault("check_same_thread", False)
+        pragmas = dict(settings.get("sqlite_pragmas", {}))
+        if ":memory:" in database_url:
+            # WAL / mmap have no meaning for an in-memory database
+            pragmas.pop("journal_mode", None)
+            pragmas.pop("mmap_size", None)
+        if read_only:
+            # journal_mode 변경은 쓰기 작업이라 읽기 전용 연결에서는 실패한다 (쓰기 엔진이 이미 설정함)
+            pragmas.pop("journal_mode", None)
+        if "busy_timeout" in pragmas:
+            # sqlite3 driver level timeout (seconds) so the lock wait also covers BEGIN
+            connect_args.setdefault("timeout", pragmas["busy_timeout"] / 1000.0)
+    else:
+        for key in ("pool_size", "max_overflow", "pool_pre_ping", "pool_recycle"):
+            if key in settings:
+                engine_kwargs.setdefault(key, settings[key])
+        if read_only and database_url.startswith("postgres"):
+            connect_args.setdefault("options", "-c default_transaction_read_only=on")
+
+    return connect_args, engine_kwargs, pragmas
+
+def create_profiled_engine(database_url: str, profile: str = None, read_only: bool = False, **engine_kwargs):
+    """
+    Builds an engine for the given URL using one of ENGINE_PROFILES.
+    Extra keyword arguments are passed straight to create_engine (e.g. poolclass for tests).
+    """
+    connect_args, engine_kwargs, pragmas = _profile_options(database_url, profile, engine_kwargs, read_only)
+    db_engine = create_engine(database_url, connect_args=connect_args, **engine_kwargs)
+    if pragmas:
+        _apply_sqlite_pragmas(db_engine, pragmas)
+    return db_engine
+
+def to_async_url(database_url: str) -> str:
+    """Maps a sync DATABASE_URL onto its asyncio driver (aiosqlite / asyncpg)."""
+    scheme, rest = database_url.split("://", 1)
+    if scheme.startswith("sqlite"):
+        return f"sqlite+aiosqlite://{rest}"
+    if scheme.startswith("postgres"):
+        return f"postgresql+asyncpg://{rest}"
+    return database_url
+
+def create_profiled_async_engine(database_url: str, profile: str = None, read_only: bool = False, **engine_kwargs):
+    """Async counterpart of create_profiled_engine. Accepts the sync URL and swaps in the async driver."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    connect_args, engine_kwargs, pragmas = _profile_options(database_url, profile, engine_kwargs, read_only)
+    if database_url.startswith("postgres"):
+        # asyncpg does not understand libpq style connect_args
+        connect_args = {"server_settings": {"default_transaction_read_only": "on"}} if read_only else {}
+    db_engine = create_async_engine(to_async_url(database_url), connect_args=connect_args, **engine_kwargs)
+    if pragmas:
+        _apply_sqlite_pragmas(db_engine.sync_engine, pragmas)
+    return db_engine
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args=connect_args
-)
+def read_only_url(database_url: str) -> str:
+    """
+    URL for the read-only analytics engine when DATABASE_READ_URL is not set.
+    SQLite files are reopened through a `mode=ro` URI; in-memory databases cannot be shared and stay as-is.
+    """
+    if not database_url.startswith("sqlite") or ":memory:" in database_url or "mode=ro" in database_url:
+        return database_url
+    scheme, _, path = database_url.partition(":///")
+    if not path:
+        return database_url
+    if path.startswith("file:"):
+        separator = "&" if "?" in path else "?"
+        uri_flag = "" if "uri=true" in path else "&uri=true"
+        return f"{scheme}:///{path}{separator}mode=ro{uri_flag}"
+    return f"{scheme}:///file:{path}?mode=ro&uri=true"
+
+engine = create_profiled_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+_read_url = SQLALCHEMY_READ_DATABASE_URL or read_only_url(SQLALCHEMY_DATABASE_URL)
+if _read_url == SQLALCHEMY_DATABASE_URL and _read_url.startswith("sqlite"):
+    # In-memory SQLite: a second engine would see a different (empty) database
+    read_engine = engine
+else:
+    read_engine = create_profiled_engine(_read_url, read_only=True)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
 Base = declarative_base()
 
 def get_db():
@@ -30,3 +161,42 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_read_db():
+    """Session on the read-only engine for GET-only analytics endpoints."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# Async session path for `async def` routers.
+# 동기 SessionLocal 을 async 라우터에서 직접 호출하면 쿼리 동안 이벤트 루프 전체가 멈춘다.
+# AsyncSession 은 aiosqlite/asyncpg 드라이버로 I/O 를 기다리는 동안 다른 요청을 처리할 수 있게 한다.
+try:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    async_engine = create_profiled_async_engine(SQLALCHEMY_DATABASE_URL)
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    if read_engine is engine:
+        async_read_engine = async_engine
+    else:
+        async_read_engine = create_profiled_async_engine(_read_url, read_only=True)
+    AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+except ImportError:
+    logger.warning("Async database support (greenlet + aiosqlite / asyncpg) not installed. Async routes will be unavailable.")
+    async_engine = None
+    AsyncSessionLocal = None
+    async_read_engine = None
+    AsyncReadSessionLocal = None
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database support is not installed (pip install 'sqlalchemy[asyncio]' aiosqlite asyncpg)")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db():
+    if AsyncReadSessionLocal is None:
+        raise RuntimeError("Async database support is not installed (pip install 'sqlalchemy[asyncio]' aiosqlite asyncpg)")
+    async with AsyncReadSessionLocal() as db:
+        yield db
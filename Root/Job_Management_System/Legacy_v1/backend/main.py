@@ -1,15 +1,33 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .routers import ai_commander, fairness_audit
+from .routers_legacy import institutions, organization, tasks, classification, job_centric, productivity
 from .database import engine, Base
+from . import schema_version
+from .middleware.audit import AuditMiddleware
 
-# Create Tables (Auto-migrate for new schema)
-Base.metadata.create_all(bind=engine)
+# Schema handling at startup (SCHEMA_STARTUP)
+# - check  : 기본값. schema_version 스탬프 한 행만 조회하고, 코드와 다르면 기동을 중단한다.
+# - create : 개발용. 기존처럼 create_all 후 스탬프 기록 (워커가 많으면 SQLite 잠금 경합 발생)
+# - skip   : 테스트 등 자체적으로 스키마를 만드는 경우
+# 스키마 생성/업그레이드는 `python -m backend.manage_db upgrade` 로 명시적으로 실행한다.
+SCHEMA_STARTUP = os.getenv("SCHEMA_STARTUP", "check").lower()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if SCHEMA_STARTUP == "create":
+        schema_version.upgrade(engine, Base.metadata)
+    elif SCHEMA_STARTUP == "check":
+        schema_version.check(engine, Base.metadata)
+    yield
 
 app = FastAPI(
     title="AI-Native Public HR System",
     description="The World's First AI-Driven Job Architect & Fairness Engine",
-    version="3.0.0-Revolution"
+    version="3.0.0-Revolution",
+    lifespan=lifespan,
 )
 
 # CORS
@@ -20,12 +38,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# Request log + per-request SQL count / DB time (Server-Timing header)
+app.add_middleware(AuditMiddleware)
+
 # Mount The New Engines
 app.include_router(ai_commander.router) # The generic "Job Architect"
 app.include_router(fairness_audit.router) # The "Compliance Guard"
 
+# Legacy HR modules (organization master data, job classification, workload survey, productivity)
+app.include_router(institutions.router)
+app.include_router(organization.router)
+app.include_router(tasks.router)
+app.include_router(classification.router)
+app.include_router(job_centric.router)
+app.include_router(productivity.router)
+
 @app.get("/")
 def read_root():
     return {
@@ -0,0 +1,90 @@
+import argparse
+import os
+import sys
+
+# Allow running as a script: python backend/manage_db.py upgrade
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# Importing the app registers exactly the models the API serves (no DB work happens at import)
+from backend.main import app  # noqa: F401
+from backend.database import Base, engine
+from backend import schema_version
+from backend.sharding import shard_router
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Database schema management")
+    parser.add_argument("command", choices=["upgrade", "check", "stamp", "create-shard", "index-shard", "rebuild-closure", "rebuild-workforce-summary", "rebuild-current-reviews", "publish-search-index"],
+                        help="upgrade: create missing tables, add missing columns / indexes (filling new projection tables) and stamp | check: compare stamp with code | stamp: record current code version only | create-shard: create/upgrade an institution shard (SHARD_MODE) | index-shard: register the shard's rows in shard_directory after loading data into it | rebuild-closure: recompute the reporting-line closure table | rebuild-workforce-summary: recompute the workforce gap summary | rebuild-current-reviews: recompute the latest-review projection | publish-search-index: build the /ai/search index and publish it for the workers (SEARCH_INDEX_PATH)")
+    parser.add_argument("institution_id", nargs="?", help="institution for create-shard / index-shard")
+    args = parser.parse_args(argv)
+
+    expected = schema_version.schema_fingerprint(Base.metadata)
+    if args.command.startswith(("rebuild-", "publish-")) and schema_version.get_stamp(engine) != expected:
+        # 프로젝션/인덱스는 최신 스키마 위에서만 다시 만든다 (빈 DB 에서는 테이블이 없어 실패)
+        print("Schema is missing or out of date. Run: python -m backend.manage_db upgrade")
+        return 1
+    if args.command == "upgrade":
+        fingerprint = schema_version.upgrade(engine, Base.metadata)
+        print(f"Schema upgraded. Stamp: {fingerprint}")
+    elif args.command == "stamp":
+        fingerprint = schema_version.stamp(engine, Base.metadata)
+        print(f"Schema stamped: {fingerprint}")
+    elif args.command == "create-shard":
+        if not shard_router.enabled:
+            print("SHARD_MODE is off. Set SHARD_MODE=sqlite or postgres-schema first.")
+            return 1
+        if not args.institution_id:
+            parser.error("create-shard requires an institution_id")
+        fingerprint = shard_router.create_shard(args.institution_id, Base.metadata)
+        print(f"Shard ready for {args.institution_id} ({shard_router.mode}). Stamp: {fingerprint}")
+    elif args.command == "index-shard":
+        if not shard_router.enabled:
+            print("SHARD_MODE is off. Set SHARD_MODE=sqlite or postgres-schema first.")
+            return 1
+        if not args.institution_id:
+            parser.error("index-shard requires an institution_id")
+        rows = shard_router.index_shard(args.institution_id)
+        print(f"Shard directory updated for {args.institution_id}: {rows} row(s).")
+    elif args.command == "rebuild-closure":
+        from backend.database import SessionLocal
+        from backend.services import reporting_closure
+        db = SessionLocal()
+        try:
+            rows = reporting_closure.rebuild(db)
+        finally:
+            db.close()
+        print(f"Reporting closure rebuilt: {rows} row(s).")
+    elif args.command == "rebuild-workforce-summary":
+        from backend.database import SessionLocal
+        from backend.services import workforce_summary
+        db = SessionLocal()
+        try:
+            rows = workforce_summary.rebuild(db)
+        finally:
+            db.close()
+        print(f"Workforce gap summary rebuilt: {rows} row(s).")
+    elif args.command == "rebuild-current-reviews":
+        from backend.database import SessionLocal
+        from backend.services import current_review
+        db = SessionLocal()
+        try:
+            rows = current_review.rebuild(db)
+        finally:
+            db.close()
+        print(f"Current review projection rebuilt: {rows} row(s).")
+    elif args.command == "publish-search-index":
+        from backend.routers_legacy import ai
+        path = ai.SEARCH_INDEX_PATH or "./search_index.bin"
+        version = ai.publish_search_index(path=path)
+        print(f"Search index published: {path} v{version}.")
+    else:
+        current = schema_version.get_stamp(engine)
+        print(f"Database stamp: {current or 'missing'} | Code expects: {expected}")
+        if current != expected:
+            print("Schema is out of date. Run: python -m backend.manage_db upgrade")
+            return 1
+        print("Schema is up to date.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 import logging
 import sys
+from .query_metrics import track_queries
 
 # Configure logger
 logger = logging.getLogger("audit_logger")
@@ -16,8 +17,9 @@ class AuditMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         start_time = time.time()
         
-        # Process request
-        response = await call_next(request)
+        # Process request (SQL statements executed for this request are collected in `stats`)
+        with track_queries() as stats:
+            response = await call_next(request)
         
         process_time = time.time() - start_time
         
@@ -38,9 +40,17 @@ class AuditMiddleware(BaseHTTPMiddleware):
             f"Method: {request.method} | "
             f"Path: {request.url.path} | "
             f"Status: {response.status_code} | "
-            f"Duration: {process_time:.4f}s"
+            f"Duration: {process_time:.4f}s | "
+            f"Queries: {stats.count} | "
+            f"DB: {stats.duration_ms:.1f}ms"
         )
         
         logger.info(log_message)
+
+        # Visible in browser devtools (Network > Timing)
+        response.headers["Server-Timing"] = (
+            f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries", '
+            f"total;dur={process_time * 1000:.1f}"
+        )
         
         return response
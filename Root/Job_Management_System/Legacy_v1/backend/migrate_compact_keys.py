@@ -0,0 +1,86 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateTable
+import os
+import sys
+
+# Allow running as a script: COMPACT_KEYS=true python backend/migrate_compact_keys.py
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.database import engine, COMPACT_KEYS
+from backend import models
+
+HIGH_VOLUME_TABLES = [
+    "job_tasks",
+    "work_items",
+    "workload_entries",
+    "job_evaluation_scores",
+    "performance_reviews",
+]
+
+def migrate(bind=engine):
+    """
+    Rebuilds the high-volume tables with an INTEGER `pk` primary key and `id` as a UNIQUE column.
+    Must be run with COMPACT_KEYS=true so the model metadata describes the new layout.
+    Tables that already have the `pk` column are skipped.
+    """
+    if not COMPACT_KEYS:
+        print("COMPACT_KEYS is not enabled. Set COMPACT_KEYS=true and run again.")
+        return 0
+    if bind.dialect.name != "sqlite":
+        # Postgres 는 ALTER TABLE ... ADD COLUMN pk BIGSERIAL / PK 교체로 처리한다 (DBA 작업)
+        print(f"Table rebuild is only implemented for SQLite (got {bind.dialect.name}). Skipping.")
+        return 0
+
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    rebuilt = 0
+
+    with bind.connect() as conn:
+        # 테이블 교체 중에는 FK 검사를 끈다 (SQLite 공식 ALTER TABLE 절차)
+        conn.execute(text("PRAGMA foreign_keys=OFF"))
+        conn.commit()
+        with conn.begin():
+            for table_name in HIGH_VOLUME_TABLES:
+                if table_name not in existing_tables:
+                    print(f"Skipping {table_name}: table does not exist")
+                    continue
+                existing_columns = [c["name"] for c in inspector.get_columns(table_name)]
+                if "pk" in existing_columns:
+                    print(f"Skipping {table_name}: already uses compact keys")
+                    continue
+
+                table = models.Base.metadata.tables[table_name]
+                extra = [c for c in existing_columns if c not in table.columns]
+                if extra:
+                    # 모델에 없는 컬럼이 있으면 재생성 시 데이터가 사라지므로 건너뛴다
+                    print(f"Skipping {table_name}: column(s) {', '.join(extra)} are not in the model; run the schema update scripts first")
+                    continue
+                tmp_name = f"{table_name}__compact"
+                # Old files may lack newer columns; copy only what both layouts share
+                shared = [c.name for c in table.columns if c.name in existing_columns]
+                missing = [c.name for c in table.columns if c.name not in existing_columns and c.name != "pk"]
+                if missing:
+                    print(f"Note: {table_name} has no column(s) {', '.join(missing)}; they will be NULL")
+
+                ddl = str(CreateTable(table).compile(bind=bind))
+                ddl = ddl.replace(f"CREATE TABLE {table_name}", f"CREATE TABLE {tmp_name}", 1)
+                conn.execute(text(f"DROP TABLE IF EXISTS {tmp_name}"))
+                conn.execute(text(ddl))
+                cols = ", ".join(shared)
+                # rowid 순서대로 복사해 pk 가 기존 삽입 순서를 따르도록 한다
+                conn.execute(text(f"INSERT INTO {tmp_name} ({cols}) SELECT {cols} FROM {table_name} ORDER BY rowid"))
+                conn.execute(text(f"DROP TABLE {table_name}"))
+                conn.execute(text(f"ALTER TABLE {tmp_name} RENAME TO {table_name}"))
+                for index in table.indexes:
+                    if all(c.name in shared for c in index.columns):
+                        index.create(bind=conn)
+                rebuilt += 1
+                print(f"Rebuilt {table_name} with INTEGER pk ({len(shared)} columns copied)")
+        conn.execute(text("PRAGMA foreign_keys=ON"))
+        conn.commit()
+
+    print(f"Compact key migration completed. {rebuilt} table(s) rebuilt.")
+    return rebuilt
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,61 @@
+from sqlalchemy import inspect, text
+import os
+import sys
+
+# Allow running as a script: python backend/migrate_indexes.py
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.database import engine
+from backend import models
+
+# Columns added after the initial schema (hot-path indexes, 9-box scores).
+# SQLite can only add one column per ALTER TABLE statement.
+NEW_COLUMNS = {
+    "users": ["reports_to_id VARCHAR REFERENCES users(id)"],
+    "performance_reviews": ["score_potential FLOAT DEFAULT 0.0", "nine_box_position INTEGER"],
+}
+
+def migrate(bind=engine):
+    """
+    Adds the composite / foreign-key indexes declared in backend.models to an existing database.
+    Safe to run repeatedly: existing columns and indexes are skipped.
+    """
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+
+    with bind.begin() as conn:
+        for table_name, columns in NEW_COLUMNS.items():
+            if table_name not in existing_tables:
+                continue
+            existing_columns = {c["name"] for c in inspector.get_columns(table_name)}
+            for col in columns:
+                col_name = col.split()[0]
+                if col_name in existing_columns:
+                    continue
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {col}"))
+                print(f"Added column: {table_name}.{col_name}")
+
+        created = 0
+        for table in models.Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = {ix["name"] for ix in inspector.get_indexes(table.name)}
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            existing_columns.update(col.split()[0] for col in NEW_COLUMNS.get(table.name, []))
+            for index in table.indexes:
+                if index.name in existing_indexes:
+                    continue
+                missing = [c.name for c in index.columns if c.name not in existing_columns]
+                if missing:
+                    # Older database files predate some columns; run the schema update scripts first
+                    print(f"Skipping {index.name}: missing column(s) {', '.join(missing)}")
+                    continue
+                index.create(bind=conn)
+                created += 1
+                print(f"Created index: {index.name} ON {table.name}({', '.join(c.name for c in index.columns)})")
+
+    print(f"Index migration completed. {created} index(es) created.")
+    return created
+
+if __name__ == "__main__":
+    migrate()
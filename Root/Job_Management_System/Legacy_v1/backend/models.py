@@ -1,14 +1,38 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Float, DateTime, Text, Enum, Date, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Float, DateTime, Text, Enum, Date, JSON, Index
+from sqlalchemy.orm import relationship, synonym
 from sqlalchemy.sql import func
-from .database import Base
+from .database import Base, COMPACT_KEYS
+import datetime
 import uuid
 import enum
 
 def generate_uuid():
     return str(uuid.uuid4())
 
-# --- Enums for Public Sector & AI ---
+class HighVolumeKeyMixin:
+    """
+    Primary key layout for the high-volume tables.
+    With COMPACT_KEYS the integer `pk` is the physical key and `id` stays the public, unique string ID,
+    so foreign keys and API payloads that use `id` keep working unchanged.
+    """
+    if COMPACT_KEYS:
+        pk = Column(Integer, primary_key=True, autoincrement=True)
+        id = Column(String, unique=True, nullable=False, default=generate_uuid)
+    else:
+        id = Column(String, primary_key=True, default=generate_uuid)
+
+# --- Enums ---
+class InstitutionCategory(str, enum.Enum):
+    MARKET = "MARKET"
+    QUASI_MARKET = "QUASI_MARKET"
+    FUND = "FUND"
+    CONSIGNMENT = "CONSIGNMENT"
+
+class UnitType(str, enum.Enum):
+    HQ = "HQ"          # 본부
+    OFFICE = "OFFICE"  # 실
+    TEAM = "TEAM"      # 팀
+
 class JobGrade(str, enum.Enum):
     G1 = "G1"
     G2 = "G2"
@@ -17,6 +41,47 @@ class JobGrade(str, enum.Enum):
     G5 = "G5"
     EXECUTIVE = "EXECUTIVE"
 
+class SurveyStatus(str, enum.Enum):
+    DRAFT = "DRAFT"
+    ACTIVE = "ACTIVE"
+    CLOSED = "CLOSED"
+
+class DependencyType(str, enum.Enum):
+    BLOCKS = "BLOCKS"
+    RELATED = "RELATED"
+    SEQUENTIAL = "SEQUENTIAL"
+
+class TaskFrequency(str, enum.Enum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+    YEARLY = "YEARLY"
+    SEASONAL = "SEASONAL"
+    IRREGULAR = "IRREGULAR"
+
+class RaterType(str, enum.Enum):
+    SELF = "SELF"
+    PEER = "PEER"
+    SUPERVISOR_1 = "SUPERVISOR_1" # Direct
+    SUPERVISOR_2 = "SUPERVISOR_2" # Next Level
+    EXTERNAL = "EXTERNAL" # Committee
+
+class ReviewStatus(str, enum.Enum):
+    DRAFT = "DRAFT"
+    SUBMITTED = "SUBMITTED"
+    FINAL = "FINAL"
+
+class TrainingStatus(str, enum.Enum):
+    PLANNED = "PLANNED"
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+
+class PulseWorkloadLevel(str, enum.Enum):
+    LOW = "LOW"
+    NORMAL = "NORMAL"
+    HIGH = "HIGH"
+    OVERLOAD = "OVERLOAD"
+
 class AISource(str, enum.Enum):
     USER_INPUT = "USER_INPUT"
     AI_GENERATED = "AI_GENERATED"
@@ -27,11 +92,102 @@ class ComplianceStatus(str, enum.Enum):
     WARNING = "WARNING" # Bias suspected
     VIOLATION = "VIOLATION" # Legal issue
 
-# =========================================================
-# 1. NCS (National Competency Standards) Integration
-#    - The Foundation of Public HR
-# =========================================================
+# --- Core Models ---
+class Institution(Base):
+    __tablename__ = "institutions"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    name = Column(String, nullable=False)
+    code = Column(String, unique=True, nullable=False)
+    category = Column(Enum(InstitutionCategory), nullable=True)
+    
+    org_units = relationship("OrgUnit", back_populates="institution")
+    users = relationship("User", back_populates="institution")
+    benchmark_data = relationship("ExternalBenchmarkData", back_populates="institution")
+    strategic_analyses = relationship("StrategicAnalysis", back_populates="institution")
+    headcount_plans = relationship("HeadcountPlan", back_populates="institution")
+
+class OrgUnit(Base):
+    __tablename__ = "org_units"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    institution_id = Column(String, ForeignKey("institutions.id"))
+    parent_id = Column(String, ForeignKey("org_units.id"), nullable=True)
+    name = Column(String, nullable=False)
+    unit_type = Column(Enum(UnitType), nullable=False)
+    mission = Column(Text, nullable=True) # For Cascading
+    
+    institution = relationship("Institution", back_populates="org_units")
+    parent = relationship("OrgUnit", remote_side=[id], backref="children")
+    users = relationship("User", back_populates="org_unit")
+    team_budgets = relationship("TeamBudget", back_populates="org_unit")
+
+class User(Base):
+    __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination: WHERE institution_id = ? AND id > ? ORDER BY id
+        Index("ix_users_institution_cursor", "institution_id", "id"),
+    )
+    id = Column(String, primary_key=True, default=generate_uuid)
+    institution_id = Column(String, ForeignKey("institutions.id"), index=True)
+    org_unit_id = Column(String, ForeignKey("org_units.id"), index=True)
+    reports_to_id = Column(String, ForeignKey("users.id"), nullable=True, index=True) # Reporting line (Span of Control)
+    email = Column(String, unique=True, index=True)
+    name = Column(String)
+    hire_date = Column(Date, nullable=True)
+    
+    # 2.7 Personnel Card Details
+    birth_date = Column(Date, nullable=True)
+    phone_number = Column(String, nullable=True)
+    address = Column(String, nullable=True)
+    education_level = Column(String, nullable=True) # e.g., Bachelor, Master
+    certifications = Column(JSON, nullable=True) # List of certifications
+    career_history = Column(JSON, nullable=True) # List of previous jobs
+    
+    institution = relationship("Institution", back_populates="users")
+    org_unit = relationship("OrgUnit", back_populates="users")
+    job_positions = relationship("JobPosition", back_populates="user")
+    reviews = relationship("PerformanceReview", back_populates="user")
+    workload_entries = relationship("WorkloadEntry", back_populates="user")
+    trainings = relationship("EmployeeTraining", back_populates="user")
+    promotion_entries = relationship("PromotionList", back_populates="user")
+
+class ReportingClosure(Base):
+    """
+    Closure table of the reporting lines (User.reports_to_id): one row per (ancestor, descendant) pair,
+    including the (user, user, 0) self row. Maintained by services/reporting_closure.py on every flush.
+    """
+    __tablename__ = "reporting_closure"
+    __table_args__ = (
+        # Ancestors of a user (move / cycle checks)
+        Index("ix_reporting_closure_descendant", "descendant_id", "depth"),
+    )
+    ancestor_id = Column(String, ForeignKey("users.id"), primary_key=True) # PK (ancestor_id, descendant_id) serves subtree lookups
+    descendant_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+
+class ShardDirectory(Base):
+    """
+    SHARD_MODE only, kept in the shared database: which institution shard holds a parent row
+    (job group, survey, ...) so id-addressed routes find the shard without an institution_id.
+    Maintained by sharding.py on every commit of a tenant session.
+    """
+    __tablename__ = "shard_directory"
+    table_name = Column(String, primary_key=True)
+    row_id = Column(String, primary_key=True)
+    institution_id = Column(String, nullable=False)
 
+# --- Strategic Analysis ---
+class StrategicAnalysis(Base):
+    __tablename__ = "strategic_analyses"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    institution_id = Column(String, ForeignKey("institutions.id"))
+    analysis_type = Column(String, nullable=False) # PEST, SWOT, etc.
+    content = Column(Text, nullable=False) # JSON string
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    
+    institution = relationship("Institution", back_populates="strategic_analyses")
+
+# --- NCS (National Competency Standards) Integration ---
 class NCSCode(Base):
     """
     Standard NCS Data. Read-only reference usually.
@@ -55,50 +211,86 @@ class NCSCompetency(Base):
     
     ncs_code = relationship("NCSCode", back_populates="competencies")
 
-# =========================================================
-# 2. AI-Native Job Architecture
-# =========================================================
+# --- Job Architecture (2.2 Job Classification) ---
+class JobGroup(Base):
+    __tablename__ = "job_groups"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    name = Column(String, nullable=False)
+    series = relationship("JobSeries", back_populates="group")
+
+class JobSeries(Base):
+    __tablename__ = "job_series"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    group_id = Column(String, ForeignKey("job_groups.id"))
+    name = Column(String, nullable=False)
+    
+    # 2.2 NCS Mapping
+    ncs_code = Column(String, nullable=True) # Primary NCS Code
+    ncs_name = Column(String, nullable=True)
+    
+    group = relationship("JobGroup", back_populates="series")
+    positions = relationship("JobPosition", back_populates="series")
+    training_programs = relationship("TrainingProgram", back_populates="series")
 
 class JobPosition(Base):
-    """
-    AI-Constructed Job Position.
-    """
     __tablename__ = "job_positions"
+    __table_args__ = (
+        # Current position per user (services/current_position.py: newest start_date WHERE NOT is_future_model)
+        Index("ix_job_positions_user_current_start", "user_id", "is_future_model", "start_date", "id"),
+    )
     id = Column(String, primary_key=True, default=generate_uuid)
-    
-    # Core Identity
+    series_id = Column(String, ForeignKey("job_series.id"))
+    user_id = Column(String, ForeignKey("users.id"), nullable=True)
     title = Column(String, nullable=False)
+    grade = Column(Enum(JobGrade), nullable=True)
+    is_future_model = Column(Boolean, default=False)
+    start_date = Column(Date, nullable=True) # When the user took this position (picks the current one)
+
+    # AI-Native Job Architecture
     strategic_goal_link = Column(String, nullable=True) # ID or Text link to Strategy
-    
-    # NCS Alignment (Public Sector Requirement)
-    ncs_code_id = Column(String, ForeignKey("ncs_codes.id"), nullable=True)
-    
-    # AI Metadata
+    ncs_code_id = Column(String, ForeignKey("ncs_codes.id"), nullable=True) # NCS Alignment (Public Sector Requirement)
     creation_source = Column(Enum(AISource), default=AISource.AI_GENERATED)
     ai_confidence_score = Column(Float, default=0.0) # How confident is AI in this design?
-    
-    # 3-Tier Job Structure
     summary = Column(Text, nullable=True)
     grade_prediction = Column(Enum(JobGrade), nullable=True) # AI Predicted Grade
     
+    series = relationship("JobSeries", back_populates="positions")
+    user = relationship("User", back_populates="job_positions")
+    tasks = relationship("JobTask", back_populates="position")
+    evaluation = relationship("JobEvaluation", uselist=False, back_populates="position")
+    descriptions = relationship("JobDescription", back_populates="position")
+    history = relationship("JobHistory", back_populates="position")
     ncs_code = relationship("NCSCode")
-    tasks = relationship("JobTask", back_populates="job", cascade="all, delete-orphan")
     requirements = relationship("JobRequirement", back_populates="job", cascade="all, delete-orphan")
     audit_logs = relationship("FairnessAuditLog", back_populates="target_job")
 
-class JobTask(Base):
+class JobTask(HighVolumeKeyMixin, Base):
     __tablename__ = "job_tasks"
-    id = Column(String, primary_key=True, default=generate_uuid)
-    job_id = Column(String, ForeignKey("job_positions.id"))
+    job_position_id = Column(String, ForeignKey("job_positions.id"))
+    task_name = Column(String, nullable=False)
+    action_verb = Column(String, nullable=True)
+    task_object = Column(String, nullable=True)
     
-    name = Column(String, nullable=False)
+    # AI Impact Analysis
+    ai_substitution = Column(Float, default=0.0)
+    ai_augmentation = Column(Float, default=0.0)
+    ai_generation = Column(Float, default=0.0)
+
+    # AI Job Architect
     importance = Column(Integer, default=3)
     frequency = Column(String, default="Daily")
-    
-    # AI Logic
     is_essential = Column(Boolean, default=True) # Suggested by AI as essential
     
-    job = relationship("JobPosition", back_populates="tasks")
+    position = relationship("JobPosition", back_populates="tasks")
+    work_items = relationship("WorkItem", back_populates="task")
+    workload_entries = relationship("WorkloadEntry", back_populates="task")
+    next_tasks = relationship("TaskDependency", foreign_keys="[TaskDependency.source_task_id]", back_populates="source_task")
+    prev_tasks = relationship("TaskDependency", foreign_keys="[TaskDependency.target_task_id]", back_populates="target_task")
+
+    # AI Job Architect / job design names
+    job_id = synonym("job_position_id")
+    name = synonym("task_name")
+    job = synonym("position")
 
 class JobRequirement(Base):
     __tablename__ = "job_requirements"
@@ -113,10 +305,18 @@ class JobRequirement(Base):
     
     job = relationship("JobPosition", back_populates="requirements")
 
-# =========================================================
-# 3. AI Intelligence & Audit Logs
-# =========================================================
+# --- 2.9 Job Management Card (History) ---
+class JobHistory(Base):
+    __tablename__ = "job_histories"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    job_position_id = Column(String, ForeignKey("job_positions.id"))
+    change_date = Column(Date, default=func.now())
+    change_type = Column(String, nullable=False) # e.g., "GRADE_CHANGE", "TASK_UPDATE"
+    description = Column(String, nullable=True)
+    
+    position = relationship("JobPosition", back_populates="history")
 
+# --- AI Intelligence & Audit Logs ---
 class AIGenerationLog(Base):
     """
     Tracks WHY and HOW the AI generated this content.
@@ -150,18 +350,174 @@ class FairnessAuditLog(Base):
     
     target_job = relationship("JobPosition", back_populates="audit_logs")
 
-# =========================================================
-# 4. Job Evaluation System (Restored & AI-Enhanced)
-# =========================================================
+# --- 2.1 Workforce Planning & 2.5 Workload Survey ---
+class SurveyPeriod(Base):
+    __tablename__ = "survey_periods"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    institution_id = Column(String, ForeignKey("institutions.id"))
+    name = Column(String, nullable=False)
+    start_date = Column(DateTime, nullable=False)
+    end_date = Column(DateTime, nullable=False)
+    status = Column(Enum(SurveyStatus), default=SurveyStatus.DRAFT)
+    
+    entries = relationship("WorkloadEntry", back_populates="survey_period")
+
+class WorkItem(HighVolumeKeyMixin, Base):
+    __tablename__ = "work_items"
+    job_task_id = Column(String, ForeignKey("job_tasks.id"))
+    name = Column(String, nullable=False)
+    code = Column(String, nullable=True)
+    frequency = Column(Enum(TaskFrequency), nullable=True)
+    seasonal_details = Column(String, nullable=True)
+    estimated_hours_per_occurrence = Column(Float, default=0.0)
+    workload_amount = Column(Float, default=0.0)
+    
+    task = relationship("JobTask", back_populates="work_items")
+
+class WorkloadEntry(HighVolumeKeyMixin, Base):
+    __tablename__ = "workload_entries"
+    __table_args__ = (
+        # crud.validate_employee_annual_hours: user_id + survey_period_id
+        Index("ix_workload_entries_user_survey", "user_id", "survey_period_id"),
+        Index("ix_workload_entries_survey_period", "survey_period_id"),
+        Index("ix_workload_entries_task", "task_id"),
+    )
+    survey_period_id = Column(String, ForeignKey("survey_periods.id"), nullable=True)
+    user_id = Column(String, ForeignKey("users.id"))
+    task_id = Column(String, ForeignKey("job_tasks.id"))
+    
+    volume = Column(Float, default=0.0) # Frequency
+    standard_time = Column(Float, default=0.0) # Hours
+    fte = Column(Float, default=0.0) # Calculated
+    
+    survey_period = relationship("SurveyPeriod", back_populates="entries")
+    user = relationship("User", back_populates="workload_entries")
+    task = relationship("JobTask", back_populates="workload_entries")
+
+# --- 2.10 Headcount Management ---
+class HeadcountPlan(Base):
+    __tablename__ = "headcount_plans"
+    __table_args__ = (
+        # workforce.get_gap_analysis / save_headcount_plan: org_unit_id + year
+        Index("ix_headcount_plans_org_unit_year", "org_unit_id", "year"),
+        # analytics.get_headcount_fill_rate: institution_id + year
+        Index("ix_headcount_plans_institution_year", "institution_id", "year"),
+    )
+    id = Column(String, primary_key=True, default=generate_uuid)
+    institution_id = Column(String, ForeignKey("institutions.id"))
+    year = Column(Integer, nullable=False)
+    org_unit_id = Column(String, ForeignKey("org_units.id"), nullable=True)
+    
+    authorized_count = Column(Float, default=0.0) # 정원
+    current_count = Column(Float, default=0.0) # 현원
+    required_count = Column(Float, default=0.0) # 적정인력 (Calculated)
+    
+    institution = relationship("Institution", back_populates="headcount_plans")
+
+class WorkforceGapSummary(Base):
+    """
+    Materialized inputs of workforce.get_gap_analysis per (org unit, year).
+    Maintained by services/workforce_summary.py on every flush touching WorkloadEntry, User.org_unit_id or HeadcountPlan.
+    """
+    __tablename__ = "workforce_gap_summary"
+    org_unit_id = Column(String, ForeignKey("org_units.id"), primary_key=True) # PK (org_unit_id, year) serves per-unit refreshes
+    year = Column(Integer, primary_key=True)
+    current_count = Column(Integer, default=0) # 현원 (PO)
+    authorized_count = Column(Float, default=0.0) # 정원 (TO)
+    required_fte = Column(Float, default=0.0) # 적정인력 (FTE sum of the year's surveys)
 
+# --- External Benchmark ---
+class ExternalBenchmarkData(Base):
+    __tablename__ = "external_benchmark_data"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    institution_id = Column(String, ForeignKey("institutions.id"), nullable=True)
+    institution_type = Column(String, nullable=True) # e.g. "Public Corp"
+    headcount_range = Column(String, nullable=True) # e.g. "100-300"
+    budget_range = Column(String, nullable=True) # e.g. "100B-300B"
+    
+    avg_hcroi = Column(Float, default=0.0) # Human Capital ROI
+    avg_hcva = Column(Float, default=0.0) # Human Capital Value Added
+    
+    institution = relationship("Institution", back_populates="benchmark_data")
+
+class FinancialPerformance(Base):
+    __tablename__ = "financial_performance"
+    __table_args__ = (
+        # productivity.get_productivity_metrics / create_financial_performance: institution_id + year
+        Index("ix_financial_performance_institution_year", "institution_id", "year"),
+    )
+    id = Column(String, primary_key=True, default=generate_uuid)
+    institution_id = Column(String, ForeignKey("institutions.id"))
+    year = Column(Integer, nullable=False)
+
+    revenue = Column(Float, default=0.0) # 매출액
+    operating_expenses = Column(Float, default=0.0) # 영업비용 (인건비 제외)
+    personnel_costs = Column(Float, default=0.0) # 인건비
+    net_income = Column(Float, default=0.0) # revenue - (operating_expenses + personnel_costs)
+
+    institution = relationship("Institution")
+
+class TeamBudget(Base):
+    __tablename__ = "team_budgets"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    org_unit_id = Column(String, ForeignKey("org_units.id"))
+    year = Column(Integer, nullable=False)
+    amount = Column(Float, default=0.0)
+    
+    org_unit = relationship("OrgUnit", back_populates="team_budgets")
+
+# --- Workflow & Process ---
+class TaskDependency(Base):
+    __tablename__ = "task_dependencies"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    source_task_id = Column(String, ForeignKey("job_tasks.id"))
+    target_task_id = Column(String, ForeignKey("job_tasks.id"))
+    dependency_type = Column(Enum(DependencyType), default=DependencyType.SEQUENTIAL)
+    description = Column(String, nullable=True)
+    
+    source_task = relationship("JobTask", foreign_keys=[source_task_id], back_populates="next_tasks")
+    target_task = relationship("JobTask", foreign_keys=[target_task_id], back_populates="prev_tasks")
+
+# --- 2.8 Job Evaluation ---
 class EvaluationSession(Base):
     __tablename__ = "evaluation_sessions"
     id = Column(String, primary_key=True, default=generate_uuid)
+    institution_id = Column(String, ForeignKey("institutions.id"), nullable=True)
     name = Column(String, nullable=False) # e.g. "2025 Regular Evaluation"
     start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
     status = Column(String, default="DRAFT") # DRAFT, ACTIVE, CLOSED
     
     evaluations = relationship("JobEvaluation", back_populates="session")
+    criteria = relationship("EvaluationCriteria", back_populates="session")
+
+class EvaluationCriteria(Base):
+    """
+    Session-scoped factors rated in the committee matrix (keys of JobEvaluationScore.factor_scores)
+    """
+    __tablename__ = "evaluation_criteria"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    session_id = Column(String, ForeignKey("evaluation_sessions.id"), nullable=False, index=True)
+    name = Column(String, nullable=False)
+    category = Column(String, nullable=True)
+    weight = Column(Float, default=1.0)
+    description = Column(Text, nullable=True)
+
+    session = relationship("EvaluationSession", back_populates="criteria")
+
+class EvaluationAssignment(Base):
+    """
+    Which jobs a rater may score in a session (strict mode for matrix submission)
+    """
+    __tablename__ = "evaluation_assignments"
+    __table_args__ = (
+        # Matrix submission: the rater's assigned jobs among the submitted ones
+        Index("ix_evaluation_assignments_session_rater_job", "session_id", "rater_user_id", "target_job_position_id"),
+    )
+    id = Column(String, primary_key=True, default=generate_uuid)
+    session_id = Column(String, ForeignKey("evaluation_sessions.id"), nullable=False)
+    rater_user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    target_job_position_id = Column(String, ForeignKey("job_positions.id"), nullable=False)
 
 class JobEvaluationCriteria(Base):
     """
@@ -175,36 +531,173 @@ class JobEvaluationCriteria(Base):
     description = Column(Text, nullable=True)
 
 class JobEvaluation(Base):
-    """
-    The act of evaluating a Job.
-    """
     __tablename__ = "job_evaluations"
     id = Column(String, primary_key=True, default=generate_uuid)
-    job_id = Column(String, ForeignKey("job_positions.id"))
+    job_position_id = Column(String, ForeignKey("job_positions.id"))
     session_id = Column(String, ForeignKey("evaluation_sessions.id"), nullable=True)
-    
-    # Scores
+    score_expertise = Column(Float, default=0.0)
+    score_responsibility = Column(Float, default=0.0)
+    score_complexity = Column(Float, default=0.0)
     total_score = Column(Float, default=0.0)
-    final_grade = Column(Enum(JobGrade), nullable=True)
-    
+    grade = Column(Enum(JobGrade), nullable=True)
+
     # Hybrid Logic: AI Suggestion vs Human Decision
+    final_grade = Column(Enum(JobGrade), nullable=True)
     ai_suggested_grade = Column(Enum(JobGrade), nullable=True)
     evaluator_comment = Column(Text, nullable=True)
     
-    job = relationship("JobPosition")
+    position = relationship("JobPosition", back_populates="evaluation")
     session = relationship("EvaluationSession", back_populates="evaluations")
     scores = relationship("JobEvaluationScore", back_populates="evaluation")
 
-class JobEvaluationScore(Base):
-    """
-    Detailed granular scores per criteria.
-    """
+    job_id = synonym("job_position_id")
+    job = synonym("position")
+
+class JobEvaluationScore(HighVolumeKeyMixin, Base):
     __tablename__ = "job_evaluation_scores"
-    id = Column(String, primary_key=True, default=generate_uuid)
+    __table_args__ = (
+        # Matrix submission: one score per (evaluation, rater_type, rater)
+        Index("ix_job_evaluation_scores_eval_rater", "evaluation_id", "rater_type", "rater_user_id"),
+    )
     evaluation_id = Column(String, ForeignKey("job_evaluations.id"))
-    criteria_id = Column(String, ForeignKey("job_evaluation_criteria.id"))
+    rater_type = Column(Enum(RaterType), nullable=True) # Null for per-criteria scores
+    rater_user_id = Column(String, ForeignKey("users.id"), nullable=True) # Null for external
+    criteria_id = Column(String, ForeignKey("job_evaluation_criteria.id"), nullable=True)
+    score = Column(Float, default=0.0) # Per-criteria score
+    factor_scores = Column(JSON, nullable=True) # Matrix rating: {criteria name: score}
     
-    score = Column(Float, default=0.0) # The actual score given
+    score_expertise = Column(Float, default=0.0)
+    score_responsibility = Column(Float, default=0.0)
+    score_complexity = Column(Float, default=0.0)
+    raw_total = Column(Float, default=0.0)
+    
+    # Bias Prevention
+    z_score = Column(Float, default=0.0) # Statistical Normalization
+    final_score = Column(Float, default=0.0) # After weighting
     
     evaluation = relationship("JobEvaluation", back_populates="scores")
     criteria = relationship("JobEvaluationCriteria")
+
+# --- 2.3 Job Description ---
+class JobDescription(Base):
+    __tablename__ = "job_descriptions"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    job_position_id = Column(String, ForeignKey("job_positions.id"))
+    summary = Column(Text, nullable=True)
+    qualification_requirements = Column(Text, nullable=True)
+    kpi_indicators = Column(Text, nullable=True)
+    version = Column(Integer, default=1)
+    
+    position = relationship("JobPosition", back_populates="descriptions")
+
+# --- 2.6 Performance Evaluation ---
+class PerformanceReview(HighVolumeKeyMixin, Base):
+    __tablename__ = "performance_reviews"
+    __table_args__ = (
+        # NineBoxService: latest FINAL review per user (year DESC served from the index)
+        Index("ix_performance_reviews_user_status_year", "user_id", "status", "year"),
+    )
+    user_id = Column(String, ForeignKey("users.id"))
+    year = Column(Integer, nullable=False)
+    status = Column(Enum(ReviewStatus), default=ReviewStatus.DRAFT)
+    review_date = Column(Date, nullable=True)
+    
+    score_common = Column(Float, default=0.0) # Common Competency
+    score_leadership = Column(Float, default=0.0) # Leadership
+    score_job = Column(Float, default=0.0) # Job Performance (Calculated from Goals)
+    total_score = Column(Float, default=0.0)
+    grade = Column(String, nullable=True) # S, A, B, C, D
+
+    # Talent Management (9-Box)
+    score_potential = Column(Float, default=0.0)
+    nine_box_position = Column(Integer, nullable=True) # 1-9, set by auto-map or calibration
+    
+    user = relationship("User", back_populates="reviews")
+    goals = relationship("PerformanceGoal", back_populates="review")
+
+class CurrentReview(Base):
+    """
+    Projection: each user's current reviews (newest year first, id as tie-breaker).
+    Maintained by services/current_review.py on every flush touching PerformanceReview.
+    """
+    __tablename__ = "current_reviews"
+    user_id = Column(String, ForeignKey("users.id"), primary_key=True)
+    review_id = Column(String, ForeignKey("performance_reviews.id"), nullable=False) # Latest review of any status
+    final_review_id = Column(String, ForeignKey("performance_reviews.id"), nullable=True) # Latest FINAL review (9-Box)
+
+class PerformanceGoal(Base):
+    __tablename__ = "performance_goals"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    review_id = Column(String, ForeignKey("performance_reviews.id"))
+    category = Column(String, nullable=False) # e.g. "MBO", "BSC_FINANCIAL"
+    goal_text = Column(Text, nullable=False)
+    weight = Column(Float, default=0.0) # Percentage (0-100)
+    target = Column(Text, nullable=True)
+    actual = Column(Text, nullable=True)
+    
+    self_score = Column(Float, default=0.0)
+    supervisor_score = Column(Float, default=0.0)
+    final_score = Column(Float, default=0.0)
+    
+    review = relationship("PerformanceReview", back_populates="goals")
+
+# --- 2.4 Promotion System ---
+class PromotionList(Base):
+    __tablename__ = "promotion_lists"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    user_id = Column(String, ForeignKey("users.id"))
+    target_grade = Column(Enum(JobGrade), nullable=False)
+    rank = Column(Integer, nullable=False)
+    total_points = Column(Float, default=0.0)
+    
+    # Detailed Scoring
+    score_performance = Column(Float, default=0.0)
+    score_experience = Column(Float, default=0.0)
+    score_language = Column(Float, default=0.0)
+    score_training = Column(Float, default=0.0)
+    
+    user = relationship("User", back_populates="promotion_entries")
+
+class TrainingProgram(Base):
+    __tablename__ = "training_programs"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    name = Column(String, nullable=False)
+    description = Column(Text, nullable=True)
+    duration_hours = Column(Float, default=0.0)
+    target_job_series_id = Column(String, ForeignKey("job_series.id"), nullable=True)
+    required_competency = Column(String, nullable=True)
+    
+    series = relationship("JobSeries", back_populates="training_programs")
+    attendees = relationship("EmployeeTraining", back_populates="program")
+
+class EmployeeTraining(Base):
+    __tablename__ = "employee_trainings"
+    id = Column(String, primary_key=True, default=generate_uuid)
+    user_id = Column(String, ForeignKey("users.id"))
+    program_id = Column(String, ForeignKey("training_programs.id"))
+    status = Column(Enum(TrainingStatus), default=TrainingStatus.PLANNED)
+    completion_date = Column(Date, nullable=True)
+    score = Column(Float, nullable=True)
+    
+    user = relationship("User", back_populates="trainings")
+    program = relationship("TrainingProgram", back_populates="attendees")
+
+# --- Employee Experience (Pulse) ---
+class PulseCheck(Base):
+    __tablename__ = "pulse_checks"
+    __table_args__ = (
+        # Dashboard: today's mood per user / ml_service: latest pulses per user
+        Index("ix_pulse_checks_user_date", "user_id", "date"),
+    )
+    id = Column(String, primary_key=True, default=generate_uuid)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    date = Column(Date, nullable=False, default=datetime.date.today)
+    mood_score = Column(Integer, nullable=False) # 1-5
+    workload_level = Column(Enum(PulseWorkloadLevel), nullable=True)
+    note = Column(Text, nullable=True)
+
+# Projection maintenance
+# 프로젝션 테이블(current_reviews, reporting_closure, workforce_gap_summary)은 Session flush 리스너로 유지된다.
+# 리스너가 라우터/서비스의 import 에 따라 등록되면 그 모듈을 거치지 않는 쓰기(예: performance 라우터)가 프로젝션을 놓치므로,
+# 모델을 쓰는 모든 코드가 거치는 여기서 한 번에 등록한다.
+from .services import current_review, reporting_closure, workforce_summary  # noqa: E402,F401
@@ -0,0 +1,49 @@
+import base64
+import json
+from typing import Generic, List, Optional, Sequence, TypeVar
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+
+# Keyset (cursor) pagination
+# OFFSET 은 앞쪽 행을 모두 읽고 버리므로 페이지가 깊어질수록 느려진다.
+# 커서는 마지막 행의 정렬 키를 담고 있어 인덱스에서 바로 다음 위치를 찾는다 (페이지 깊이와 무관).
+T = TypeVar("T")
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+def encode_cursor(values: Sequence) -> str:
+    raw = json.dumps(list(values), separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(token: str, size: int) -> list:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def keyset_page(query, sort_columns: Sequence, cursor: Optional[str], limit: int):
+    """
+    Returns (rows, next_cursor) for a query ordered by `sort_columns` (ascending, unique together).
+    An empty cursor means the first page; next_cursor is None on the last page.
+    """
+    limit = max(1, min(limit, 1000))
+    if cursor:
+        values = decode_cursor(cursor, len(sort_columns))
+        if len(sort_columns) == 1:
+            query = query.filter(sort_columns[0] > values[0])
+        else:
+            query = query.filter(tuple_(*sort_columns) > tuple_(*values))
+    # limit + 1 행을 읽어 다음 페이지 존재 여부를 COUNT 없이 판단
+    rows = query.order_by(*sort_columns).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, col.key) for col in sort_columns])
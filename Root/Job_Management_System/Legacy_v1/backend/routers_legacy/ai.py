@@ -1,27 +1,34 @@
+import os
+from contextlib import asynccontextmanager
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import event, func, inspect
 from typing import List, Optional
 from pydantic import BaseModel
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from ..models import JobTask, JobPosition, JobDescription, User
-from ..services.search_engine import TFIDFEngine
+from ..services.search_engine import HANGUL_BIGRAM, TFIDFEngine
+from ..services import search_index_store, search_sync
 from ..services.jd_generator import TemplateJDGenerator
 from ..services.gap_analysis import SmartWorkloadAnalyzer
 
-router = APIRouter(
-    prefix="/ai",
-    tags=["AI Intelligence"],
-    dependencies=[Depends(require_roles('ADMIN'))]
-)
-
-# Global Engine Instance
-search_engine = TFIDFEngine()
+# Global Engine Instance (most task / NCS / JD text is Korean: index Hangul bigrams too)
+SEARCH_TOKENIZER = HANGUL_BIGRAM
+search_engine = TFIDFEngine(tokenizer=SEARCH_TOKENIZER)
 jd_generator = TemplateJDGenerator()
 gap_analyzer = SmartWorkloadAnalyzer()
 is_indexed = False
+INDEXED_MODELS = (JobTask, JobPosition, JobDescription)
+
+# Shared on-disk index (services.search_index_store): workers mmap the published file instead of each
+# building its own engine. The file is published at startup when missing, and rebuilt from the database
+# SEARCH_REPUBLISH_DELAY seconds after a commit touches indexed rows (edits from all workers are folded in).
+SEARCH_INDEX_PATH = os.getenv("SEARCH_INDEX_PATH") or None
+SEARCH_REPUBLISH_DELAY = float(os.getenv("SEARCH_REPUBLISH_DELAY", "2.0"))
+shared_index = search_index_store.SharedIndex(SEARCH_INDEX_PATH) if SEARCH_INDEX_PATH else None
 
 class SearchResult(BaseModel):
     id: str
@@ -30,33 +37,153 @@ class SearchResult(BaseModel):
     description: str
     score: float
 
+def _search_document(obj):
+    """(doc_id, text) under which a task / position / JD is indexed, or None for a JD without a position."""
+    if isinstance(obj, JobTask):
+        # Combo text: Name + Verb
+        return f"task:{obj.id}", f"{obj.task_name} {obj.action_verb}"
+    if isinstance(obj, JobPosition):
+        # Positions (Titles)
+        return f"position:{obj.id}", obj.title or ""
+    # Rich text: Summary + Qualifications + KPIs
+    if obj.job_position_id is None:
+        return None
+    text = " ".join(part for part in (obj.summary, obj.qualification_requirements, obj.kpi_indicators) if part)
+    return f"jd:{obj.job_position_id}", text
+
+def index_documents(engine: TFIDFEngine, db: Session):
+    for model in INDEXED_MODELS:
+        for obj in db.query(model).all():
+            document = _search_document(obj)
+            if document is not None:
+                engine.add_document(*document)
+    engine.build_index()
+
 def ensure_index(db: Session):
     global is_indexed
     if is_indexed:
         return
-        
-    # Index Job Tasks
-    tasks = db.query(JobTask).all()
-    for t in tasks:
-        # Combo text: Name + Verb
-        text = f"{t.task_name} {t.action_verb}"
-        search_engine.add_document(f"task:{t.id}", text)
-        
-    # Index Positions (Titles)
-    positions = db.query(JobPosition).all()
-    for p in positions:
-        search_engine.add_document(f"position:{p.id}", p.title)
-
-    # Index Job Descriptions
-    jds = db.query(JobDescription).all()
-    for jd in jds:
-        # Rich text: Overview + Responsibilities + Qualifications
-        text = f"{jd.overview} {jd.responsibilities} {jd.qualifications}"
-        search_engine.add_document(f"jd:{jd.job_position_id}", text)
-        
-    search_engine.build_index()
+    index_documents(search_engine, db)
     is_indexed = True
 
+def publish_search_index(only_if_missing: bool = False, path: Optional[str] = None) -> int:
+    """
+    Builds the index from the database and publishes it to path (SEARCH_INDEX_PATH); returns the version.
+    only_if_missing: keep a readable published index (startup of the 2nd..Nth worker).
+    """
+    path = path or SEARCH_INDEX_PATH
+    with search_index_store.publish_lock(path):
+        version = search_index_store.read_version(path)
+        if only_if_missing and version:
+            return version
+        engine = TFIDFEngine(tokenizer=SEARCH_TOKENIZER)
+        db = SessionLocal()
+        try:
+            index_documents(engine, db)
+        finally:
+            db.close()
+        version = search_index_store.publish(engine, path)
+    if shared_index is not None:
+        shared_index.refresh()
+    return version
+
+search_republisher = search_index_store.Debounced(publish_search_index, SEARCH_REPUBLISH_DELAY)
+
+@asynccontextmanager
+async def search_index_lifespan(app):
+    # 공유 인덱스 모드: 첫 요청이 아니라 기동 시에 게시해 둔다 (이미 있으면 그대로 사용)
+    if shared_index is not None:
+        await run_in_threadpool(publish_search_index, True)
+    yield
+    # 종료 전에 대기 중인 재게시를 마친다 (마지막 편집이 파일에 남도록)
+    await run_in_threadpool(search_republisher.flush)
+
+router = APIRouter(
+    prefix="/ai",
+    tags=["AI Intelligence"],
+    dependencies=[Depends(require_roles('ADMIN'))],
+    lifespan=search_index_lifespan,
+)
+
+def get_search_index(db: Session):
+    """The published shared index when configured, else the in-process engine (built on first use)."""
+    if shared_index is not None:
+        index = shared_index.current()
+        if index is None:
+            # Published file missing or unreadable (e.g. removed after startup): publish it again
+            publish_search_index(only_if_missing=True)
+            index = shared_index.refresh()
+        if index is not None:
+            return index
+    ensure_index(db)
+    return search_engine
+
+# --- Incremental index maintenance ---
+# 인덱스가 만들어진 뒤에는 전체 재구축 없이 커밋된 변경만 반영한다.
+# flush 시점에 (doc_id -> 텍스트, 삭제는 None) 를 모아 두었다가 커밋 후에 엔진에 적용하고, 롤백이면 버린다.
+# 공유 인덱스 모드에서는 커밋 후 재게시를 예약한다 (워커들이 읽는 것은 게시된 파일이므로).
+
+def _tracking() -> bool:
+    return is_indexed or shared_index is not None
+
+@event.listens_for(Session, "after_flush")
+def _collect_search_changes(session, flush_context):
+    if not _tracking():
+        return
+    changes = None
+    for objects, deleted in ((list(session.new) + list(session.dirty), False), (session.deleted, True)):
+        for obj in objects:
+            if not isinstance(obj, INDEXED_MODELS):
+                continue
+            if changes is None:
+                changes = session.info.setdefault("search_changes", {})
+            document = _search_document(obj)
+            if document is not None:
+                doc_id, text = document
+                changes[doc_id] = None if deleted else text
+            if isinstance(obj, JobDescription):
+                # JD moved to another position: the old key goes away
+                for old_position_id in inspect(obj).attrs.job_position_id.history.deleted:
+                    changes.setdefault(f"jd:{old_position_id}", None)
+
+@event.listens_for(Session, "before_commit")
+def _collect_core_search_changes(session):
+    """Rows written with Core insert()/update() (search_sync.mark_search_changed): read them back before the commit."""
+    refresh = session.info.pop(search_sync.SEARCH_REFRESH_KEY, None)
+    if not refresh or not _tracking():
+        return
+    if not is_indexed:
+        # 공유 인덱스만 쓰는 워커: 재게시가 DB 에서 다시 읽으므로 텍스트는 필요 없다
+        session.info["search_republish"] = True
+        return
+    changes = session.info.setdefault("search_changes", {})
+    for model, ids in refresh.items():
+        ids = list(ids)
+        for start in range(0, len(ids), 500):  # IN (...) 목록 크기 제한
+            for obj in session.query(model).filter(model.id.in_(ids[start:start + 500])):
+                document = _search_document(obj)
+                if document is not None:
+                    changes[document[0]] = document[1]
+
+@event.listens_for(Session, "after_commit")
+def _apply_search_changes(session):
+    changes = session.info.pop("search_changes", None)
+    republish = session.info.pop("search_republish", False) or bool(changes)
+    if republish and shared_index is not None:
+        search_republisher.schedule()
+    if not changes or not is_indexed:
+        return
+    for doc_id, text in changes.items():
+        if text is None:
+            search_engine.remove_document(doc_id)
+        else:
+            search_engine.update_document(doc_id, text)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_search_changes(session, previous_transaction):
+    session.info.pop("search_changes", None)
+    session.info.pop("search_republish", None)
+
 @router.get("/search", response_model=List[SearchResult])
 def semantic_search(
     query: str, 
@@ -66,10 +193,8 @@ def semantic_search(
     if not query:
         return []
         
-    ensure_index(db)
-    
     # Get raw results from engine (IDs)
-    raw_results = search_engine.search(query, top_k=20)
+    raw_results = get_search_index(db).search(query, top_k=20)
     
     results = []
     
@@ -112,7 +237,7 @@ def semantic_search(
                         id=obj.id, 
                         type="Job Description", 
                         title=f"JD: {obj.title}", 
-                        description=jd_obj.overview[:100] + "...", 
+                        description=(jd_obj.summary or "")[:100] + "...", 
                         score=score
                     )
 
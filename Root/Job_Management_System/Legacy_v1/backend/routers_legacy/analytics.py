@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, select
+from typing import List, Dict, Any, Optional
 
 from .. import models, schemas
-from ..database import get_db
+from ..sharding import get_tenant_read_db
+from ..services.current_position import current_positions
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
 
@@ -13,68 +14,103 @@ router = APIRouter(
 )
 
 @router.get("/analytics/headcount-fill-rate")
-def get_headcount_fill_rate(institution_id: str, year: int, db: Session = Depends(get_db)):
+def get_headcount_fill_rate(
+    institution_id: str,
+    year: Optional[int] = None,
+    years: Optional[List[int]] = Query(None, description="Several years for a trend, e.g. ?years=2023&years=2024"),
+    db: Session = Depends(get_tenant_read_db)
+):
     """
     Returns Plan vs Actual for each Org Unit.
+    `year` keeps the original flat list; `years` returns a per-org-unit trend (plus institution totals) from the same query.
     """
-    # 1. Get Headcount Plans
-    plans = db.query(models.HeadcountPlan).filter(
-        models.HeadcountPlan.institution_id == institution_id,
-        models.HeadcountPlan.year == year
+    if years is None and year is None:
+        raise HTTPException(status_code=422, detail="Either year or years is required")
+    selected_years = sorted(set(years or [year]))
+
+    # 현원: 조직별 인원수를 한 번에 집계 (계획이 있는 조직만)
+    planned_units = select(models.HeadcountPlan.org_unit_id).where(models.HeadcountPlan.institution_id == institution_id)
+    actual = select(models.User.org_unit_id, func.count(models.User.id).label("actual"))\
+        .where(models.User.org_unit_id.in_(planned_units))\
+        .group_by(models.User.org_unit_id).subquery("actual")
+
+    rows = db.execute(
+        select(
+            models.HeadcountPlan.org_unit_id,
+            models.HeadcountPlan.year,
+            models.HeadcountPlan.authorized_count,
+            models.OrgUnit.name.label("org_name"),
+            func.coalesce(actual.c.actual, 0).label("actual"),
+        )
+        .outerjoin(models.OrgUnit, models.OrgUnit.id == models.HeadcountPlan.org_unit_id)
+        .outerjoin(actual, actual.c.org_unit_id == models.HeadcountPlan.org_unit_id)
+        .where(models.HeadcountPlan.institution_id == institution_id, models.HeadcountPlan.year.in_(selected_years))
+        .order_by(models.HeadcountPlan.year)
     ).all()
-    
-    result = []
-    for plan in plans:
-        # 2. Count Actual Users in this Org Unit
-        actual_count = db.query(func.count(models.User.id)).filter(
-            models.User.org_unit_id == plan.org_unit_id
-        ).scalar()
-        
-        # Get Org Name
-        org = db.query(models.OrgUnit).filter(models.OrgUnit.id == plan.org_unit_id).first()
-        org_name = org.name if org else "Unknown"
-        
-        fill_rate = (actual_count / plan.authorized_count * 100) if plan.authorized_count > 0 else 0
-        
-        result.append({
-            "org_unit": org_name,
-            "authorized": plan.authorized_count,
-            "actual": actual_count,
-            "fill_rate": round(fill_rate, 1)
+
+    def fill_rate(authorized, actual_count):
+        return round((actual_count / authorized * 100) if authorized and authorized > 0 else 0, 1)
+
+    if years is None:
+        return [
+            {
+                "org_unit": row.org_name or "Unknown",
+                "authorized": row.authorized_count,
+                "actual": row.actual,
+                "fill_rate": fill_rate(row.authorized_count, row.actual)
+            }
+            for row in rows
+        ]
+
+    units: Dict[Any, Dict[str, Any]] = {}
+    totals = {y: {"year": y, "authorized": 0.0, "actual": 0} for y in selected_years}
+    for row in rows:
+        unit = units.setdefault(row.org_unit_id, {"org_unit_id": row.org_unit_id, "org_unit": row.org_name or "Unknown", "series": []})
+        unit["series"].append({
+            "year": row.year,
+            "authorized": row.authorized_count,
+            "actual": row.actual,
+            "fill_rate": fill_rate(row.authorized_count, row.actual)
         })
-        
-    return result
+        totals[row.year]["authorized"] += row.authorized_count or 0.0
+        totals[row.year]["actual"] += row.actual
+    for total in totals.values():
+        total["fill_rate"] = fill_rate(total["authorized"], total["actual"])
+
+    return {"years": selected_years, "org_units": list(units.values()), "totals": list(totals.values())}
 
 @router.get("/analytics/span-of-control")
-def get_span_of_control(institution_id: str, db: Session = Depends(get_db)):
+def get_span_of_control(institution_id: str, db: Session = Depends(get_tenant_read_db)):
     """
     Returns Average Span of Control by Job Grade or Position.
+    One grouped query: direct-report counts per manager joined with the manager and their current job position.
     """
-    # 1. Get all users with reports_to_id
-    # We want to count direct reports for each manager
-    
-    # Subquery: Count reports per manager
-    manager_counts = db.query(
-        models.User.reports_to_id, 
-        func.count(models.User.id).label('span')
-    ).filter(
+    Manager = aliased(models.User)
+    manager_counts = select(
+        models.User.reports_to_id.label("manager_id"),
+        func.count(models.User.id).label("span")
+    ).where(
+        models.User.institution_id == institution_id,
         models.User.reports_to_id != None
-    ).group_by(models.User.reports_to_id).all()
-    
-    data = []
-    for mgr_id, span in manager_counts:
-        manager = db.query(models.User).filter(models.User.id == mgr_id).first()
-        if manager:
-            # Get Job Position Grade
-            job = db.query(models.JobPosition).filter(models.JobPosition.user_id == manager.id).first()
-            grade = job.grade if job else "N/A"
-            title = job.title if job else "Unknown"
-            
-            data.append({
-                "manager_name": manager.name,
-                "job_title": title,
-                "grade": grade,
-                "span": span
-            })
-            
-    return data
+    ).group_by(models.User.reports_to_id).subquery("manager_counts")
+
+    # 관리자당 현재 직위 하나 (services/current_position.py 규칙)
+    first_position = current_positions(name="first_position")
+
+    rows = db.execute(
+        select(Manager.name, models.JobPosition.title, models.JobPosition.grade, manager_counts.c.span)
+        .select_from(manager_counts)
+        .join(Manager, Manager.id == manager_counts.c.manager_id)
+        .outerjoin(first_position, first_position.c.user_id == Manager.id)
+        .outerjoin(models.JobPosition, models.JobPosition.id == first_position.c.position_id)
+    ).all()
+
+    return [
+        {
+            "manager_name": row.name,
+            "job_title": row.title or "Unknown",
+            "grade": row.grade or "N/A",
+            "span": row.span
+        }
+        for row in rows
+    ]
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import select
+from typing import List, Optional
 from .. import models, schemas
-from ..database import get_db
+from ..sharding import get_tenant_read_db
+from ..services.current_position import current_positions
 
 router = APIRouter(
     prefix="/career",
@@ -12,50 +14,56 @@ router = APIRouter(
 
 # --- Promotion Management ---
 @router.get("/promotion-candidates")
-def get_promotion_candidates(db: Session = Depends(get_db)):
+def get_promotion_candidates(
+    performance_grades: List[str] = Query(["S", "A"]),
+    position_grades: Optional[List[models.JobGrade]] = Query(None),
+    series_id: Optional[str] = None,
+    institution_id: Optional[str] = None,
+    db: Session = Depends(get_tenant_read_db)
+):
     """
     Identifies candidates eligible for promotion.
     Logic (MVP):
-    - Current Performance Grade is 'S' or 'A'.
-    - Position Grade is not the highest (e.g., G5).
+    - Current Performance Grade is 'S' or 'A' (`performance_grades`).
+    - Position Grade is not the highest (e.g., G5); narrow with `position_grades` / `series_id`.
+    One query: latest review from the current_reviews projection + current position per user.
     """
-    candidates = []
-    users = db.query(models.User).all()
+    PR = models.PerformanceReview
+    Position = models.JobPosition
+    current_position = current_positions()
 
-    for user in users:
-        # Get active position
-        current_pos = None
-        for pos in user.job_positions:
-            if not pos.is_future_model:
-                current_pos = pos
-                break
-        
-        if not current_pos:
-            continue
-            
-        # Get latest review
-        latest_review = db.query(models.PerformanceReview)\
-            .filter(models.PerformanceReview.user_id == user.id)\
-            .order_by(models.PerformanceReview.year.desc())\
-            .first()
-            
-        if latest_review and latest_review.grade in ['S', 'A']:
-            # Simplistic promotion logic
-            candidates.append({
-                "user_id": user.id,
-                "name": user.name,
-                "current_title": current_pos.title,
-                "current_grade": current_pos.grade,
-                "performance_grade": latest_review.grade,
-                "performance_year": latest_review.year,
-                "recommended_action": "Promote to Next Grade"
-            })
-            
-    return candidates
+    query = select(
+        models.User.id, models.User.name, Position.title, Position.grade.label("position_grade"),
+        PR.grade.label("performance_grade"), PR.year,
+    ).select_from(models.CurrentReview)\
+        .join(PR, PR.id == models.CurrentReview.review_id)\
+        .join(models.User, models.User.id == models.CurrentReview.user_id)\
+        .join(current_position, current_position.c.user_id == models.User.id)\
+        .join(Position, Position.id == current_position.c.position_id)\
+        .where(PR.grade.in_(performance_grades))
+    if position_grades:
+        query = query.where(Position.grade.in_(position_grades))
+    if series_id:
+        query = query.where(Position.series_id == series_id)
+    if institution_id:
+        query = query.where(models.User.institution_id == institution_id)
+
+    return [
+        {
+            "user_id": row.id,
+            "name": row.name,
+            "current_title": row.title,
+            "current_grade": row.position_grade,
+            "performance_grade": row.performance_grade,
+            "performance_year": row.year,
+            "recommended_action": "Promote to Next Grade"
+        }
+        for row in db.execute(query)
+    ]
 
 # --- Training Recommendations ---
 @router.get("/training-recommendations/{user_id}")
-def get_training_recommendations(user_id: str, db: Session = Depends(get_db)):
+def get_training_recommendations(user_id: str, db: Session = Depends(get_tenant_read_db)):
     """
     Suggests training programs based on Job Series.
     """
@@ -92,7 +100,7 @@ def get_training_recommendations(user_id: str, db: Session = Depends(get_db)):
 
 # --- Competency Modeling ---
 @router.get("/competency-model/{series_id}")
-def get_competency_model(series_id: str, db: Session = Depends(get_db)):
+def get_competency_model(series_id: str, db: Session = Depends(get_tenant_read_db)):
     """
     Returns the Competency Model (KSA) for a job series.
     """
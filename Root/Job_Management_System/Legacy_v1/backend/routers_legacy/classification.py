@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
 from .. import models, schemas
-from ..database import get_db
+from ..sharding import get_tenant_db, get_tenant_read_db, institution_from_request, shard_router
+from ..services.classification_service import ClassificationService, classification_cache
 # RBAC dependencies
 from ..dependencies import require_roles
 
@@ -13,10 +14,20 @@ router = APIRouter(
     dependencies=[Depends(require_roles('ADMIN'))]
 )
 
+def _cached_view(request: Request, view: str, build):
+    """Serves a cached classification view; 304 when the client's ETag is still current."""
+    # 샤딩이 꺼져 있으면 모든 기관이 같은 분류 체계를 보므로 캐시 키도 하나
+    scope = institution_from_request(request) if shard_router.enabled else None
+    etag, body = classification_cache.get_or_build(scope, view, build)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 # --- Tree View (File System Style) ---
 
 @router.get("/hierarchy", response_model=List[Dict[str, Any]])
-def get_job_hierarchy(db: Session = Depends(get_db)):
+def get_job_hierarchy(request: Request, db: Session = Depends(get_tenant_read_db)):
     """
     Returns the full job classification hierarchy as a nested tree.
     Level 1: JobGroup
@@ -24,101 +35,19 @@ def get_job_hierarchy(db: Session = Depends(get_db)):
     Level 3: JobPosition
     Level 4: JobTask
     Level 5: WorkItem
+    Built from one flat query and cached until the next classification write (ETag / If-None-Match).
     """
-    hierarchy = []
-    groups = db.query(models.JobGroup).all()
-    
-    for group in groups:
-        group_node = {
-            "id": group.id,
-            "name": group.name,
-            "type": "GROUP",
-            "children": []
-        }
-        
-        for series in group.series:
-            series_node = {
-                "id": series.id,
-                "name": series.name,
-                "type": "SERIES",
-                "ncs_code": series.ncs_code,
-                "children": []
-            }
-            
-            for position in series.positions:
-                position_node = {
-                    "id": position.id,
-                    "name": position.title,
-                    "type": "POSITION",
-                    "grade": position.grade,
-                    "children": []
-                }
-                
-                for task in position.tasks:
-                    task_node = {
-                        "id": task.id,
-                        "name": task.task_name,
-                        "type": "TASK",
-                        "children": []
-                    }
-                    
-                    for item in task.work_items:
-                        item_node = {
-                            "id": item.id,
-                            "name": item.name,
-                            "type": "WORK_ITEM",
-                            "frequency": item.frequency
-                        }
-                        task_node["children"].append(item_node)
-                        
-                    position_node["children"].append(task_node)
-                
-                series_node["children"].append(position_node)
-            
-            group_node["children"].append(series_node)
-        
-        hierarchy.append(group_node)
-        
-    return hierarchy
+    return _cached_view(request, "hierarchy", ClassificationService(db).get_hierarchy)
 
 # --- Matrix View (Excel Style) ---
 
 @router.get("/matrix", response_model=List[Dict[str, Any]])
-def get_job_matrix(db: Session = Depends(get_db)):
+def get_job_matrix(request: Request, db: Session = Depends(get_tenant_read_db)):
     """
     Returns the job classification hierarchy as a flat matrix (list of rows).
     Suitable for Excel export or grid view.
     """
-    matrix = []
-    groups = db.query(models.JobGroup).all()
-    
-    for group in groups:
-        for series in group.series:
-            for position in series.positions:
-                for task in position.tasks:
-                    if not task.work_items:
-                        # Row for task without work items
-                        matrix.append({
-                            "group_name": group.name,
-                            "series_name": series.name,
-                            "position_title": position.title,
-                            "position_grade": position.grade,
-                            "task_name": task.task_name,
-                            "work_item_name": None,
-                            "frequency": None
-                        })
-                    else:
-                        for item in task.work_items:
-                            matrix.append({
-                                "group_name": group.name,
-                                "series_name": series.name,
-                                "position_title": position.title,
-                                "position_grade": position.grade,
-                                "task_name": task.task_name,
-                                "work_item_name": item.name,
-                                "frequency": item.frequency
-                            })
-    return matrix
+    return _cached_view(request, "matrix", ClassificationService(db).get_matrix)
 
 class JobMatrixItem(schemas.BaseModel):
     group_name: str
@@ -131,67 +60,12 @@ class JobMatrixItem(schemas.BaseModel):
     workload: Optional[float] = 0.0
 
 @router.post("/matrix")
-def save_job_matrix(items: List[JobMatrixItem], db: Session = Depends(get_db)):
+def save_job_matrix(items: List[JobMatrixItem], db: Session = Depends(get_tenant_db)):
     """
     Saves the job classification matrix.
-    This is a simplified implementation that assumes full replacement or updates based on names.
-    For a robust implementation, IDs should be used.
-    Here we will iterate and create/update based on hierarchy names.
+    Rows are matched by names along the hierarchy (group > series > position > task > work item):
+    missing nodes are created, position grades and work item frequency / workload are updated.
+    Runs a fixed number of queries per level regardless of the row count (bulk upsert in one transaction).
     """
-    # 1. Clear existing structure (Optional: Strategy depends on requirements. 
-    #    For now, we will try to update/create without deleting everything to preserve IDs if possible,
-    #    but given the flat input, it's hard to map back to IDs without them.
-    #    Let's assume we are building from scratch or updating based on names.)
-    
-    import uuid
-    
-    for item in items:
-        # 1. Job Group
-        group = db.query(models.JobGroup).filter(models.JobGroup.name == item.group_name).first()
-        if not group:
-            group = models.JobGroup(id=str(uuid.uuid4()), name=item.group_name)
-            db.add(group)
-            db.flush()
-            
-        # 2. Job Series
-        series = db.query(models.JobSeries).filter(models.JobSeries.name == item.series_name, models.JobSeries.group_id == group.id).first()
-        if not series:
-            series = models.JobSeries(id=str(uuid.uuid4()), group_id=group.id, name=item.series_name)
-            db.add(series)
-            db.flush()
-            
-        # 3. Job Position
-        position = db.query(models.JobPosition).filter(models.JobPosition.title == item.position_title, models.JobPosition.series_id == series.id).first()
-        if not position:
-            position = models.JobPosition(id=str(uuid.uuid4()), series_id=series.id, title=item.position_title, grade=item.position_grade)
-            db.add(position)
-            db.flush()
-        else:
-            if item.position_grade:
-                position.grade = item.position_grade
-                
-        # 4. Job Task
-        task = db.query(models.JobTask).filter(models.JobTask.task_name == item.task_name, models.JobTask.job_position_id == position.id).first()
-        if not task:
-            task = models.JobTask(id=str(uuid.uuid4()), job_position_id=position.id, task_name=item.task_name)
-            db.add(task)
-            db.flush()
-            
-        # 5. Work Item
-        if item.work_item_name:
-            work_item = db.query(models.WorkItem).filter(models.WorkItem.name == item.work_item_name, models.WorkItem.job_task_id == task.id).first()
-            if not work_item:
-                work_item = models.WorkItem(
-                    id=str(uuid.uuid4()), 
-                    job_task_id=task.id, 
-                    name=item.work_item_name,
-                    frequency=item.frequency,
-                    estimated_hours_per_occurrence=item.workload # Assuming workload is hours per occurrence for now
-                )
-                db.add(work_item)
-            else:
-                work_item.frequency = item.frequency
-                work_item.estimated_hours_per_occurrence = item.workload
-                
-    db.commit()
-    return {"message": "Matrix saved successfully"}
+    summary = ClassificationService(db).save_matrix(items)
+    return {"message": "Matrix saved successfully", "summary": summary}
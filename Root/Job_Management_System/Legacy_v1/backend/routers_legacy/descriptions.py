@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 from .. import crud, models, schemas
+from ..pagination import keyset_page
 from ..database import get_db
 import uuid
 # RBAC dependencies
@@ -14,12 +15,17 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-@router.get("/", response_model=List[Dict[str, Any]])
-def list_job_descriptions(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.get("/", response_model=Union[Dict[str, Any], List[Dict[str, Any]]])
+def list_job_descriptions(skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: Session = Depends(get_db)):
     """
     List all Job Descriptions (Positions) for selection.
+    With `cursor` (empty for the first page) the response is {"items", "next_cursor"}.
     """
-    positions = db.query(models.JobPosition).offset(skip).limit(limit).all()
+    next_cursor = None
+    if cursor is not None:
+        positions, next_cursor = keyset_page(db.query(models.JobPosition), [models.JobPosition.id], cursor, limit)
+    else:
+        positions = db.query(models.JobPosition).offset(skip).limit(limit).all()
     results = []
     for pos in positions:
         results.append({
@@ -27,6 +33,8 @@ def list_job_descriptions(skip: int = 0, limit: int = 100, db: Session = Depends
             "title": pos.title,
             "grade": pos.grade
         })
+    if cursor is not None:
+        return {"items": results, "next_cursor": next_cursor}
     return results
 
 @router.get("/{position_id}")
@@ -10,7 +10,7 @@ router = APIRouter(
 )
 
 @router.get("/{job_id}")
-async def analyze_dynamic_jd(job_id: str, db: Session = Depends(get_db)):
+def analyze_dynamic_jd(job_id: str, db: Session = Depends(get_db)):
     """
     Analyze the drift between Job Description and Workload Logs.
     Returns suggestions to Update (Add/Remove tasks).
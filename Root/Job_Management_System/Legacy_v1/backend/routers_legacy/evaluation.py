@@ -102,52 +102,56 @@ def submit_matrix(session_id: str, submission: schemas.MatrixSubmission, dry_run
             "dry_run": True
         }
 
-    count = 0
-    # Process each rating in the matrix
-    for rating in submission.ratings:
-        # VALIDATION: Check Access
-        if submission.rater_user_id:
-             allowed = EvaluationLogicService.validate_evaluation_access(
-                 db, session_id, submission.rater_user_id, rating.job_position_id
-             )
-             if not allowed:
-                 # Skip or Error? Let's skip and warn, or error.
-                 # For Matrix, maybe just ignore unassigned?
-                 # print(f"Skipping unauthorized rating: {submission.rater_user_id} -> {rating.job_position_id}")
-                 continue
-
-        # 1. Ensure JobEvaluation exists (Concept: Job + Session)
-        db_eval = db.query(models.JobEvaluation).filter(
-            models.JobEvaluation.job_position_id == rating.job_position_id,
-            models.JobEvaluation.session_id == session_id
-        ).first()
-        
-        if not db_eval:
-            db_eval = models.JobEvaluation(
-                id=str(uuid4()),
-                job_position_id=rating.job_position_id,
-                session_id=session_id,
-                scores=[]
+    # Prefetch everything the matrix touches (assignments, evaluations, existing scores: 3 queries),
+    # then let a single flush batch the inserts / updates.
+    ratings = submission.ratings
+    job_ids = {rating.job_position_id for rating in ratings}
+
+    # VALIDATION: Check Access (unassigned cells are skipped)
+    if submission.rater_user_id:
+        allowed = EvaluationLogicService.get_assigned_job_ids(db, session_id, submission.rater_user_id, job_ids)
+        ratings = [rating for rating in ratings if rating.job_position_id in allowed]
+        job_ids &= allowed
+    if not ratings:
+        return schemas.MatrixSubmissionResult(processed_count=0, session_id=session_id)
+
+    # 1. Ensure JobEvaluation exists (Concept: Job + Session)
+    evaluations = {
+        ev.job_position_id: ev
+        for ev in db.query(models.JobEvaluation).filter(
+            models.JobEvaluation.session_id == session_id,
+            models.JobEvaluation.job_position_id.in_(job_ids)
+        )
+    }
+    existing_eval_ids = [ev.id for ev in evaluations.values()]
+    for job_id in job_ids - set(evaluations):
+        db_eval = models.JobEvaluation(id=str(uuid4()), job_position_id=job_id, session_id=session_id)
+        db.add(db_eval)
+        evaluations[job_id] = db_eval
+
+    # 2. Add or Update Score Record (this rater's existing scores for the whole matrix)
+    scores = {}
+    if existing_eval_ids:
+        scores = {
+            score.evaluation_id: score
+            for score in db.query(models.JobEvaluationScore).filter(
+                models.JobEvaluationScore.evaluation_id.in_(existing_eval_ids),
+                models.JobEvaluationScore.rater_type == submission.rater_type,
+                models.JobEvaluationScore.rater_user_id == submission.rater_user_id
             )
-            db.add(db_eval)
-            db.flush() # Get ID
-            
-        # 2. Add or Update Score Record
+        }
+
+    count = 0
+    for rating in ratings:
+        db_eval = evaluations[rating.job_position_id]
         raw_total = sum(rating.factor_scores.values()) if rating.factor_scores else 0
-        
-        # Check if this rater already rated this job in this session
-        db_score = db.query(models.JobEvaluationScore).filter(
-            models.JobEvaluationScore.evaluation_id == db_eval.id,
-            models.JobEvaluationScore.rater_type == submission.rater_type,
-            models.JobEvaluationScore.rater_user_id == submission.rater_user_id
-        ).first()
 
+        db_score = scores.get(db_eval.id)
         if db_score:
-            # Update existing
+            # Update existing (a job repeated in the same matrix updates the score created above)
             db_score.factor_scores = rating.factor_scores
             db_score.raw_total = raw_total
         else:
-            # Insert new
             db_score = models.JobEvaluationScore(
                 id=str(uuid4()),
                 evaluation_id=db_eval.id,
@@ -157,40 +161,36 @@ def submit_matrix(session_id: str, submission: schemas.MatrixSubmission, dry_run
                 raw_total=raw_total
             )
             db.add(db_score)
-        
+            scores[db_eval.id] = db_score
+
         count += 1
-        
+
     db.commit()
     return schemas.MatrixSubmissionResult(processed_count=count, session_id=session_id)
 
 @router.get("/sessions/{session_id}/matrix_submission", response_model=schemas.MatrixSubmission)
 def get_matrix_submission(session_id: str, rater_type: str, rater_user_id: str = None, db: Session = Depends(get_db)):
-    # 1. Find all JobEvaluations for this session
-    evals = db.query(models.JobEvaluation).filter(
-        models.JobEvaluation.session_id == session_id
+    # One join: this rater's score for every JobEvaluation in the session
+    rows = db.query(
+        models.JobEvaluation.id,
+        models.JobEvaluation.job_position_id,
+        models.JobEvaluationScore.factor_scores
+    ).join(
+        models.JobEvaluationScore, models.JobEvaluationScore.evaluation_id == models.JobEvaluation.id
+    ).filter(
+        models.JobEvaluation.session_id == session_id,
+        models.JobEvaluationScore.rater_type == rater_type,
+        models.JobEvaluationScore.rater_user_id == (rater_user_id or None)  # None -> IS NULL (external raters)
     ).all()
-    
-    ratings_list = []
-    
-    for ev in evals:
-        # 2. Find score for this rater
-        query = db.query(models.JobEvaluationScore).filter(
-            models.JobEvaluationScore.evaluation_id == ev.id,
-            models.JobEvaluationScore.rater_type == rater_type
-        )
-        if rater_user_id:
-            query = query.filter(models.JobEvaluationScore.rater_user_id == rater_user_id)
-        else:
-            query = query.filter(models.JobEvaluationScore.rater_user_id == None)
-            
-        score = query.first()
-        
-        if score:
-            ratings_list.append(schemas.MatrixRatingEntry(
-                job_position_id=ev.job_position_id,
-                factor_scores=score.factor_scores or {}
-            ))
-            
+
+    ratings_by_eval = {}
+    for evaluation_id, job_position_id, factor_scores in rows:
+        ratings_by_eval.setdefault(evaluation_id, schemas.MatrixRatingEntry(
+            job_position_id=job_position_id,
+            factor_scores=factor_scores or {}
+        ))
+    ratings_list = list(ratings_by_eval.values())
+
     return schemas.MatrixSubmission(
         session_id=session_id,
         rater_type=rater_type,
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from ..database import get_db
+from ..database import get_read_db
 from ..services.fairness_service import FairnessService
 
 router = APIRouter(
@@ -12,7 +12,7 @@ router = APIRouter(
 service = FairnessService()
 
 @router.get("/analysis")
-def get_fairness_analysis(db: Session = Depends(get_db)):
+def get_fairness_analysis(db: Session = Depends(get_read_db)):
     """
     Returns data for DEI Dashboard: Pay Gaps, Age Correlation, Outliers.
     """
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Union
 from .. import crud, models, schemas
+from ..pagination import CursorPage
 from ..database import get_db
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
@@ -17,8 +18,15 @@ router = APIRouter(
 def create_institution(institution: schemas.InstitutionCreate, db: Session = Depends(get_db)):
     return crud.create_institution(db=db, institution=institution)
 
-@router.get("/", response_model=List[schemas.Institution])
-def read_institutions(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.get("/", response_model=Union[CursorPage[schemas.Institution], List[schemas.Institution]])
+def read_institutions(skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    `cursor` switches to keyset pagination ({"items", "next_cursor"}); pass an empty cursor for the first page.
+    skip/limit without a cursor keep returning a plain list (deprecated).
+    """
+    if cursor is not None:
+        items, next_cursor = crud.get_institutions_page(db, cursor=cursor, limit=limit)
+        return {"items": items, "next_cursor": next_cursor}
     institutions = crud.get_institutions(db, skip=skip, limit=limit)
     return institutions
 
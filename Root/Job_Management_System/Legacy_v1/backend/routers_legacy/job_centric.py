@@ -31,6 +31,7 @@ except ImportError:
         def calculate_gap(self): pass
 
 from backend.database import get_db
+from backend.sharding import get_tenant_db
 from backend.models import (
     User, JobTask, WorkloadEntry, SurveyPeriod, 
     JobGroup, JobSeries, JobPosition, WorkItem, TaskFrequency,
@@ -223,7 +224,7 @@ def get_workload_survey(employee_id: str, db: Session = Depends(get_db)):
     )
 
 @router.post("/workload-survey/{employee_id}")
-def submit_workload_survey(employee_id: str, data: WorkloadSurveyDataSchema, db: Session = Depends(get_db)):
+def submit_workload_survey(employee_id: str, data: WorkloadSurveyDataSchema, db: Session = Depends(get_tenant_db)):
     """
     Submit workload survey data.
     """
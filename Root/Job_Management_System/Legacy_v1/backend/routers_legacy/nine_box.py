@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from ..database import get_db
-from ..services.nine_box_service import NineBoxService
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db, get_async_read_db
+from ..services.nine_box_service import AsyncNineBoxService, NineBoxService
+from .. import sharding
+from ..sharding import TenantHints, run_on_tenant_shard, tenant_hints
 
 router = APIRouter(
     prefix="/scientific/talent",
@@ -15,26 +18,35 @@ class MoveRequest(BaseModel):
     review_id: str
     target_box: int
 
+# NOTE: 쿼리는 AsyncSession.execute 로 await 되므로 DB 가 그리드를 계산하는 동안 이벤트 루프가 다른 요청을 처리한다.
+# (run_sync 는 ORM 작업 전체를 이벤트 루프 위에서 실행하므로 쓰지 않는다.)
+# 샤딩이 켜져 있으면 기관 샤드에는 async 엔진이 없으므로 동기 서비스를 threadpool 에서 테넌트 세션으로 실행한다.
+
 @router.get("/")
-async def get_nine_box_grid(db: Session = Depends(get_db)):
+async def get_nine_box_grid(hints: TenantHints = Depends(tenant_hints), db: AsyncSession = Depends(get_async_read_db)):
     """
     Get 9-Box Talent Matrix data.
     """
-    service = NineBoxService(db)
-    return service.get_grid_data()
+    if sharding.shard_router.enabled:
+        return await run_in_threadpool(run_on_tenant_shard, hints, lambda s: NineBoxService(s).get_grid_data(), read_only=True)
+    return await AsyncNineBoxService(db).get_grid_data()
 
 @router.post("/auto-map")
-async def auto_map_employees(db: Session = Depends(get_db)):
+async def auto_map_employees(hints: TenantHints = Depends(tenant_hints), db: AsyncSession = Depends(get_async_db)):
     """
     Reset all employees' box positions based on their performance/potential scores.
     """
-    service = NineBoxService(db)
-    return service.auto_map_all()
+    if sharding.shard_router.enabled:
+        return await run_in_threadpool(run_on_tenant_shard, hints, lambda s: NineBoxService(s).auto_map_all())
+    return await AsyncNineBoxService(db).auto_map_all()
 
 @router.post("/move")
-async def move_employee(req: MoveRequest, db: Session = Depends(get_db)):
+async def move_employee(req: MoveRequest, hints: TenantHints = Depends(tenant_hints),
+                        db: AsyncSession = Depends(get_async_db)):
     """
     Manually move an employee to a different box (Calibration).
     """
-    service = NineBoxService(db)
-    return service.update_box_position(req.review_id, req.target_box)
+    if sharding.shard_router.enabled:
+        return await run_in_threadpool(
+            run_on_tenant_shard, hints, lambda s: NineBoxService(s).update_box_position(req.review_id, req.target_box))
+    return await AsyncNineBoxService(db).update_box_position(req.review_id, req.target_box)
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 from .. import models, schemas
-from ..database import get_db
+from ..sharding import get_tenant_db, get_tenant_read_db
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
 
@@ -15,7 +15,7 @@ router = APIRouter(
 # --- Job Group ---
 
 @router.post("/groups", response_model=schemas.JobGroup, dependencies=[Depends(require_roles('ADMIN'))])
-def create_job_group(group: schemas.JobGroupCreate, db: Session = Depends(get_db)):
+def create_job_group(group: schemas.JobGroupCreate, db: Session = Depends(get_tenant_db)):
     db_group = models.JobGroup(**group.dict())
     db.add(db_group)
     db.commit()
@@ -23,18 +23,19 @@ def create_job_group(group: schemas.JobGroupCreate, db: Session = Depends(get_db
     return db_group
 
 @router.get("/groups/{institution_id}", response_model=List[schemas.JobGroup])
-def read_job_groups(institution_id: str, db: Session = Depends(get_db)):
-    return db.query(models.JobGroup).filter(models.JobGroup.institution_id == institution_id).all()
+def read_job_groups(institution_id: str, db: Session = Depends(get_tenant_read_db)):
+    # JobGroup 에는 institution_id 컬럼이 없다: 기관 범위는 샤드가 정한다
+    return db.query(models.JobGroup).all()
 
 @router.get("/groups/detail/{group_id}", response_model=schemas.JobGroup)
-def read_job_group(group_id: str, db: Session = Depends(get_db)):
+def read_job_group(group_id: str, db: Session = Depends(get_tenant_read_db)):
     group = db.query(models.JobGroup).filter(models.JobGroup.id == group_id).first()
     if not group:
         raise HTTPException(status_code=404, detail="Job Group not found")
     return group
 
 @router.put("/groups/{group_id}", response_model=schemas.JobGroup, dependencies=[Depends(require_roles('ADMIN'))])
-def update_job_group(group_id: str, group_update: schemas.JobGroupUpdate, db: Session = Depends(get_db)):
+def update_job_group(group_id: str, group_update: schemas.JobGroupUpdate, db: Session = Depends(get_tenant_db)):
     db_group = db.query(models.JobGroup).filter(models.JobGroup.id == group_id).first()
     if not db_group:
         raise HTTPException(status_code=404, detail="Job Group not found")
@@ -47,7 +48,7 @@ def update_job_group(group_id: str, group_update: schemas.JobGroupUpdate, db: Se
     return db_group
 
 @router.delete("/groups/{group_id}", dependencies=[Depends(require_roles('ADMIN'))])
-def delete_job_group(group_id: str, db: Session = Depends(get_db)):
+def delete_job_group(group_id: str, db: Session = Depends(get_tenant_db)):
     db_group = db.query(models.JobGroup).filter(models.JobGroup.id == group_id).first()
     if not db_group:
         raise HTTPException(status_code=404, detail="Job Group not found")
@@ -59,7 +60,7 @@ def delete_job_group(group_id: str, db: Session = Depends(get_db)):
 # --- Job Series ---
 
 @router.post("/series", response_model=schemas.JobSeries, dependencies=[Depends(require_roles('ADMIN'))])
-def create_job_series(series: schemas.JobSeriesCreate, db: Session = Depends(get_db)):
+def create_job_series(series: schemas.JobSeriesCreate, db: Session = Depends(get_tenant_db)):
     db_series = models.JobSeries(**series.dict())
     db.add(db_series)
     db.commit()
@@ -67,18 +68,18 @@ def create_job_series(series: schemas.JobSeriesCreate, db: Session = Depends(get
     return db_series
 
 @router.get("/series/{group_id}", response_model=List[schemas.JobSeries])
-def read_job_series_list(group_id: str, db: Session = Depends(get_db)):
+def read_job_series_list(group_id: str, db: Session = Depends(get_tenant_read_db)):
     return db.query(models.JobSeries).filter(models.JobSeries.group_id == group_id).all()
 
 @router.get("/series/detail/{series_id}", response_model=schemas.JobSeries)
-def read_job_series(series_id: str, db: Session = Depends(get_db)):
+def read_job_series(series_id: str, db: Session = Depends(get_tenant_read_db)):
     series = db.query(models.JobSeries).filter(models.JobSeries.id == series_id).first()
     if not series:
         raise HTTPException(status_code=404, detail="Job Series not found")
     return series
 
 @router.put("/series/{series_id}", response_model=schemas.JobSeries, dependencies=[Depends(require_roles('ADMIN'))])
-def update_job_series(series_id: str, series_update: schemas.JobSeriesUpdate, db: Session = Depends(get_db)):
+def update_job_series(series_id: str, series_update: schemas.JobSeriesUpdate, db: Session = Depends(get_tenant_db)):
     db_series = db.query(models.JobSeries).filter(models.JobSeries.id == series_id).first()
     if not db_series:
         raise HTTPException(status_code=404, detail="Job Series not found")
@@ -95,7 +96,7 @@ def update_job_series(series_id: str, series_update: schemas.JobSeriesUpdate, db
     return db_series
 
 @router.delete("/series/{series_id}", dependencies=[Depends(require_roles('ADMIN'))])
-def delete_job_series(series_id: str, db: Session = Depends(get_db)):
+def delete_job_series(series_id: str, db: Session = Depends(get_tenant_db)):
     db_series = db.query(models.JobSeries).filter(models.JobSeries.id == series_id).first()
     if not db_series:
         raise HTTPException(status_code=404, detail="Job Series not found")
@@ -107,7 +108,7 @@ def delete_job_series(series_id: str, db: Session = Depends(get_db)):
 # --- Job Position ---
 
 @router.post("/positions", response_model=schemas.JobPosition, dependencies=[Depends(require_roles('ADMIN'))])
-def create_job_position(position: schemas.JobPositionCreate, db: Session = Depends(get_db)):
+def create_job_position(position: schemas.JobPositionCreate, db: Session = Depends(get_tenant_db)):
     db_position = models.JobPosition(**position.dict())
     db.add(db_position)
     db.commit()
@@ -115,18 +116,18 @@ def create_job_position(position: schemas.JobPositionCreate, db: Session = Depen
     return db_position
 
 @router.get("/positions/{series_id}", response_model=List[schemas.JobPosition])
-def read_job_positions(series_id: str, db: Session = Depends(get_db)):
+def read_job_positions(series_id: str, db: Session = Depends(get_tenant_read_db)):
     return db.query(models.JobPosition).filter(models.JobPosition.series_id == series_id).all()
 
 @router.get("/positions/detail/{position_id}", response_model=schemas.JobPosition)
-def read_job_position(position_id: str, db: Session = Depends(get_db)):
+def read_job_position(position_id: str, db: Session = Depends(get_tenant_read_db)):
     position = db.query(models.JobPosition).filter(models.JobPosition.id == position_id).first()
     if not position:
         raise HTTPException(status_code=404, detail="Job Position not found")
     return position
 
 @router.put("/positions/{position_id}", response_model=schemas.JobPosition, dependencies=[Depends(require_roles('ADMIN'))])
-def update_job_position(position_id: str, position_update: schemas.JobPositionUpdate, db: Session = Depends(get_db)):
+def update_job_position(position_id: str, position_update: schemas.JobPositionUpdate, db: Session = Depends(get_tenant_db)):
     db_position = db.query(models.JobPosition).filter(models.JobPosition.id == position_id).first()
     if not db_position:
         raise HTTPException(status_code=404, detail="Job Position not found")
@@ -143,7 +144,7 @@ def update_job_position(position_id: str, position_update: schemas.JobPositionUp
     return db_position
 
 @router.delete("/positions/{position_id}", dependencies=[Depends(require_roles('ADMIN'))])
-def delete_job_position(position_id: str, db: Session = Depends(get_db)):
+def delete_job_position(position_id: str, db: Session = Depends(get_tenant_db)):
     db_position = db.query(models.JobPosition).filter(models.JobPosition.id == position_id).first()
     if not db_position:
         raise HTTPException(status_code=404, detail="Job Position not found")
@@ -10,7 +10,7 @@ router = APIRouter(
 )
 
 @router.get("/list")
-async def get_rank_list(db: Session = Depends(get_db)):
+def get_rank_list(db: Session = Depends(get_db)):
     """
     Get the Scientific Promotion Rank List.
     Generated dynamically based on Tenure, Performance Integral, and Growth Slope.
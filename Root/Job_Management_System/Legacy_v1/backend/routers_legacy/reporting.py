@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Dict, Any
-from .. import crud, models, schemas
-from ..database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy import and_, func, select
+from typing import List, Dict, Any, Optional
 from .. import crud, models, schemas
 from ..database import get_db
+from ..services.current_position import current_positions
+import json
 import uuid
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
@@ -17,37 +19,39 @@ router = APIRouter(
     dependencies=[Depends(require_roles('ADMIN', 'HR_MANAGER'))]
 )
 
-@router.get("/job-card/{user_id}")
-def get_job_management_card(user_id: str, db: Session = Depends(get_db)):
+def _card_users(db: Session, user_filter):
     """
-    Aggregates a comprehensive "Job Management Card" for a user.
-    Includes:
-    1. Profile (User, OrgUnit)
-    2. Current Position (Title, Series, Grade)
-    3. Job History (Past positions)
-    4. Performance (Latest Review Score/Grade)
-    5. Evaluation (Job Grade)
-    6. Training (Recent courses)
+    Users for job cards with everything the card reads prefetched:
+    org unit (join), positions -> series -> group, position evaluation and trainings -> program (selectin).
+    raiseload guards against a lazy load sneaking back in (the query count stays fixed).
     """
-    
-    # 1. Fetch User and Profile
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-        
+    Position = models.JobPosition
+    return db.query(models.User).options(
+        joinedload(models.User.org_unit),
+        selectinload(models.User.job_positions).joinedload(Position.series).joinedload(models.JobSeries.group),
+        selectinload(models.User.job_positions).selectinload(Position.evaluation),
+        selectinload(models.User.trainings).joinedload(models.EmployeeTraining.program),
+        raiseload("*"),
+    ).filter(user_filter).order_by(models.User.name, models.User.id).all()
+
+def _latest_reviews(db: Session, user_filter) -> Dict[str, models.PerformanceReview]:
+    """Latest review per user via the current_reviews projection (one query)."""
+    rows = db.query(models.CurrentReview.user_id, models.PerformanceReview)\
+        .join(models.PerformanceReview, models.CurrentReview.review_id == models.PerformanceReview.id)\
+        .filter(models.CurrentReview.user_id.in_(select(models.User.id).where(user_filter)))\
+        .all()
+    return dict(rows)
+
+def _current_position_ids(db: Session, user_filter) -> Dict[str, str]:
+    """Current position id per user, by the shared current-position rule (one query)."""
+    current = current_positions(models.JobPosition.user_id.in_(select(models.User.id).where(user_filter)))
+    return dict(db.execute(select(current.c.user_id, current.c.position_id)).all())
+
+def _build_card(user, latest_review, current_position_id: Optional[str]) -> Dict[str, Any]:
     # 2. Current Position
-    current_pos = None
-    for pos in user.job_positions:
-        # Simplistic logic: assume the one without end date or most recent is current
-        # For MVP, just taking the first one or the one marked as 'is_future_model=False'
-        if not pos.is_future_model: 
-            current_pos = pos
-            break
-            
-    # If no current pos found, just take first
-    if not current_pos and user.job_positions:
-        current_pos = user.job_positions[0]
-        
+    # 직위 목록은 이미 prefetch 되어 있으므로 현재 직위 id 로 골라내기만 한다 (미래모델만 있으면 현재 직위 없음)
+    current_pos = next((pos for pos in user.job_positions if pos.id == current_position_id), None)
+
     # 3. Job History
     # Derived from modifications to JobPosition or a separate History table if implemented fully.
     # For now, we can show list of positions assigned to user as history
@@ -59,12 +63,6 @@ def get_job_management_card(user_id: str, db: Session = Depends(get_db)):
             "series": pos.series.name if pos.series else "N/A"
         })
 
-    # 4. Performance (Latest)
-    latest_review = db.query(models.PerformanceReview)\
-        .filter(models.PerformanceReview.user_id == user_id)\
-        .order_by(models.PerformanceReview.year.desc())\
-        .first()
-        
     # 5. Job Evaluation (for current position)
     job_grade = "N/A"
     if current_pos and current_pos.evaluation:
@@ -102,3 +100,55 @@ def get_job_management_card(user_id: str, db: Session = Depends(get_db)):
         "history": history_data,
         "trainings": trainings
     }
+
+@router.get("/job-card/{user_id}")
+def get_job_management_card(user_id: str, db: Session = Depends(get_db)):
+    """
+    Aggregates a comprehensive "Job Management Card" for a user.
+    Includes:
+    1. Profile (User, OrgUnit)
+    2. Current Position (Title, Series, Grade)
+    3. Job History (Past positions)
+    4. Performance (Latest Review Score/Grade)
+    5. Evaluation (Job Grade)
+    6. Training (Recent courses)
+    """
+    
+    # 1. Fetch User and Profile
+    user_filter = models.User.id == user_id
+    users = _card_users(db, user_filter)
+    if not users:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    # 4. Performance (Latest)
+    latest_review = _latest_reviews(db, user_filter).get(user_id)
+    return _build_card(users[0], latest_review, _current_position_ids(db, user_filter).get(user_id))
+
+@router.get("/job-cards")
+def get_job_management_cards(
+    org_unit_id: Optional[str] = None,
+    user_ids: Optional[List[str]] = Query(None),
+    db: Session = Depends(get_db)
+):
+    """
+    Job Management Cards for a whole org unit (or an explicit list of users), e.g. for printing / export.
+    Streams one JSON card per line (NDJSON) in name order.
+    All data is prefetched with a fixed number of queries (6) regardless of the number of users.
+    """
+    if not org_unit_id and not user_ids:
+        raise HTTPException(status_code=422, detail="org_unit_id or user_ids is required")
+    user_filter = models.User.org_unit_id == org_unit_id if org_unit_id else models.User.id.in_(user_ids)
+    if org_unit_id and user_ids:
+        user_filter = and_(user_filter, models.User.id.in_(user_ids))
+
+    # 응답 스트리밍 전에 모두 읽어 둔다 (세션이 닫혀도 카드 조립은 메모리에서만 진행)
+    users = _card_users(db, user_filter)
+    reviews = _latest_reviews(db, user_filter)
+    positions = _current_position_ids(db, user_filter)
+
+    def lines():
+        for user in users:
+            card = {"user_id": user.id, **_build_card(user, reviews.get(user.id), positions.get(user.id))}
+            yield json.dumps(jsonable_encoder(card), ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from ..database import get_db
+from typing import Optional
+from .. import models
+from ..sharding import get_tenant_read_db
 from ..services.span_service import SpanOfControlService
 
 router = APIRouter(
@@ -10,9 +12,16 @@ router = APIRouter(
 )
 
 @router.get("/")
-def get_span_of_control_tree(db: Session = Depends(get_db)):
+def get_span_of_control_tree(
+    root_id: Optional[str] = None,
+    max_depth: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_tenant_read_db)
+):
     """
-    Get Recursive Organizational Tree with Span of Control metrics.
+    Get Organizational Tree with Span of Control metrics.
+    root_id: return only the subtree under this manager. max_depth: levels below the root to include.
     """
+    if root_id and not db.query(models.User.id).filter(models.User.id == root_id).first():
+        raise HTTPException(status_code=404, detail="Manager not found")
     service = SpanOfControlService(db)
-    return service.get_span_of_control_analysis()
+    return service.get_span_of_control_analysis(root_id=root_id, max_depth=max_depth)
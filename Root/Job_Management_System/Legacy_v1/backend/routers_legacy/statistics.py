@@ -5,7 +5,7 @@ from typing import List
 import pandas as pd
 import io
 from .. import crud, models, schemas
-from ..database import get_db
+from ..sharding import get_tenant_read_db
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
 
@@ -17,7 +17,7 @@ router = APIRouter(
 )
 
 @router.get("/export/excel/{institution_id}")
-def export_excel(institution_id: str, db: Session = Depends(get_db)):
+def export_excel(institution_id: str, db: Session = Depends(get_tenant_read_db)):
     # Fetch data
     institution = crud.get_institution(db, institution_id)
     if not institution:
@@ -54,7 +54,7 @@ def export_excel(institution_id: str, db: Session = Depends(get_db)):
     return StreamingResponse(output, headers=headers, media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
 
 @router.get("/dashboard/{institution_id}")
-def get_dashboard_stats(institution_id: str, db: Session = Depends(get_db)):
+def get_dashboard_stats(institution_id: str, db: Session = Depends(get_tenant_read_db)):
     # Placeholder for dashboard stats logic
     return {
         "management_ratio": 12.5,
@@ -63,7 +63,7 @@ def get_dashboard_stats(institution_id: str, db: Session = Depends(get_db)):
     }
 
 @router.get("/reports/job-distribution/{institution_id}")
-def generate_job_distribution_report(institution_id: str, db: Session = Depends(get_db)):
+def generate_job_distribution_report(institution_id: str, db: Session = Depends(get_tenant_read_db)):
     from ..services.report_service import ReportService
     from fastapi.responses import FileResponse
     import os
@@ -4,6 +4,8 @@ from typing import List, Optional
 from pydantic import BaseModel
 from .. import crud, models, schemas
 from ..database import get_db
+from ..sharding import get_tenant_db, get_tenant_read_db
+from ..services import dashboard_service  # noqa: F401  (invalidates cached dashboards on pulse writes)
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
 
@@ -15,22 +17,33 @@ router = APIRouter(
 )
 
 @router.post("/{institution_id}", response_model=schemas.SurveyPeriod)
-def create_survey(institution_id: str, survey: schemas.SurveyPeriodCreate, db: Session = Depends(get_db)):
+def create_survey(institution_id: str, survey: schemas.SurveyPeriodCreate, db: Session = Depends(get_tenant_db)):
     return crud.create_survey_period(db=db, survey=survey, institution_id=institution_id)
 
 @router.get("/{institution_id}", response_model=List[schemas.SurveyPeriod])
-def read_surveys(institution_id: str, db: Session = Depends(get_db)):
+def read_surveys(institution_id: str, db: Session = Depends(get_tenant_read_db)):
     return crud.get_survey_periods(db, institution_id=institution_id)
 
 @router.post("/{survey_id}/entries", response_model=schemas.WorkloadEntry)
-def create_entry(survey_id: str, entry: schemas.WorkloadEntryCreate, db: Session = Depends(get_db)):
+def create_entry(survey_id: str, entry: schemas.WorkloadEntryCreate, db: Session = Depends(get_tenant_db)):
     # Ensure entry.survey_period_id matches survey_id
     if entry.survey_period_id != survey_id:
         raise HTTPException(status_code=400, detail="Survey ID mismatch")
     return crud.create_workload_entry(db=db, entry=entry)
 
+@router.post("/{survey_id}/entries/bulk", response_model=schemas.WorkloadEntryBulkResult)
+def create_entries_bulk(survey_id: str, payload: schemas.WorkloadEntryBulkCreate, db: Session = Depends(get_tenant_db)):
+    """
+    Saves a whole survey submission in one request.
+    Rows that fail validation are listed in `errors` (by position) and the remaining rows are stored.
+    """
+    result = crud.create_workload_entries_bulk(db=db, survey_period_id=survey_id, rows=payload.entries)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Survey period not found")
+    return result
+
 @router.get("/{survey_id}/entries", response_model=List[schemas.WorkloadEntry])
-def read_entries(survey_id: str, db: Session = Depends(get_db)):
+def read_entries(survey_id: str, db: Session = Depends(get_tenant_read_db)):
     return crud.get_workload_entries(db, survey_period_id=survey_id)
 
 # --- Employee Experience (Pulse) ---
@@ -46,13 +59,13 @@ def create_pulse_check(pulse: PulseCreate, db: Session = Depends(get_db)):
     if not mock_user:
         raise HTTPException(status_code=400, detail="No user found")
         
-    db_pulse = models.DailyPulse(
+    db_pulse = models.PulseCheck(
         user_id=mock_user.id,
         mood_score=pulse.mood,
         workload_level=models.PulseWorkloadLevel(pulse.workload),
         note=pulse.note
     )
     db.add(db_pulse)
-    db.commit()
+    db.commit()  # dashboard cache entry of the user is invalidated on commit (services.dashboard_service)
     db.refresh(db_pulse)
     return {"status": "success", "id": db_pulse.id}
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Union
 from .. import models, schemas
+from ..pagination import CursorPage, keyset_page
 from ..database import get_db
 from datetime import date
 # RBAC dependencies
@@ -21,8 +22,11 @@ def create_program(program: schemas.TrainingProgramCreate, db: Session = Depends
     db.refresh(db_program)
     return db_program
 
-@router.get("/programs", response_model=List[schemas.TrainingProgram])
-def get_programs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.get("/programs", response_model=Union[CursorPage[schemas.TrainingProgram], List[schemas.TrainingProgram]])
+def get_programs(skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    if cursor is not None:
+        items, next_cursor = keyset_page(db.query(models.TrainingProgram), [models.TrainingProgram.id], cursor, limit)
+        return {"items": items, "next_cursor": next_cursor}
     return db.query(models.TrainingProgram).offset(skip).limit(limit).all()
 
 @router.post("/assign", response_model=schemas.EmployeeTraining, dependencies=[Depends(require_roles('ADMIN', 'MANAGER'))])
@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from datetime import date
+from typing import List, Optional, Union
 from .. import crud, models, schemas
+from ..pagination import CursorPage
+from ..services import dashboard_service
+from ..services.dashboard_service import dashboard_cache
 from ..database import get_db
+from ..sharding import get_tenant_db, get_tenant_read_db
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
 
@@ -14,16 +19,25 @@ router = APIRouter(
 )
 
 @router.post("/", response_model=schemas.User)
-def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
+def create_user(user: schemas.UserCreate, db: Session = Depends(get_tenant_db)):
     return crud.create_user(db=db, user=user)
 
 @router.get("/{user_id}", response_model=schemas.User)
-def read_user(user_id: str, db: Session = Depends(get_db)):
+def read_user(user_id: str, db: Session = Depends(get_tenant_read_db)):
     db_user = crud.get_user(db, user_id=user_id)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return db_user
 
+@router.get("/", response_model=Union[CursorPage[schemas.User], List[schemas.User]])
+def read_users(institution_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None, db: Session = Depends(get_tenant_read_db)):
+    """
+    `cursor` switches to keyset pagination ({"items", "next_cursor"}); pass an empty cursor for the first page.
+    skip/limit without a cursor keep returning a plain list (deprecated).
+    """
+    if cursor is not None:
+        items, next_cursor = crud.get_users_page(db, institution_id=institution_id, cursor=cursor, limit=limit)
+        return {"items": items, "next_cursor": next_cursor}
     users = crud.get_users(db, institution_id=institution_id, skip=skip, limit=limit)
     return users
 
@@ -46,16 +60,25 @@ def create_pulse_check(check: schemas.PulseCheckCreate, db: Session = Depends(ge
         
     db_check = models.PulseCheck(**check.model_dump(), user_id=mock_user.id)
     db.add(db_check)
-    db.commit()
+    db.commit()  # dashboard cache entry of the user is invalidated on commit (services.dashboard_service)
     db.refresh(db_check)
     return db_check
 
 # --- My Job Dashboard (Employee Experience) ---
 @router.get("/me/dashboard")
 def read_my_dashboard(db: Session = Depends(get_db)):
+    """
+    Cached per user (see services.dashboard_service): a cache hit costs only the user lookup,
+    a miss 4 aggregate queries. Goal / training / pulse writes of the user invalidate the entry.
+    """
     # Mock Auth: Get the first user (e.g., 'EMP001') - In prod, use current_user
-    mock_user = db.query(models.User).first()
-    if not mock_user:
+    mock_user = db.query(models.User.id).first()
+    dashboard = None
+    if mock_user:
+        dashboard = dashboard_cache.get_or_build(
+            mock_user.id, lambda: dashboard_service.build_dashboard(db, mock_user.id)
+        )
+    if dashboard is None:
         # Fallback if no data
         return {
             "user": {"name": "Guest", "title": "No User Data", "department": "System"},
@@ -63,69 +86,4 @@ def read_my_dashboard(db: Session = Depends(get_db)):
             "key_tasks": [],
             "notifications": []
         }
-        
-    # 1. Job Info
-    # User has relationship 'job_positions' (list) or query JobPosition where user_id=user.id
-    # Assuming one primary position for now
-    job_position = db.query(models.JobPosition).filter(models.JobPosition.user_id == mock_user.id).first()
-    
-    # 2. Org Info
-    org_unit = db.query(models.OrgUnit).filter(models.OrgUnit.id == mock_user.org_unit_id).first()
-    dept_name = org_unit.name if org_unit else "Unassigned"
-    
-    # 3. Stats: Goals
-    goal_count = db.query(models.PerformanceGoal)\
-        .join(models.PerformanceReview)\
-        .filter(models.PerformanceReview.user_id == mock_user.id)\
-        .count()
-        
-    # 4. Stats: Training Hours
-    training_hours = 0.0
-    completed_trainings = db.query(models.EmployeeTraining)\
-        .filter(
-            models.EmployeeTraining.user_id == mock_user.id,
-            models.EmployeeTraining.status == models.TrainingStatus.COMPLETED
-        ).all()
-        
-    for t in completed_trainings:
-        program = db.query(models.TrainingProgram).filter(models.TrainingProgram.id == t.program_id).first()
-        if program:
-            training_hours += program.duration_hours
-
-    # 5. Pulse Score (Latest Mood)
-    today = date.today()
-    pulse = db.query(models.PulseCheck).filter(
-        models.PulseCheck.user_id == mock_user.id,
-        models.PulseCheck.date == today
-    ).first()
-    
-    pulse_display = "N/A"
-    if pulse:
-        # Map 1-5 to Emojis
-        emojis = {1: "😫", 2: "😞", 3: "😐", 4: "🙂", 5: "😁"}
-        pulse_display = emojis.get(pulse.mood_score, "🙂")
-
-    # 6. Key Tasks
-    tasks = []
-    if job_position:
-        tasks = db.query(models.JobTask)\
-            .filter(models.JobTask.job_position_id == job_position.id)\
-            .limit(5).all()
-
-    return {
-        "user": {
-            "name": mock_user.name,
-            "title": job_position.title if job_position else "Unassigned",
-            "department": dept_name
-        },
-        "stats": {
-            "goals_completed": goal_count,
-            "training_hours": round(training_hours, 1),
-            "pulse_score": pulse_display
-        },
-        "key_tasks": [t.task_name for t in tasks],
-        "notifications": [
-            {"id": 1, "text": "Annual survey due in 3 days", "type": "warning"},
-            {"id": 2, "text": "New Python training available", "type": "info"}
-        ]
-    }
+    return dashboard
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Dict, Any
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, func, select
+from typing import List, Dict, Any, Optional
+from datetime import date
 from .. import crud, models, schemas
-from ..database import get_db
+from ..sharding import get_tenant_db, get_tenant_read_db
 import uuid
 # RBAC dependencies
 from ..dependencies import require_roles, require_permission
@@ -16,7 +17,13 @@ router = APIRouter(
 )
 
 @router.get("/gap-analysis")
-def get_gap_analysis(db: Session = Depends(get_db)):
+def get_gap_analysis(
+    year: Optional[int] = None,
+    institution_id: Optional[str] = None,
+    root_id: Optional[str] = None,
+    rollup: bool = False,
+    db: Session = Depends(get_tenant_read_db)
+):
     """
     [Strategic Context] Workforce Gap Analysis (인력 수급 분석)
     
@@ -28,51 +35,74 @@ def get_gap_analysis(db: Session = Depends(get_db)):
     - Negative Gap (-) : 정원 < 적정인력 (Understaffed). 업무 과부하 상태이므로 신규 채용(Hiring) 또는 업무 감축(Process Innovation) 필요.
     
     This API provides the data to resolve the conflict between "Budgeted View" and "Operational View".
+
+    Reads the materialized workforce_gap_summary (one query; units without a row for the year get a live headcount).
+    `year` defaults to the current year, `root_id` limits the result to that unit's subtree and `rollup` adds every sub-unit into its parents' figures.
     """
-    
-    # 1. Get all Org Units
-    org_units = db.query(models.OrgUnit).all()
-    
-    result = []
-    
-    for unit in org_units:
-        # 2. Get Current Headcount (PO)
-        current_count = db.query(models.User).filter(models.User.org_unit_id == unit.id).count()
-        
-        # 3. Get Authorized Headcount (TO) - Assume current year (e.g., 2025)
-        # For MVP, defaulting to 2025. In prod, pass year as param.
-        headcount_plan = db.query(models.HeadcountPlan).filter(
-            models.HeadcountPlan.org_unit_id == unit.id,
-            models.HeadcountPlan.year == 2025
-        ).first()
-        
-        authorized_count = headcount_plan.authorized_count if headcount_plan else 0.0
-        
-        # 4. Get Required Headcount (FTE total)
-        # This requires summing up FTE of all users in this unit
-        # FTE comes from WorkloadEntry -> User -> OrgUnit
-        # Optimized query: Join WorkloadEntry, User, filter by Unit
-        
-        total_fte = db.query(func.sum(models.WorkloadEntry.fte))\
-            .join(models.User)\
-            .filter(models.User.org_unit_id == unit.id)\
-            .scalar() or 0.0
-            
-        unit_data = {
-            "id": unit.id,
-            "unit_name": unit.name,
-            "unit_type": unit.unit_type,
-            "current_count": current_count,
-            "authorized_count": authorized_count,
-            "required_count": round(total_fte, 2),
-            "gap": round(authorized_count - total_fte, 2)
+    year = year or date.today().year
+    Unit = models.OrgUnit
+    Summary = models.WorkforceGapSummary
+
+    tree = None
+    if root_id or rollup:
+        # 조직 트리 (ancestor, unit) 쌍: 자기 자신 포함, parent_id 를 따라 재귀
+        anchor = select(Unit.id.label("ancestor_id"), Unit.id.label("unit_id"))
+        if institution_id:
+            anchor = anchor.where(Unit.institution_id == institution_id)
+        tree = anchor.cte("org_tree", recursive=True)
+        child = aliased(Unit)
+        tree = tree.union_all(select(tree.c.ancestor_id, child.id).join(child, child.parent_id == tree.c.unit_id))
+
+    def live_count(unit_id):
+        # 해당 연도 요약 행이 없는 조직(계획/조사가 없는 연도)은 현원을 직접 센다. COALESCE 라서 행이 있으면 실행되지 않는다
+        return select(func.count(models.User.id)).where(models.User.org_unit_id == unit_id).scalar_subquery()
+
+    if rollup:
+        figures = select(
+            tree.c.ancestor_id.label("org_unit_id"),
+            func.sum(func.coalesce(Summary.current_count, live_count(tree.c.unit_id))).label("current_count"),
+            func.sum(Summary.authorized_count).label("authorized_count"),
+            func.sum(Summary.required_fte).label("required_fte"),
+        ).select_from(tree).outerjoin(
+            Summary, and_(Summary.org_unit_id == tree.c.unit_id, Summary.year == year)
+        ).group_by(tree.c.ancestor_id).subquery("figures")
+    else:
+        figures = select(
+            Summary.org_unit_id, Summary.current_count, Summary.authorized_count, Summary.required_fte
+        ).where(Summary.year == year).subquery("figures")
+
+    query = select(
+        Unit.id, Unit.name, Unit.unit_type, Unit.parent_id,
+        func.coalesce(figures.c.current_count, live_count(Unit.id)).label("current_count"),
+        func.coalesce(figures.c.authorized_count, 0.0).label("authorized_count"),
+        func.coalesce(figures.c.required_fte, 0.0).label("required_fte"),
+    ).outerjoin(figures, figures.c.org_unit_id == Unit.id)
+    if institution_id:
+        query = query.where(Unit.institution_id == institution_id)
+    if root_id:
+        query = query.where(Unit.id.in_(select(tree.c.unit_id).where(tree.c.ancestor_id == root_id)))
+
+    rows = db.execute(query).all()
+    if root_id and not rows:
+        raise HTTPException(status_code=404, detail="Org unit not found")
+
+    return [
+        {
+            "id": row.id,
+            "unit_name": row.name,
+            "unit_type": row.unit_type,
+            "parent_id": row.parent_id,
+            "year": year,
+            "current_count": row.current_count,
+            "authorized_count": row.authorized_count,
+            "required_count": round(row.required_fte, 2),
+            "gap": round(row.authorized_count - row.required_fte, 2)
         }
-        result.append(unit_data)
-        
-    return result
+        for row in rows
+    ]
 
 @router.post("/headcount-plan")
-def save_headcount_plan(plan: schemas.HeadcountPlanCreate, db: Session = Depends(get_db)):
+def save_headcount_plan(plan: schemas.HeadcountPlanCreate, db: Session = Depends(get_tenant_db)):
     # Check if exists for year/unit
     existing = db.query(models.HeadcountPlan).filter(
         models.HeadcountPlan.org_unit_id == plan.org_unit_id,
@@ -101,7 +131,7 @@ def save_headcount_plan(plan: schemas.HeadcountPlanCreate, db: Session = Depends
 @router.get("/dual-tenure", response_model=List[Dict[str, Any]])
 def get_dual_tenure_analysis(
     org_unit_id: str = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_tenant_read_db)
 ):
     """
     [Strategic Context]
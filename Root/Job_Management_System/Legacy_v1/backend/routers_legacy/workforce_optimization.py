@@ -10,7 +10,7 @@ router = APIRouter(
 )
 
 @router.get("/optimization")
-async def get_workforce_optimization(db: Session = Depends(get_db)):
+def get_workforce_optimization(db: Session = Depends(get_db)):
     """
     Get Scientific Workforce Optimization Analysis.
     Calculates Required FTE vs Current FTE based on Standard Time.
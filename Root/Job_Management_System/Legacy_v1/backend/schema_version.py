@@ -0,0 +1,160 @@
+import hashlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, literal, select, text
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateColumn
+
+# The stamp table lives outside Base.metadata so it never changes the fingerprint it records.
+stamp_metadata = MetaData()
+
+schema_version_table = Table(
+    "schema_version",
+    stamp_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("fingerprint", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+def schema_fingerprint(metadata: MetaData) -> str:
+    """
+    Short hash of the declared tables / columns / indexes.
+    Computed from the in-memory metadata only, so it costs no database round trips.
+    """
+    parts = []
+    for table in sorted(metadata.tables.values(), key=lambda t: t.name):
+        parts.append(table.name)
+        for col in table.columns:
+            parts.append(f"{table.name}.{col.name}:{col.type!r}:{col.primary_key}:{col.nullable}")
+        for index in sorted(table.indexes, key=lambda i: i.name or ""):
+            parts.append(f"{table.name}#{index.name}:{','.join(c.name for c in index.columns)}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+def get_stamp(bind):
+    """Returns the fingerprint stored in the database, or None if it was never stamped."""
+    try:
+        with bind.connect() as conn:
+            return conn.execute(
+                select(schema_version_table.c.fingerprint).order_by(schema_version_table.c.id.desc()).limit(1)
+            ).scalar()
+    except (OperationalError, ProgrammingError):
+        # schema_version 테이블 자체가 없는 경우 (manage_db 를 한 번도 실행하지 않은 DB)
+        return None
+
+def stamp(bind, metadata: MetaData) -> str:
+    fingerprint = schema_fingerprint(metadata)
+    stamp_metadata.create_all(bind=bind)
+    with bind.begin() as conn:
+        conn.execute(schema_version_table.insert().values(fingerprint=fingerprint, applied_at=datetime.utcnow()))
+    return fingerprint
+
+def projection_rebuilders():
+    """Projection tables kept in sync by flush listeners in services/*, and how to recompute each from its sources."""
+    from .services import current_review, reporting_closure, workforce_summary
+    return {
+        "reporting_closure": reporting_closure.rebuild,
+        "workforce_gap_summary": workforce_summary.rebuild,
+        "current_reviews": current_review.rebuild,
+    }
+
+def populate_projections(bind, table_names: Iterable[str]) -> Dict[str, int]:
+    """Rebuilds the given projection tables (others are ignored). Returns row counts per table."""
+    rebuilders = projection_rebuilders()
+    names = [name for name in table_names if name in rebuilders]
+    if not names:
+        return {}
+    with Session(bind=bind) as db:
+        return {name: rebuilders[name](db) for name in names}
+
+def _target_schema(bind) -> Optional[str]:
+    # postgres-schema 샤드는 schema_translate_map 으로 기관 스키마를 가리키는 파생 엔진이다
+    return bind.get_execution_options().get("schema_translate_map", {}).get(None)
+
+def _column_ddl(column, dialect) -> str:
+    """Column spec for ALTER TABLE ... ADD COLUMN, with scalar Python defaults as DEFAULT so existing rows get them."""
+    ddl = str(CreateColumn(column).compile(dialect=dialect))
+    default = column.default
+    if column.server_default is None and default is not None and default.is_scalar and default.arg is not None:
+        value = default.arg.value if hasattr(default.arg, "value") else default.arg  # Enum 멤버는 값으로
+        ddl += " DEFAULT " + str(literal(value).compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    for fk in column.foreign_keys:
+        ddl += f" REFERENCES {fk.column.table.name}({fk.column.name})"
+    return ddl
+
+def plan_alterations(bind, metadata: MetaData) -> List[Tuple[Table, Column]]:
+    """
+    Columns declared in metadata but missing from existing tables, to be added with ALTER TABLE.
+    Raises SchemaVersionError for differences ADD COLUMN cannot express (primary key layout,
+    NOT NULL / UNIQUE columns without a default); nothing has been changed at that point.
+    Column types and columns only present in the database are not compared.
+    """
+    schema = _target_schema(bind)
+    inspector = inspect(bind)
+    existing = set(inspector.get_table_names(schema=schema))
+    plan, problems = [], []
+    for table in metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        db_columns = {c["name"] for c in inspector.get_columns(table.name, schema=schema)}
+        db_pk = set(inspector.get_pk_constraint(table.name, schema=schema)["constrained_columns"])
+        model_pk = {c.name for c in table.primary_key.columns}
+        if db_pk != model_pk:
+            problems.append(f"{table.name}: primary key is ({', '.join(sorted(db_pk))}), code expects "
+                            f"({', '.join(sorted(model_pk))}); rebuild it with backend/migrate_compact_keys.py")
+            continue
+        for column in table.columns:
+            if column.name in db_columns:
+                continue
+            has_default = column.server_default is not None or (column.default is not None and column.default.is_scalar
+                                                                and column.default.arg is not None)
+            if column.unique or (not column.nullable and not has_default):
+                problems.append(f"{table.name}.{column.name}: a {'UNIQUE' if column.unique else 'NOT NULL'} column "
+                                "cannot be added to a table that has rows; migrate it by hand")
+                continue
+            plan.append((table, column))
+    if problems:
+        raise SchemaVersionError("Existing tables differ from the models:\n  " + "\n  ".join(problems))
+    return plan
+
+def upgrade(bind, metadata: MetaData) -> str:
+    """
+    Brings the database to the models and records the new stamp. Used by manage_db and SCHEMA_STARTUP=create.
+      1. missing tables are created (create_all)
+      2. missing columns of existing tables are added (ALTER TABLE ... ADD COLUMN, see plan_alterations)
+      3. missing indexes of existing tables are created
+    Projection tables created here are filled from their sources right away:
+    the listeners only apply deltas, so an empty projection next to existing data would stay wrong.
+    """
+    schema = _target_schema(bind)
+    existing = set(inspect(bind).get_table_names(schema=schema))
+    alterations = plan_alterations(bind, metadata)  # 먼저 전부 검사: 호환되지 않으면 아무것도 바꾸지 않고 실패
+    metadata.create_all(bind=bind)
+    preparer = bind.dialect.identifier_preparer
+    with bind.begin() as conn:
+        # SQLite 는 ALTER TABLE 한 번에 컬럼 하나만 추가할 수 있다
+        for table, column in alterations:
+            name = preparer.quote(table.name) if schema is None else f"{preparer.quote(schema)}.{preparer.quote(table.name)}"
+            conn.execute(text(f"ALTER TABLE {name} ADD COLUMN {_column_ddl(column, bind.dialect)}"))
+        for table in metadata.sorted_tables:
+            if table.name in existing:
+                for index in table.indexes:
+                    index.create(bind=conn, checkfirst=True)
+    populate_projections(bind, [name for name in metadata.tables if name not in existing])
+    if get_stamp(bind) == schema_fingerprint(metadata):
+        return schema_fingerprint(metadata)
+    return stamp(bind, metadata)
+
+def check(bind, metadata: MetaData):
+    """Single-row stamp lookup. Raises SchemaVersionError if the database is behind the code."""
+    expected = schema_fingerprint(metadata)
+    current = get_stamp(bind)
+    if current != expected:
+        raise SchemaVersionError(
+            f"Database schema stamp is {current or 'missing'}, code expects {expected}. "
+            "Run `python -m backend.manage_db upgrade` (or set SCHEMA_STARTUP=create for local development)."
+        )
+    return current
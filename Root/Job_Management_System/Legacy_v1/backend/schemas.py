@@ -1,9 +1,14 @@
 from pydantic import BaseModel
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Dict, Any
 from datetime import date, datetime
 from enum import Enum
 
-# Enums
+# --- Enums ---
+class UnitType(str, Enum):
+    HQ = "HQ"
+    OFFICE = "OFFICE"
+    TEAM = "TEAM"
+
 class JobGrade(str, Enum):
     G1 = "G1"
     G2 = "G2"
@@ -22,19 +27,190 @@ class ComplianceStatus(str, Enum):
     WARNING = "WARNING"
     VIOLATION = "VIOLATION"
 
-# --- Job Components ---
-class JobTaskBase(BaseModel):
+class InstitutionCategory(str, Enum):
+    MARKET = "MARKET"
+    QUASI_MARKET = "QUASI_MARKET"
+    FUND = "FUND"
+    CONSIGNMENT = "CONSIGNMENT"
+
+class SurveyStatus(str, Enum):
+    DRAFT = "DRAFT"
+    ACTIVE = "ACTIVE"
+    CLOSED = "CLOSED"
+
+class DependencyType(str, Enum):
+    BLOCKS = "BLOCKS"
+    RELATED = "RELATED"
+    SEQUENTIAL = "SEQUENTIAL"
+
+class TaskFrequency(str, Enum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+    MONTHLY = "MONTHLY"
+    YEARLY = "YEARLY"
+    SEASONAL = "SEASONAL"
+    IRREGULAR = "IRREGULAR"
+
+class TrainingStatus(str, Enum):
+    PLANNED = "PLANNED"
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+
+class ReviewStatus(str, Enum):
+    DRAFT = "DRAFT"
+    SUBMITTED = "SUBMITTED"
+    FINAL = "FINAL"
+
+class PulseWorkloadLevel(str, Enum):
+    LOW = "LOW"
+    NORMAL = "NORMAL"
+    HIGH = "HIGH"
+    OVERLOAD = "OVERLOAD"
+
+class RaterType(str, Enum):
+    SELF = "SELF"
+    PEER = "PEER"
+    SUPERVISOR_1 = "SUPERVISOR_1"
+    SUPERVISOR_2 = "SUPERVISOR_2"
+    EXTERNAL = "EXTERNAL"
+
+# --- Base Schemas ---
+class InstitutionBase(BaseModel):
+    name: str
+    code: str
+    category: Optional[InstitutionCategory] = None
+
+class InstitutionCreate(InstitutionBase):
+    pass
+
+class Institution(InstitutionBase):
+    id: str
+    class Config:
+        from_attributes = True
+
+class OrgUnitBase(BaseModel):
+    name: str
+    unit_type: UnitType
+    mission: Optional[str] = None
+    parent_id: Optional[str] = None
+
+class OrgUnitCreate(OrgUnitBase):
+    institution_id: str
+
+class OrgUnit(OrgUnitBase):
+    id: str
+    institution_id: str
+    class Config:
+        from_attributes = True
+
+class UserBase(BaseModel):
+    email: str
+    name: str
+    hire_date: Optional[date] = None
+    birth_date: Optional[date] = None
+    phone_number: Optional[str] = None
+    address: Optional[str] = None
+    education_level: Optional[str] = None
+    certifications: Optional[List[Dict[str, Any]]] = None
+    career_history: Optional[List[Dict[str, Any]]] = None
+
+class UserCreate(UserBase):
+    institution_id: str
+    org_unit_id: str
+
+class User(UserBase):
+    id: str
+    institution_id: str
+    org_unit_id: str
+    class Config:
+        from_attributes = True
+
+# --- Strategic Analysis ---
+class StrategicAnalysisBase(BaseModel):
+    institution_id: str
+    analysis_type: str
+    content: str # JSON string
+
+class StrategicAnalysisCreate(StrategicAnalysisBase):
+    pass
+
+class StrategicAnalysisUpdate(BaseModel):
+    content: Optional[str] = None
+
+class StrategicAnalysis(StrategicAnalysisBase):
+    id: str
+    created_at: datetime
+    updated_at: datetime
+    class Config:
+        from_attributes = True
+
+# --- Job Architecture ---
+class JobGroupBase(BaseModel):
+    name: str
+
+class JobGroupCreate(JobGroupBase):
+    pass
+
+class JobGroupUpdate(JobGroupBase):
+    pass
+
+class JobGroup(JobGroupBase):
+    id: str
+    class Config:
+        from_attributes = True
+
+class JobSeriesBase(BaseModel):
     name: str
-    importance: int = 3
-    frequency: str = "Daily"
-    is_essential: bool = True
+    ncs_code: Optional[str] = None
+    ncs_name: Optional[str] = None
+
+class JobSeriesCreate(JobSeriesBase):
+    group_id: str
+
+class JobSeriesUpdate(JobSeriesBase):
+    pass
+
+class JobSeries(JobSeriesBase):
+    id: str
+    group_id: str
+    class Config:
+        from_attributes = True
+
+class JobPositionBase(BaseModel):
+    title: str
+    grade: Optional[JobGrade] = None
+    is_future_model: bool = False
+    start_date: Optional[date] = None
+
+class JobPositionCreate(JobPositionBase):
+    series_id: str
+
+class JobPositionUpdate(JobPositionBase):
+    pass
+
+class JobPosition(JobPositionBase):
+    id: str
+    series_id: str
+    class Config:
+        from_attributes = True
+
+class JobTaskBase(BaseModel):
+    task_name: str
+    action_verb: Optional[str] = None
+    task_object: Optional[str] = None
+    ai_substitution: float = 0.0
+    ai_augmentation: float = 0.0
+    ai_generation: float = 0.0
 
 class JobTaskCreate(JobTaskBase):
+    job_position_id: str
+
+class JobTaskUpdate(JobTaskBase):
     pass
 
 class JobTask(JobTaskBase):
     id: str
-    job_id: str
+    job_position_id: str
     class Config:
         from_attributes = True
 
@@ -52,6 +228,97 @@ class JobRequirement(JobRequirementBase):
     class Config:
         from_attributes = True
 
+# --- Workflow & Work Items ---
+class TaskDependencyBase(BaseModel):
+    dependency_type: DependencyType
+    description: Optional[str] = None
+
+class TaskDependencyCreate(TaskDependencyBase):
+    source_task_id: str
+    target_task_id: str
+
+class TaskDependency(TaskDependencyBase):
+    id: str
+    source_task_id: str
+    target_task_id: str
+    class Config:
+        from_attributes = True
+
+class WorkItemBase(BaseModel):
+    name: str
+    code: Optional[str] = None
+    frequency: Optional[TaskFrequency] = None
+    seasonal_details: Optional[str] = None
+    estimated_hours_per_occurrence: Optional[float] = None
+    workload_amount: Optional[float] = None
+
+class WorkItemCreate(WorkItemBase):
+    job_task_id: str
+
+class WorkItemUpdate(WorkItemBase):
+    pass
+
+class WorkItem(WorkItemBase):
+    id: str
+    job_task_id: str
+    class Config:
+        from_attributes = True
+
+# --- Workload & Survey ---
+class SurveyPeriodBase(BaseModel):
+    name: str
+    start_date: datetime
+    end_date: datetime
+    status: SurveyStatus = SurveyStatus.DRAFT
+
+class SurveyPeriodCreate(SurveyPeriodBase):
+    institution_id: str
+
+class SurveyPeriod(SurveyPeriodBase):
+    id: str
+    institution_id: str
+    class Config:
+        from_attributes = True
+
+class WorkloadEntryBase(BaseModel):
+    volume: float
+    standard_time: float
+    fte: float
+
+class WorkloadEntryCreate(WorkloadEntryBase):
+    user_id: str
+    task_id: str
+    survey_period_id: Optional[str] = None
+
+class WorkloadEntry(WorkloadEntryBase):
+    id: str
+    user_id: str
+    task_id: str
+    survey_period_id: Optional[str] = None
+    class Config:
+        from_attributes = True
+
+# Bulk submission: rows are validated one by one so a bad row does not reject the whole batch
+class WorkloadEntryBulkItem(BaseModel):
+    user_id: str
+    task_id: str
+    volume: float
+    standard_time: float
+    survey_period_id: Optional[str] = None
+
+class WorkloadEntryBulkCreate(BaseModel):
+    entries: List[Dict[str, Any]]
+
+class WorkloadEntryBulkError(BaseModel):
+    index: int
+    detail: str
+
+class WorkloadEntryBulkResult(BaseModel):
+    inserted: int
+    failed: int
+    ids: List[str] = []
+    errors: List[WorkloadEntryBulkError] = []
+
 # --- AI & Audit Logs ---
 class FairnessAuditLogBase(BaseModel):
     check_type: str
@@ -64,30 +331,42 @@ class FairnessAuditLog(FairnessAuditLogBase):
     class Config:
         from_attributes = True
 
-# --- Job Position ---
-class JobPositionBase(BaseModel):
-    title: str
-    summary: Optional[str] = None
-    strategic_goal_link: Optional[str] = None
-    ncs_code_id: Optional[str] = None
+# --- Headcount Management ---
+class HeadcountPlanBase(BaseModel):
+    year: int
+    authorized_count: float
+    current_count: float
+    required_count: float
 
-class JobPositionCreate(JobPositionBase):
-    pass
+class HeadcountPlanCreate(HeadcountPlanBase):
+    institution_id: str
+    org_unit_id: Optional[str] = None
 
-class JobPosition(JobPositionBase):
+class HeadcountPlan(HeadcountPlanBase):
     id: str
-    creation_source: AISource
-    ai_confidence_score: float
-    grade_prediction: Optional[JobGrade] = None
-    
-    tasks: List[JobTask] = []
-    requirements: List[JobRequirement] = []
-    audit_logs: List[FairnessAuditLog] = []
-    
+    institution_id: str
+    org_unit_id: Optional[str] = None
     class Config:
         from_attributes = True
 
-# --- Job Evaluation Schemas ---
+# --- Productivity ---
+class FinancialPerformanceBase(BaseModel):
+    year: int
+    revenue: float
+    operating_expenses: float
+    personnel_costs: float
+
+class FinancialPerformanceCreate(FinancialPerformanceBase):
+    institution_id: str
+
+class FinancialPerformance(FinancialPerformanceBase):
+    id: str
+    institution_id: str
+    net_income: float
+    class Config:
+        from_attributes = True
+
+# --- Job Evaluation ---
 class JobEvaluationCriteriaBase(BaseModel):
     category: str
     name: str
@@ -110,17 +389,138 @@ class JobEvaluationScore(JobEvaluationScoreBase):
         from_attributes = True
 
 class JobEvaluationBase(BaseModel):
-    total_score: float = 0.0
-    final_grade: Optional[JobGrade] = None
-    ai_suggested_grade: Optional[JobGrade] = None
-    evaluator_comment: Optional[str] = None
+    score_expertise: float
+    score_responsibility: float
+    score_complexity: float
+    total_score: float
+    grade: Optional[JobGrade] = None
 
 class JobEvaluationCreate(JobEvaluationBase):
-    scores: List[JobEvaluationScoreBase]
+    job_position_id: str
 
 class JobEvaluation(JobEvaluationBase):
     id: str
-    job_id: str
-    scores: List[JobEvaluationScore] = []
+    job_position_id: str
+    class Config:
+        from_attributes = True
+
+# --- Evaluation Session (Committee Matrix) ---
+class EvaluationSessionBase(BaseModel):
+    name: str
+    start_date: date
+    end_date: Optional[date] = None
+    status: str = "DRAFT"
+    institution_id: Optional[str] = None
+
+class EvaluationSessionCreate(EvaluationSessionBase):
+    pass
+
+class EvaluationSession(EvaluationSessionBase):
+    id: str
+    class Config:
+        from_attributes = True
+
+class EvaluationCriteriaBase(BaseModel):
+    name: str
+    category: Optional[str] = None
+    weight: float = 1.0
+    description: Optional[str] = None
+
+class EvaluationCriteriaCreate(EvaluationCriteriaBase):
+    session_id: str
+
+class EvaluationCriteria(EvaluationCriteriaBase):
+    id: str
+    session_id: str
+    class Config:
+        from_attributes = True
+
+class EvaluationAssignmentBase(BaseModel):
+    session_id: str
+    rater_user_id: str
+    target_job_position_id: str
+
+class EvaluationAssignmentCreate(EvaluationAssignmentBase):
+    pass
+
+class EvaluationAssignment(EvaluationAssignmentBase):
+    id: str
+    class Config:
+        from_attributes = True
+
+class JobEvaluationScoreCreate(BaseModel):
+    evaluation_id: str
+    rater_type: RaterType
+    rater_user_id: Optional[str] = None
+    factor_scores: Dict[str, float] = {}
+
+class MatrixRatingEntry(BaseModel):
+    job_position_id: str
+    factor_scores: Dict[str, float] = {}
+
+class MatrixSubmission(BaseModel):
+    session_id: str
+    rater_type: RaterType
+    rater_user_id: Optional[str] = None # None for external raters
+    ratings: List[MatrixRatingEntry] = []
+
+class MatrixSubmissionResult(BaseModel):
+    processed_count: int
+    session_id: str
+    analysis: Optional[Dict[str, Any]] = None # dry_run only
+    dry_run: bool = False
+
+# --- Employee Experience (Pulse) ---
+class PulseCheckBase(BaseModel):
+    mood_score: int # 1-5
+    workload_level: Optional[PulseWorkloadLevel] = None
+    note: Optional[str] = None
+
+class PulseCheckCreate(PulseCheckBase):
+    pass
+
+class PulseCheck(PulseCheckBase):
+    id: str
+    user_id: str
+    date: date
+    class Config:
+        from_attributes = True
+
+# --- Performance Review ---
+class PerformanceReviewBase(BaseModel):
+    year: int
+    status: ReviewStatus = ReviewStatus.DRAFT
+    review_date: Optional[date] = None
+    score_common: float = 0.0
+    score_leadership: float = 0.0
+    score_job: float = 0.0
+    total_score: float = 0.0
+    grade: Optional[str] = None
+
+class PerformanceReviewCreate(PerformanceReviewBase):
+    user_id: str
+
+class PerformanceReview(PerformanceReviewBase):
+    id: str
+    user_id: str
+    class Config:
+        from_attributes = True
+
+# --- Promotion ---
+class PromotionListBase(BaseModel):
+    target_grade: JobGrade
+    rank: int
+    total_points: float
+    score_performance: float = 0.0
+    score_experience: float = 0.0
+    score_language: float = 0.0
+    score_training: float = 0.0
+
+class PromotionListCreate(PromotionListBase):
+    user_id: str
+
+class PromotionList(PromotionListBase):
+    id: str
+    user_id: str
     class Config:
         from_attributes = True
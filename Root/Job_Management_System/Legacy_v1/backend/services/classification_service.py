@@ -0,0 +1,324 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import bindparam, event, insert, select, update
+from sqlalchemy.orm import Session
+from .. import models
+from .search_sync import mark_search_changed
+
+# Job classification views (JobGroup > JobSeries > JobPosition > JobTask > WorkItem)
+# 다섯 단계 트리를 한 번의 평탄한 조인 쿼리로 읽고 한 번의 순회로 조립한다.
+# 결과는 기관(샤드) 단위로 JSON 바이트째 캐시하고, 분류 체계 쓰기가 커밋될 때마다 버전을 올려 무효화한다.
+# 워커가 여러 개면 커밋한 프로세스가 버전 스탬프 파일(CLASSIFICATION_VERSION_PATH)을 새로 쓰고,
+# 다른 워커는 요청 시 (최대 1초에 한 번) 파일이 바뀌었는지 보고 캐시를 비운다 (SharedIndex 와 같은 방식).
+# 스탬프를 거치지 않는 쓰기(다른 호스트, 직접 SQL)는 CLASSIFICATION_CACHE_TTL 이 지나면 반영된다.
+# ETag 는 내용 해시라서 프로세스가 달라도 같은 트리면 같은 값이 나온다.
+
+CLASSIFICATION_MODELS = (models.JobGroup, models.JobSeries, models.JobPosition, models.JobTask, models.WorkItem)
+CACHE_SIZE = 256
+CACHE_TTL = float(os.getenv("CLASSIFICATION_CACHE_TTL", "60"))  # seconds
+VERSION_STAMP_PATH = os.getenv("CLASSIFICATION_VERSION_PATH") or None
+STAMP_CHECK_INTERVAL = 1.0  # seconds
+MATRIX_LEVELS = ("groups", "series", "positions", "tasks", "work_items")
+IN_CHUNK = 500  # IN (...) 목록 크기 제한 (SQLite 바인드 변수 한도)
+
+def _chunks(values: Iterable, size: int = IN_CHUNK):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+class ClassificationCache:
+    """
+    Serialized classification views per (scope, view), valid for ttl seconds while the version is unchanged.
+    The version follows this process's commits and, when stamp_path is set, the commits of other workers.
+    """
+
+    def __init__(self, size: int = CACHE_SIZE, ttl: float = CACHE_TTL, stamp_path: Optional[str] = VERSION_STAMP_PATH,
+                 check_interval: float = STAMP_CHECK_INTERVAL):
+        self.size = size
+        self.ttl = ttl
+        self.stamp_path = stamp_path
+        self.check_interval = check_interval
+        self.version = 0
+        self._entries: "OrderedDict[Tuple[Optional[str], str], Tuple[int, float, str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stamp_key = self._read_stamp()
+        self._checked_at = time.monotonic()
+
+    def _read_stamp(self):
+        if not self.stamp_path:
+            return None
+        try:
+            stat = os.stat(self.stamp_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _write_stamp(self):
+        # 임시 파일 + os.replace: 매번 새 inode 라서 같은 mtime 틱 안의 연속 커밋도 구분된다
+        tmp_path = f"{self.stamp_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(uuid.uuid4().hex)
+        os.replace(tmp_path, self.stamp_path)
+        return self._read_stamp()
+
+    def _invalidate(self):
+        self.version += 1
+        self._entries.clear()
+
+    def _sync_stamp(self, now: float):
+        """Picks up commits of other workers (caller holds the lock)."""
+        if not self.stamp_path or now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        stamp_key = self._read_stamp()
+        if stamp_key != self._stamp_key:
+            self._stamp_key = stamp_key
+            self._invalidate()
+
+    def bump(self):
+        with self._lock:
+            self._invalidate()
+            if self.stamp_path:
+                self._stamp_key = self._write_stamp()
+
+    def get_or_build(self, scope: Optional[str], view: str, build: Callable[[], Any]) -> Tuple[str, bytes]:
+        key = (scope, view)
+        now = time.monotonic()
+        with self._lock:
+            self._sync_stamp(now)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == self.version and entry[1] > now:
+                self._entries.move_to_end(key)
+                return entry[2], entry[3]
+            version = self.version
+        # 잠금 밖에서 조립: 그 사이에 쓰기가 있으면 버전이 달라져 다음 요청에서 다시 만든다
+        body = json.dumps(jsonable_encoder(build()), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        with self._lock:
+            if version == self.version:
+                self._entries[key] = (version, now + self.ttl, etag, body)
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+        return etag, body
+
+classification_cache = ClassificationCache()
+
+def mark_classification_changed(session: Session):
+    """For writes that bypass the flush (Core insert/update): invalidate the cache when the session commits."""
+    session.info["classification_changed"] = True
+
+@event.listens_for(Session, "after_flush")
+def _mark_classification_write(session, flush_context):
+    for objects in (session.new, session.dirty, session.deleted):
+        if any(isinstance(obj, CLASSIFICATION_MODELS) for obj in objects):
+            mark_classification_changed(session)
+            return
+
+@event.listens_for(Session, "after_commit")
+def _bump_classification_version(session):
+    if session.info.pop("classification_changed", False):
+        classification_cache.bump()
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_classification_write(session, previous_transaction):
+    session.info.pop("classification_changed", None)
+
+class ClassificationService:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _rows(self, outer: bool):
+        """One flat query over the five levels (outer joins keep empty branches for the tree view)."""
+        G, S, P, T, W = CLASSIFICATION_MODELS
+        join = "outerjoin" if outer else "join"
+        query = select(
+            G.id.label("group_id"), G.name.label("group_name"),
+            S.id.label("series_id"), S.name.label("series_name"), S.ncs_code,
+            P.id.label("position_id"), P.title, P.grade,
+            T.id.label("task_id"), T.task_name,
+            W.id.label("item_id"), W.name.label("item_name"), W.frequency,
+        ).select_from(G)
+        query = getattr(query, join)(S, S.group_id == G.id)
+        query = getattr(query, join)(P, P.series_id == S.id)
+        query = getattr(query, join)(T, T.job_position_id == P.id)
+        query = query.outerjoin(W, W.job_task_id == T.id)
+        return self.db.execute(query.order_by(G.name, G.id, S.name, S.id, P.title, P.id, T.task_name, T.id, W.name, W.id)).all()
+
+    def get_hierarchy(self) -> List[Dict[str, Any]]:
+        hierarchy = []
+        nodes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        def child(parent_children, level, key, make):
+            node = nodes.get((level, key))
+            if node is None:
+                node = nodes[(level, key)] = make()
+                parent_children.append(node)
+            return node
+
+        for row in self._rows(outer=True):
+            group = child(hierarchy, "GROUP", row.group_id, lambda: {
+                "id": row.group_id, "name": row.group_name, "type": "GROUP", "children": []
+            })
+            if row.series_id is None:
+                continue
+            series = child(group["children"], "SERIES", row.series_id, lambda: {
+                "id": row.series_id, "name": row.series_name, "type": "SERIES", "ncs_code": row.ncs_code, "children": []
+            })
+            if row.position_id is None:
+                continue
+            position = child(series["children"], "POSITION", row.position_id, lambda: {
+                "id": row.position_id, "name": row.title, "type": "POSITION", "grade": row.grade, "children": []
+            })
+            if row.task_id is None:
+                continue
+            task = child(position["children"], "TASK", row.task_id, lambda: {
+                "id": row.task_id, "name": row.task_name, "type": "TASK", "children": []
+            })
+            if row.item_id is not None:
+                task["children"].append({
+                    "id": row.item_id, "name": row.item_name, "type": "WORK_ITEM", "frequency": row.frequency
+                })
+        return hierarchy
+
+    def get_matrix(self) -> List[Dict[str, Any]]:
+        # Tasks without work items still get a row (work_item_name / frequency = None)
+        return [
+            {
+                "group_name": row.group_name,
+                "series_name": row.series_name,
+                "position_title": row.title,
+                "position_grade": row.grade,
+                "task_name": row.task_name,
+                "work_item_name": row.item_name,
+                "frequency": row.frequency
+            }
+            for row in self._rows(outer=False)
+        ]
+
+    def save_matrix(self, items) -> Dict[str, Dict[str, int]]:
+        """
+        Upserts an Excel-style matrix (one row per work item, matched by names along the hierarchy).
+        Existing name -> ID maps are preloaded level by level, the diff is computed in memory and applied
+        with one executemany INSERT / UPDATE per level, in a single transaction.
+        Returns {level: {"created": n, "updated": n}}.
+        """
+        G, S, P, T, W = CLASSIFICATION_MODELS
+        inserts: Dict[str, List[Dict[str, Any]]] = {level: [] for level in MATRIX_LEVELS}
+
+        def resolve(known, key, level, make_row):
+            """Existing id for key, or a new id queued for insert. New keys map to their insert row."""
+            found = known.get(key)
+            if found is None:
+                found = known[key] = make_row(models.generate_uuid())
+                inserts[level].append(found)
+            return found
+
+        def existing(known):
+            return {entry["id"] for entry in known.values()} - {row["id"] for level in inserts.values() for row in level}
+
+        # 1. Job Group
+        groups = {}
+        for chunk in _chunks({item.group_name for item in items}):
+            for row in self.db.execute(select(G.name, G.id).where(G.name.in_(chunk))):
+                groups.setdefault(row.name, {"id": row.id})
+        group_ids = [
+            resolve(groups, item.group_name, "groups", lambda new_id: {"id": new_id, "name": item.group_name})["id"]
+            for item in items
+        ]
+
+        # 2. Job Series
+        series = {}
+        for chunk in _chunks(existing(groups)):
+            for row in self.db.execute(select(S.group_id, S.name, S.id).where(S.group_id.in_(chunk))):
+                series.setdefault((row.group_id, row.name), {"id": row.id})
+        series_ids = [
+            resolve(series, (group_id, item.series_name), "series",
+                    lambda new_id: {"id": new_id, "group_id": group_id, "name": item.series_name})["id"]
+            for item, group_id in zip(items, group_ids)
+        ]
+
+        # 3. Job Position (grade is updated when the row carries one)
+        positions = {}
+        for chunk in _chunks(existing(series)):
+            for row in self.db.execute(select(P.series_id, P.title, P.id, P.grade).where(P.series_id.in_(chunk))):
+                stored = {"grade": _value(row.grade)}
+                positions.setdefault((row.series_id, row.title), {"id": row.id, **stored, "stored": stored})
+        position_ids = []
+        for item, series_id in zip(items, series_ids):
+            position = resolve(positions, (series_id, item.position_title), "positions",
+                               lambda new_id: {"id": new_id, "series_id": series_id, "title": item.position_title,
+                                               "grade": item.position_grade})
+            if item.position_grade:
+                position["grade"] = item.position_grade
+            position_ids.append(position["id"])
+
+        # 4. Job Task
+        tasks = {}
+        for chunk in _chunks(existing(positions)):
+            for row in self.db.execute(select(T.job_position_id, T.task_name, T.id).where(T.job_position_id.in_(chunk))):
+                tasks.setdefault((row.job_position_id, row.task_name), {"id": row.id})
+        task_ids = [
+            resolve(tasks, (position_id, item.task_name), "tasks",
+                    lambda new_id: {"id": new_id, "job_position_id": position_id, "task_name": item.task_name})["id"]
+            for item, position_id in zip(items, position_ids)
+        ]
+
+        # 5. Work Item (frequency / hours follow the latest row, as before)
+        work_items = {}
+        for chunk in _chunks(existing(tasks)):
+            for row in self.db.execute(
+                select(W.job_task_id, W.name, W.id, W.frequency, W.estimated_hours_per_occurrence).where(W.job_task_id.in_(chunk))
+            ):
+                stored = {"frequency": _value(row.frequency), "estimated_hours_per_occurrence": row.estimated_hours_per_occurrence}
+                work_items.setdefault((row.job_task_id, row.name), {"id": row.id, **stored, "stored": stored})
+        for item, task_id in zip(items, task_ids):
+            if not item.work_item_name:
+                continue
+            values = {"frequency": item.frequency, "estimated_hours_per_occurrence": item.workload}
+            work_item = resolve(work_items, (task_id, item.work_item_name), "work_items",
+                                lambda new_id: {"id": new_id, "job_task_id": task_id, "name": item.work_item_name, **values})
+            work_item.update(values)
+
+        # Updates: stored rows whose final values differ from the database (repeated rows: the last one wins)
+        updates = {
+            level: [
+                {"_id": entry["id"], **{key: entry[key] for key in entry["stored"]}}
+                for entry in known.values()
+                if "stored" in entry and any(entry[key] != value for key, value in entry["stored"].items())
+            ]
+            for level, known in (("positions", positions), ("work_items", work_items))
+        }
+
+        # Apply: parents before children, one executemany per level
+        summary = {level: {"created": len(inserts[level]), "updated": len(updates.get(level, []))} for level in MATRIX_LEVELS}
+        for level, model in zip(MATRIX_LEVELS, CLASSIFICATION_MODELS):
+            if inserts[level]:
+                # render_nulls: rows with a None grade / frequency stay in the same executemany batch
+                self.db.execute(insert(model).execution_options(render_nulls=True), inserts[level])
+        for level, model in (("positions", P), ("work_items", W)):
+            rows = updates[level]
+            if rows:
+                table = model.__table__
+                self.db.execute(
+                    update(table).where(table.c.id == bindparam("_id"))
+                    .values({name: bindparam(name) for name in rows[0] if name != "_id"}),
+                    rows
+                )
+
+        mark_classification_changed(self.db)
+        # 새 직위 / 과업은 /ai/search 인덱스 대상 (기존 행은 이름이 키라서 색인 텍스트가 바뀌지 않는다)
+        mark_search_changed(self.db, P, (row["id"] for row in inserts["positions"]))
+        mark_search_changed(self.db, T, (row["id"] for row in inserts["tasks"]))
+        self.db.commit()
+        return summary
+
+def _value(enum_or_str):
+    return getattr(enum_or_str, "value", enum_or_str)
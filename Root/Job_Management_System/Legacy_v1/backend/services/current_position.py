@@ -0,0 +1,24 @@
+from sqlalchemy import func, select
+from .. import models
+
+# Current position rule
+# 사용자별 "현재 직위" 는 미래모델이 아닌 직위 중 start_date 가 가장 최근인 것이다.
+# start_date 가 없는 직위는 날짜가 있는 직위보다 뒤로 밀리고, id 는 완전히 같은 경우의 tie-breaker 일 뿐이다.
+# (UUID id 의 MIN 은 임의의 직위를 고르므로 순서 기준으로 쓰지 않는다.)
+# career / analytics / span / dashboard 가 모두 이 규칙 하나를 쓴다.
+
+Position = models.JobPosition
+
+CURRENT_POSITION_ORDER = (Position.start_date.desc().nulls_last(), Position.id)
+
+def current_positions(*criteria, name: str = "current_position"):
+    """
+    Subquery of (user_id, position_id): each user's current position.
+    `criteria` narrow the positions considered (e.g. Position.user_id.in_(ids)).
+    """
+    ranked = select(
+        Position.user_id,
+        Position.id.label("position_id"),
+        func.row_number().over(partition_by=Position.user_id, order_by=CURRENT_POSITION_ORDER).label("rn"),
+    ).where(Position.user_id != None, Position.is_future_model.is_not(True), *criteria).subquery(f"ranked_{name}")
+    return select(ranked.c.user_id, ranked.c.position_id).where(ranked.c.rn == 1).subquery(name)
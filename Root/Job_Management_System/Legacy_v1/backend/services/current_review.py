@@ -0,0 +1,88 @@
+from typing import Iterable, Optional
+from sqlalchemy import delete, event, func, insert, inspect, select
+from sqlalchemy.orm import Session
+from .. import models
+
+# Current review projection maintenance
+# current_reviews 는 사용자별 "최신 평가" 포인터를 들고 있는 투영 테이블이다.
+#   - review_id       : 상태와 무관한 최신 평가 (career / reporting)
+#   - final_review_id : 최신 FINAL 평가 (NineBoxService)
+# PerformanceReview 가 추가/수정/삭제되면 해당 사용자들의 행만 ROW_NUMBER 로 다시 계산한다.
+# 삭제는 FK 때문에 before_flush 에서 먼저 포인터를 지우고, after_flush 에서 남은 평가로 다시 채운다.
+
+Current = models.CurrentReview
+PR = models.PerformanceReview
+
+def _latest(user_ids: Optional[set], final_only: bool):
+    ranked = select(
+        PR.user_id,
+        PR.id.label("review_id"),
+        func.row_number().over(partition_by=PR.user_id, order_by=(PR.year.desc(), PR.id)).label("rn"),
+    ).where(PR.user_id != None)
+    if user_ids is not None:
+        ranked = ranked.where(PR.user_id.in_(user_ids))
+    if final_only:
+        ranked = ranked.where(PR.status == models.ReviewStatus.FINAL)
+    ranked = ranked.subquery("ranked_final" if final_only else "ranked")
+    return select(ranked.c.user_id, ranked.c.review_id).where(ranked.c.rn == 1).subquery(
+        "latest_final" if final_only else "latest"
+    )
+
+def refresh_users(conn, user_ids: Optional[Iterable[Optional[str]]] = None):
+    """Recomputes the projection rows of the given users (every user when user_ids is None)."""
+    if user_ids is not None:
+        user_ids = {user_id for user_id in user_ids if user_id}
+        if not user_ids:
+            return
+        conn.execute(delete(Current).where(Current.user_id.in_(user_ids)))
+    else:
+        conn.execute(delete(Current))
+
+    latest = _latest(user_ids, final_only=False)
+    final = _latest(user_ids, final_only=True)
+    conn.execute(insert(Current).from_select(
+        ["user_id", "review_id", "final_review_id"],
+        select(latest.c.user_id, latest.c.review_id, final.c.review_id)
+        .join(models.User, models.User.id == latest.c.user_id)
+        .outerjoin(final, final.c.user_id == latest.c.user_id),
+    ))
+
+def rebuild(db: Session) -> int:
+    """
+    Recomputes the whole projection.
+    Needed once for existing databases and after bulk loads that bypass the ORM (insert(models.PerformanceReview) executemany).
+    """
+    refresh_users(db.connection())
+    db.commit()
+    return db.query(func.count()).select_from(Current).scalar()
+
+def _user_ids(obj):
+    history = inspect(obj).attrs.user_id.history
+    return list(history.added) + list(history.deleted) + list(history.unchanged)
+
+@event.listens_for(Session, "before_flush")
+def _release_deleted_reviews(session, flush_context, instances):
+    # current_reviews references performance_reviews.id / users.id, so pointers go before the rows are deleted
+    user_ids = set()
+    for obj in session.deleted:
+        if isinstance(obj, PR):
+            user_ids.update(_user_ids(obj))
+        elif isinstance(obj, models.User):
+            user_ids.add(obj.id)
+    user_ids.discard(None)
+    if user_ids:
+        session.connection().execute(delete(Current).where(Current.user_id.in_(user_ids)))
+
+@event.listens_for(Session, "after_flush")
+def _maintain_current_reviews(session, flush_context):
+    user_ids = set()
+    for obj in session.dirty:  # session.dirty is rebuilt on every access: read it once
+        if isinstance(obj, PR):
+            state = inspect(obj)
+            if any(state.attrs[attr].history.has_changes() for attr in ("user_id", "year", "status")):
+                user_ids.update(_user_ids(obj))
+    for obj in list(session.new) + list(session.deleted):
+        if isinstance(obj, PR):
+            user_ids.update(_user_ids(obj))
+    if user_ids:
+        refresh_users(session.connection(), user_ids)
@@ -0,0 +1,165 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session
+from .. import models
+from .current_position import current_positions
+
+# Personal dashboard ("My Job Dashboard")
+# 출근 시간대에 전 직원이 동시에 여는 첫 화면이라, 사용자별로 조립 결과를 캐시한다.
+#   - 목표(PerformanceGoal / PerformanceReview), 교육 이수(EmployeeTraining) 쓰기가 커밋되면 해당 사용자 항목만 지운다.
+#   - TrainingProgram 교육 시간이 바뀌면 여러 사용자에 걸치므로 전체를 비운다.
+#   - 펄스 응답은 쓰기 엔드포인트에서 invalidate() 를 직접 호출한다.
+# "오늘의 펄스" 가 날짜에 따라 달라지므로 항목은 날짜가 바뀌면 무효이고, 직위/부서 변경은 TTL 로 따라간다.
+
+CACHE_SIZE = 10000
+DASHBOARD_TTL = 300  # seconds
+PULSE_EMOJIS = {1: "😫", 2: "😞", 3: "😐", 4: "🙂", 5: "😁"}
+
+class DashboardCache:
+    """Built dashboards per user, valid for the day and DASHBOARD_TTL seconds or until invalidated."""
+
+    def __init__(self, size: int = CACHE_SIZE, ttl: float = DASHBOARD_TTL):
+        self.size = size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[date, float, Dict[str, Any]]]" = OrderedDict()
+        self._generation = 0  # invalidation counter: a build that raced with an invalidation is not stored
+        self._lock = threading.Lock()
+
+    def get_or_build(self, user_id: str, build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        today, now = date.today(), time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] == today and entry[1] > now:
+                self._entries.move_to_end(user_id)
+                return entry[2]
+            generation = self._generation
+        # 잠금 밖에서 조립: 그 사이에 무효화가 있었으면 저장하지 않는다
+        dashboard = build()
+        with self._lock:
+            if generation == self._generation:
+                self._entries[user_id] = (today, now + self.ttl, dashboard)
+                self._entries.move_to_end(user_id)
+                if len(self._entries) > self.size:
+                    self._entries.popitem(last=False)
+        return dashboard
+
+    def invalidate(self, user_ids: Iterable[str]):
+        with self._lock:
+            self._generation += 1
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __contains__(self, user_id: str) -> bool:
+        with self._lock:
+            return user_id in self._entries
+
+dashboard_cache = DashboardCache()
+
+# --- Invalidation ---
+def _values(obj, attr: str):
+    history = inspect(obj).attrs[attr].history
+    return list(history.added) + list(history.deleted) + list(history.unchanged)
+
+@event.listens_for(Session, "after_flush")
+def _collect_dashboard_writes(session, flush_context):
+    user_ids, review_ids, all_users = set(), set(), False
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):  # session.dirty: read once
+        if isinstance(obj, (models.EmployeeTraining, models.PerformanceReview, models.PulseCheck)):
+            user_ids.update(_values(obj, "user_id"))
+        elif isinstance(obj, models.PerformanceGoal):
+            review_ids.update(_values(obj, "review_id"))
+        elif isinstance(obj, models.TrainingProgram):
+            all_users = True
+    review_ids.discard(None)
+    if review_ids:
+        PR = models.PerformanceReview
+        user_ids.update(session.connection().execute(select(PR.user_id).where(PR.id.in_(review_ids))).scalars())
+    user_ids.discard(None)
+    if all_users:
+        session.info["dashboard_all"] = True
+    if user_ids:
+        session.info.setdefault("dashboard_users", set()).update(user_ids)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_dashboards(session):
+    user_ids = session.info.pop("dashboard_users", None)
+    if session.info.pop("dashboard_all", False):
+        dashboard_cache.clear()
+    elif user_ids:
+        dashboard_cache.invalidate(user_ids)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_dashboard_writes(session, previous_transaction):
+    session.info.pop("dashboard_users", None)
+    session.info.pop("dashboard_all", None)
+
+# --- Queries ---
+def dashboard_stats(db: Session, user_id: str) -> Dict[str, Any]:
+    """Goal count and completed training hours in one query (hours summed in SQL)."""
+    goals = select(func.count(models.PerformanceGoal.id))\
+        .join(models.PerformanceReview, models.PerformanceGoal.review_id == models.PerformanceReview.id)\
+        .where(models.PerformanceReview.user_id == user_id)\
+        .scalar_subquery()
+    hours = select(func.coalesce(func.sum(models.TrainingProgram.duration_hours), 0.0))\
+        .select_from(models.EmployeeTraining)\
+        .join(models.TrainingProgram, models.EmployeeTraining.program_id == models.TrainingProgram.id)\
+        .where(
+            models.EmployeeTraining.user_id == user_id,
+            models.EmployeeTraining.status == models.TrainingStatus.COMPLETED
+        ).scalar_subquery()
+    row = db.execute(select(goals.label("goals"), hours.label("training_hours"))).one()
+    return {"goals_completed": row.goals, "training_hours": round(row.training_hours, 1)}
+
+def build_dashboard(db: Session, user_id: str) -> Optional[Dict[str, Any]]:
+    """Dashboard of one user: profile, stats, today's pulse and key tasks in 4 queries."""
+    # 1. Job / Org Info (current position, services/current_position.py)
+    current = current_positions(models.JobPosition.user_id == user_id)
+    profile = db.query(models.User.name, models.OrgUnit.name.label("department"),
+                       models.JobPosition.id.label("position_id"), models.JobPosition.title)\
+        .outerjoin(models.OrgUnit, models.User.org_unit_id == models.OrgUnit.id)\
+        .outerjoin(current, current.c.user_id == models.User.id)\
+        .outerjoin(models.JobPosition, models.JobPosition.id == current.c.position_id)\
+        .filter(models.User.id == user_id)\
+        .first()
+    if profile is None:
+        return None
+
+    # 2. Stats: Goals / Training Hours
+    stats = dashboard_stats(db, user_id)
+
+    # 3. Pulse Score (Today's Mood)
+    mood = db.query(models.PulseCheck.mood_score).filter(
+        models.PulseCheck.user_id == user_id,
+        models.PulseCheck.date == date.today()
+    ).limit(1).scalar()
+    stats["pulse_score"] = PULSE_EMOJIS.get(mood, "🙂") if mood is not None else "N/A"
+
+    # 4. Key Tasks
+    tasks = []
+    if profile.position_id:
+        tasks = db.query(models.JobTask.task_name)\
+            .filter(models.JobTask.job_position_id == profile.position_id)\
+            .limit(5).all()
+
+    return {
+        "user": {
+            "name": profile.name,
+            "title": profile.title or "Unassigned",
+            "department": profile.department or "Unassigned"
+        },
+        "stats": stats,
+        "key_tasks": [t.task_name for t in tasks],
+        "notifications": [
+            {"id": 1, "text": "Annual survey due in 3 days", "type": "warning"},
+            {"id": 2, "text": "New Python training available", "type": "info"}
+        ]
+    }
@@ -20,6 +20,18 @@ class EvaluationLogicService:
             models.EvaluationAssignment.rater_user_id == rater_user_id
         ).all()
 
+    @staticmethod
+    def get_assigned_job_ids(db: Session, session_id: str, rater_user_id: str, target_job_ids) -> set:
+        """Subset of target_job_ids the rater is assigned to (one query for a whole matrix)."""
+        if not target_job_ids:
+            return set()
+        rows = db.query(models.EvaluationAssignment.target_job_position_id).filter(
+            models.EvaluationAssignment.session_id == session_id,
+            models.EvaluationAssignment.rater_user_id == rater_user_id,
+            models.EvaluationAssignment.target_job_position_id.in_(target_job_ids)
+        ).all()
+        return {job_id for (job_id,) in rows}
+
     @staticmethod
     def validate_evaluation_access(db: Session, session_id: str, rater_user_id: str, target_job_id: str) -> bool:
         # Strict Mode: Must have assignment
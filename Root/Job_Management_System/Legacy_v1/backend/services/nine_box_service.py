@@ -1,48 +1,78 @@
 from typing import List, Dict, Any, Optional
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 from .. import models
 
 class NineBoxService:
+    # Score thresholds shared by the Python helpers and the SQL CASE expression
+    HIGH_CUTOFF = 80
+    MOD_CUTOFF = 60
+
     def __init__(self, db: Session):
         self.db = db
 
-    def get_grid_data(self) -> Dict[str, Any]:
+    def _latest_final_reviews(self):
         """
-        Fetches 9-Box Grid Data from the database.
+        Subquery: the latest FINAL review per user, read from the current_reviews projection.
+        Replaces the per-user "ORDER BY year DESC LIMIT 1" lookups.
         """
-        users = self.db.query(models.User).all()
-        grid_data = []
+        PR = models.PerformanceReview
+        return select(
+            PR.id.label("review_id"),
+            PR.user_id,
+            PR.total_score,
+            PR.score_potential,
+            PR.nine_box_position,
+        ).join(models.CurrentReview, models.CurrentReview.final_review_id == PR.id).subquery("latest_final")
 
-        for user in users:
-            # Get latest finalized review
-            review = self.db.query(models.PerformanceReview)\
-                .filter(models.PerformanceReview.user_id == user.id)\
-                .filter(models.PerformanceReview.status == models.ReviewStatus.FINAL)\
-                .order_by(models.PerformanceReview.year.desc())\
-                .first()
-            
-            if not review:
-                continue
+    def _box_expression(self, perf, pot):
+        """SQL version of _calculate_box_position: box = potential_row * 3 + performance_col + 1."""
+        perf = func.coalesce(perf, 0.0)
+        pot = func.coalesce(pot, 0.0)
+        row = case((pot >= self.HIGH_CUTOFF, 2), (pot >= self.MOD_CUTOFF, 1), else_=0)
+        col = case((perf >= self.HIGH_CUTOFF, 2), (perf >= self.MOD_CUTOFF, 1), else_=0)
+        return row * 3 + col + 1
+
+    def _grid_query(self):
+        """Latest FINAL review per user + user name + org unit name."""
+        ranked = self._latest_final_reviews()
+        return (
+            select(
+                models.User.id,
+                models.User.name,
+                models.OrgUnit.name.label("dept"),
+                ranked.c.review_id,
+                ranked.c.total_score,
+                ranked.c.score_potential,
+                ranked.c.nine_box_position,
+            )
+            .join(ranked, ranked.c.user_id == models.User.id)
+            .outerjoin(models.OrgUnit, models.OrgUnit.id == models.User.org_unit_id)
+        )
+
+    def _build_grid(self, rows) -> Dict[str, Any]:
+        grid_data = []
+        for row in rows:
+            performance = row.total_score or 0.0
+            potential = row.score_potential or 0.0
 
             # If box is not set, calculate it on the fly but don't save unless auto-map is called
-            box = review.nine_box_position
-            category = ""
-            color = ""
-            
+            box = row.nine_box_position
             if not box:
-                 box, category, color = self._calculate_box_position(review.total_score, review.score_potential)
+                 box, category, color = self._calculate_box_position(performance, potential)
             else:
                  # Get styling for existing box
                  _, category, color = self._get_box_metadata(box)
 
             grid_data.append({
-                "id": user.id,
-                "review_id": review.id,
-                "name": user.name,
-                "dept": user.org_unit.name if user.org_unit else "N/A",
-                "performance": review.total_score,
-                "potential": review.score_potential,
+                "id": row.id,
+                "review_id": row.review_id,
+                "name": row.name,
+                "dept": row.dept or "N/A",
+                "performance": row.total_score,
+                "potential": row.score_potential,
                 "box": box,
                 "category": category,
                 "color": color
@@ -59,41 +89,53 @@ class NineBoxService:
             "employees": grid_data
         }
 
+    def _auto_map_statement(self):
+        """
+        UPDATE ... SET nine_box_position = CASE ... over each user's latest FINAL review (current_reviews).
+        """
+        PR = models.PerformanceReview
+        latest_ids = select(models.CurrentReview.final_review_id).where(models.CurrentReview.final_review_id != None)
+        return (
+            update(PR)
+            .where(PR.id.in_(latest_ids))
+            .values(nine_box_position=self._box_expression(PR.total_score, PR.score_potential))
+            .execution_options(synchronize_session=False)
+        )
+
+    def _review_query(self, review_id: str):
+        # id 로 조회 (COMPACT_KEYS 에서는 PK 가 정수 pk 라 Session.get 을 쓸 수 없다)
+        return select(models.PerformanceReview).where(models.PerformanceReview.id == review_id)
+
+    def _moved(self, review, new_box: int):
+        if not review:
+            raise ValueError("Review not found")
+        review.nine_box_position = int(new_box)
+        _, category, color = self._get_box_metadata(new_box)
+        return {"id": review.id, "box": new_box, "category": category, "color": color}
+
+    def get_grid_data(self) -> Dict[str, Any]:
+        """
+        Fetches 9-Box Grid Data from the database.
+        One query: latest FINAL review per user + user name + org unit name.
+        """
+        return self._build_grid(self.db.execute(self._grid_query()).all())
+
     def auto_map_all(self):
         """
         Force resets all employees' 9-box position based on their scores.
+        Single UPDATE over each user's latest FINAL review.
         """
-        users = self.db.query(models.User).all()
-        count = 0
-        for user in users:
-            review = self.db.query(models.PerformanceReview)\
-                .filter(models.PerformanceReview.user_id == user.id)\
-                .filter(models.PerformanceReview.status == models.ReviewStatus.FINAL)\
-                .order_by(models.PerformanceReview.year.desc())\
-                .first()
-            
-            if review:
-                box, _, _ = self._calculate_box_position(review.total_score, review.score_potential)
-                review.nine_box_position = box
-                self.db.add(review)
-                count += 1
-        
+        result = self.db.execute(self._auto_map_statement())
         self.db.commit()
-        return {"updated_count": count}
+        return {"updated_count": result.rowcount}
 
     def update_box_position(self, review_id: str, new_box: int):
         """
         Manually moves an employee to a different box (Calibration).
         """
-        review = self.db.query(models.PerformanceReview).filter(models.PerformanceReview.id == review_id).first()
-        if not review:
-            raise ValueError("Review not found")
-            
-        review.nine_box_position = int(new_box)
+        moved = self._moved(self.db.execute(self._review_query(review_id)).scalar_one_or_none(), new_box)
         self.db.commit()
-        
-        _, category, color = self._get_box_metadata(new_box)
-        return {"id": review.id, "box": new_box, "category": category, "color": color}
+        return moved
 
     def _get_box_metadata(self, box: int):
         # Helper to get name/color for a box ID
@@ -120,8 +162,8 @@ class NineBoxService:
         """
         
         # Thresholds
-        HIGH_CUTOFF = 80
-        MOD_CUTOFF = 60
+        HIGH_CUTOFF = self.HIGH_CUTOFF
+        MOD_CUTOFF = self.MOD_CUTOFF
         
         box = 0
         category = ""
@@ -141,3 +183,28 @@ class NineBoxService:
             else: box = 1; category = "Risk / Exit"; color = "red"
             
         return box, category, color
+
+
+class AsyncNineBoxService(NineBoxService):
+    """
+    NineBoxService on an AsyncSession (async routers).
+    Same statements and grid assembly; every query is awaited through the async driver,
+    so the event loop is free while the database works.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_grid_data(self) -> Dict[str, Any]:
+        result = await self.db.execute(self._grid_query())
+        return self._build_grid(result.all())
+
+    async def auto_map_all(self):
+        result = await self.db.execute(self._auto_map_statement())
+        await self.db.commit()
+        return {"updated_count": result.rowcount}
+
+    async def update_box_position(self, review_id: str, new_box: int):
+        moved = self._moved((await self.db.execute(self._review_query(review_id))).scalar_one_or_none(), new_box)
+        await self.db.commit()
+        return moved
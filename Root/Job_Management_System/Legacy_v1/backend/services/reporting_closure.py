@@ -0,0 +1,98 @@
+from sqlalchemy import delete, event, func, insert, inspect, literal, select, text, true
+from sqlalchemy.orm import Session, aliased
+from .. import models
+
+# Reporting-line closure table maintenance
+# User.reports_to_id 가 바뀔 때마다 reporting_closure 를 갱신한다.
+#   - 신규 사용자: (self, self, 0) 행 추가 후 상사 밑으로 붙인다.
+#   - 상사 변경  : 기존 상위 조직 -> 하위 트리 경로를 지우고, 새 상사의 상위 경로와 하위 트리를 교차 결합해 추가한다.
+#   - 삭제       : 하위 트리를 분리한 뒤 자기 자신이 포함된 행을 지운다 (직속 부하는 루트가 된다). before_flush 에서 처리.
+# 트리 크기와 무관하게 변경당 몇 개의 집합 쿼리로 끝난다.
+
+Closure = models.ReportingClosure
+
+class ReportingCycleError(ValueError):
+    pass
+
+def _detach(conn, user_id: str):
+    """Removes every path from user_id's ancestors into user_id's subtree."""
+    subtree = select(Closure.descendant_id).where(Closure.ancestor_id == user_id)
+    ancestors = select(Closure.ancestor_id).where(Closure.descendant_id == user_id, Closure.ancestor_id != user_id)
+    conn.execute(delete(Closure).where(Closure.descendant_id.in_(subtree), Closure.ancestor_id.in_(ancestors)))
+
+def _attach(conn, user_id: str, manager_id: str):
+    """Connects user_id's subtree under manager_id (every ancestor of the manager x every descendant of the user)."""
+    if manager_id == user_id or conn.execute(
+        select(literal(1)).where(Closure.ancestor_id == user_id, Closure.descendant_id == manager_id)
+    ).first():
+        raise ReportingCycleError(f"Reporting line {user_id} -> {manager_id} would create a cycle")
+    up = aliased(Closure)
+    down = aliased(Closure)
+    conn.execute(insert(Closure).from_select(
+        ["ancestor_id", "descendant_id", "depth"],
+        select(up.ancestor_id, down.descendant_id, up.depth + down.depth + 1)
+        .select_from(up).join(down, true())  # intentional cross join
+        .where(up.descendant_id == manager_id, down.ancestor_id == user_id),
+    ))
+
+def move_user(conn, user_id: str, manager_id: str = None):
+    _detach(conn, user_id)
+    if manager_id:
+        _attach(conn, user_id, manager_id)
+
+def remove_user(conn, user_id: str):
+    _detach(conn, user_id)
+    conn.execute(delete(Closure).where((Closure.ancestor_id == user_id) | (Closure.descendant_id == user_id)))
+
+def rebuild(db: Session) -> int:
+    """
+    Recomputes the whole closure table with a recursive CTE.
+    Needed once for existing databases and after bulk loads that bypass the ORM (insert(models.User) executemany).
+    """
+    conn = db.connection()
+    conn.execute(delete(Closure))
+    conn.execute(text("""
+        INSERT INTO reporting_closure (ancestor_id, descendant_id, depth)
+        WITH RECURSIVE paths(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM users
+            UNION ALL
+            SELECT p.ancestor_id, u.id, p.depth + 1
+            FROM paths p JOIN users u ON u.reports_to_id = p.descendant_id
+            WHERE p.depth < :max_depth
+        )
+        SELECT ancestor_id, descendant_id, MIN(depth) FROM paths GROUP BY ancestor_id, descendant_id
+    """), {"max_depth": 10000})
+    db.commit()
+    return db.query(func.count()).select_from(Closure).scalar()
+
+@event.listens_for(Session, "before_flush")
+def _remove_deleted_users(session, flush_context, instances):
+    # Closure rows reference users.id, so they must go before the user row is deleted
+    deleted = [obj for obj in session.deleted if isinstance(obj, models.User)]
+    if deleted:
+        conn = session.connection()
+        for user in deleted:
+            remove_user(conn, user.id)
+
+@event.listens_for(Session, "after_flush")
+def _maintain_reporting_closure(session, flush_context):
+    new_users = [obj for obj in session.new if isinstance(obj, models.User)]
+    moved = []
+    for obj in session.dirty:
+        if isinstance(obj, models.User):
+            history = inspect(obj).attrs.reports_to_id.history
+            if history.has_changes():
+                moved.append(obj)
+    if not (new_users or moved):
+        return
+
+    conn = session.connection()
+    # Self rows first, then attach: order inside one flush does not matter because
+    # attaching always carries the whole current subtree along.
+    for user in new_users:
+        conn.execute(insert(Closure).values(ancestor_id=user.id, descendant_id=user.id, depth=0))
+    for user in new_users:
+        if user.reports_to_id:
+            _attach(conn, user.id, user.reports_to_id)
+    for user in moved:
+        move_user(conn, user.id, user.reports_to_id)
@@ -1,90 +1,282 @@
+import heapq
+import logging
 import math
 import re
+import threading
 from collections import defaultdict
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from scipy import sparse
+except ImportError:
+    logger.warning("scipy not installed. TFIDFEngine.search_many / document_term_matrix will be unavailable.")
+    sparse = None
+
+# minimal stopword list
+STOPWORDS = {'the', 'and', 'or', 'for', 'to', 'of', 'in', 'on', 'at', 'with', 'by', 'an', 'as', 'is'}
+# Document norms are refreshed lazily once this share of the corpus changed since the last refresh
+NORM_REFRESH_RATIO = 0.05
+NORM_REFRESH_MIN = 100
+# search_many() multiplies this many queries at a time (bounds the dense-ish score matrix of common terms)
+SEARCH_MANY_CHUNK = 256
+
+# Tokenizer modes
+WORDS = "words"  # English words only
+HANGUL_BIGRAM = "hangul-bigram"  # English words + Hangul syllable bigrams
+TOKENIZERS = (WORDS, HANGUL_BIGRAM)
+HANGUL_RUN = re.compile(r'[\uac00-\ud7a3]+')
+LATIN_WORD = re.compile(r'(?<![a-z])[a-z]{2,}(?![a-z])')
+
+def tokenize(text: str, mode: str = WORDS, query: bool = False) -> List[str]:
+    if mode == HANGUL_BIGRAM:
+        return _hangul_bigrams(text, query)
+    # Simple regex tokenizer: lowercase, remove non-alphanumeric
+    text = text.lower()
+    tokens = re.findall(r'\b[a-z]{2,}\b', text)
+    return [t for t in tokens if t not in STOPWORDS]
+
+def _hangul_bigrams(text: str, query: bool = False) -> List[str]:
+    # 한국어는 띄어쓰기/조사/복합어가 제각각이라 형태소 분석 대신 음절 bigram 을 쓴다.
+    # "노무관리를" -> 노무, 무관, 관리, 리를 : 질의 "노무관리" 의 bigram 이 모두 겹친다. 한 음절 단어는 그대로 둔다.
+    # 문서는 음절 unigram 도 함께 색인해 한 음절 질의 (예: "인") 가 "인사" 같은 긴 단어 안에서도 걸리게 한다.
+    # 두 음절 이상인 질의는 bigram 만 쓴다 (unigram 까지 쓰면 "노무관리" 가 "사무" 에도 걸린다).
+    # 영문은 한글에 붙어 있어도 (예: "HRD교육") 단어로 분리한다.
+    text = text.lower()
+    tokens = [t for t in LATIN_WORD.findall(text) if t not in STOPWORDS]
+    for run in HANGUL_RUN.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+            if not query:
+                tokens.extend(run)
+    return tokens
 
 class TFIDFEngine:
-    def __init__(self):
+    """
+    In-memory TF-IDF search (cosine similarity) over an inverted index (term -> {doc ordinal: TF}).
+    A query only walks the postings of its own terms.
+
+    Documents can be added, updated and removed at any time: postings and document frequencies are
+    maintained in place, so IDF is always current. Document norms depend on the IDF of every term and
+    are recomputed lazily (see NORM_REFRESH_RATIO); build_index() recomputes everything and compacts ordinals.
+    """
+
+    def __init__(self, tokenizer: str = WORDS):
+        if tokenizer not in TOKENIZERS:
+            raise ValueError(f"Unknown tokenizer: {tokenizer}")
+        self.tokenizer = tokenizer
         self.documents: Dict[str, str] = {}  # id -> text
-        self.index: Dict[str, List[str]] = defaultdict(list) # term -> [doc_ids]
-        self.idf: Dict[str, float] = {}
-        self.doc_vectors: Dict[str, Dict[str, float]] = {}
-        
-    def _tokenize(self, text: str) -> List[str]:
-        # Simple regex tokenizer: lowercase, remove non-alphanumeric
-        text = text.lower()
-        tokens = re.findall(r'\b[a-z]{2,}\b', text)
-        # minimal stopword list
-        stopwords = {'the', 'and', 'or', 'for', 'to', 'of', 'in', 'on', 'at', 'with', 'by', 'an', 'as', 'is'}
-        return [t for t in tokens if t not in stopwords]
+        self.doc_vectors: Dict[str, Dict[str, float]] = {}  # id -> term frequency (TF)
+        self.doc_ids: List[Optional[str]] = []  # ordinal -> id (None: removed)
+        self.ordinals: Dict[str, int] = {}  # id -> ordinal
+        self.index: Dict[str, Dict[int, float]] = {}  # term -> {ordinal: TF}
+        self.idf: Dict[str, float] = {}  # IDF at the last norm refresh
+        self.norms: List[float] = []  # ordinal -> TF-IDF vector norm
+        self._changes = 0  # documents added / updated / removed since the last norm refresh
+        self._revision = 0  # bumped on every change; invalidates the cached matrices
+        self._matrices = None  # (revision, vocabulary, idf array, document-term CSR, term-document CSR)
+        self._lock = threading.RLock()
 
-    def add_document(self, doc_id: str, text: str):
-        self.documents[doc_id] = text
+    def _tokenize(self, text: str, query: bool = False) -> List[str]:
+        return tokenize(text, self.tokenizer, query)
+
+    def _term_frequencies(self, text: str) -> Dict[str, float]:
         tokens = self._tokenize(text)
-        
-        # Calculate Term Frequency (TF) for this doc
         tf = defaultdict(int)
         for t in tokens:
             tf[t] += 1
-            
-        # Store raw TF for now, will compute TF-IDF on build
-        self.doc_vectors[doc_id] = {t: count/len(tokens) for t, count in tf.items()}
-        
-    def build_index(self):
-        # Calculate IDF
-        N = len(self.documents)
-        doc_counts = defaultdict(int)
-        
-        for doc_id, vec in self.doc_vectors.items():
-            for term in vec.keys():
-                doc_counts[term] += 1
-                
-        self.idf = {term: math.log(N / (count)) for term, count in doc_counts.items()}
-        
-        # Finalize Doc Vectors (TF * IDF)
-        for doc_id, vec in self.doc_vectors.items():
+        return {t: count/len(tokens) for t, count in tf.items()}
+
+    def _current_idf(self, term: str) -> float:
+        postings = self.index.get(term)
+        return math.log(len(self.doc_vectors) / len(postings)) if postings else 0.0
+
+    def _norm(self, vec: Dict[str, float], idf) -> float:
+        return math.sqrt(sum((tf_val * idf(term))**2 for term, tf_val in vec.items()))
+
+    def _unlink(self, doc_id: str) -> int:
+        ordinal = self.ordinals[doc_id]
+        for term in self.doc_vectors.pop(doc_id):
+            postings = self.index[term]
+            del postings[ordinal]
+            if not postings:
+                del self.index[term]
+        return ordinal
+
+    def add_document(self, doc_id: str, text: str):
+        """Adds (or replaces) a document; searchable immediately."""
+        with self._lock:
+            if doc_id in self.ordinals:
+                ordinal = self._unlink(doc_id)
+            else:
+                ordinal = self.ordinals[doc_id] = len(self.doc_ids)
+                self.doc_ids.append(doc_id)
+                self.norms.append(0.0)
+            self.documents[doc_id] = text
+            vec = self.doc_vectors[doc_id] = self._term_frequencies(text)
             for term, tf_val in vec.items():
-                self.doc_vectors[doc_id][term] = tf_val * self.idf.get(term, 0)
+                self.index.setdefault(term, {})[ordinal] = tf_val
+            self.norms[ordinal] = self._norm(vec, self._current_idf)
+            self._changes += 1
+            self._revision += 1
+
+    def update_document(self, doc_id: str, text: str):
+        self.add_document(doc_id, text)
+
+    def remove_document(self, doc_id: str):
+        """Removes a document (no-op for unknown ids). Its ordinal stays free until the next build_index()."""
+        with self._lock:
+            if doc_id not in self.ordinals:
+                return
+            ordinal = self._unlink(doc_id)
+            del self.ordinals[doc_id]
+            del self.documents[doc_id]
+            self.doc_ids[ordinal] = None
+            self.norms[ordinal] = 0.0
+            self._changes += 1
+            self._revision += 1
+
+    def _refresh_norms(self):
+        self.idf = {term: self._current_idf(term) for term in self.index}
+        for doc_id, vec in self.doc_vectors.items():
+            self.norms[self.ordinals[doc_id]] = self._norm(vec, self.idf.__getitem__)
+        self._changes = 0
+        self._revision += 1
+
+    def _refresh_norms_if_due(self):
+        if self._changes > max(NORM_REFRESH_MIN, NORM_REFRESH_RATIO * len(self.doc_vectors)):
+            self._refresh_norms()
+
+    def build_index(self):
+        """Full rebuild: compacts ordinals, postings and recomputes IDF / norms."""
+        with self._lock:
+            self.doc_ids = list(self.doc_vectors)
+            self.ordinals = {doc_id: ordinal for ordinal, doc_id in enumerate(self.doc_ids)}
+            index = defaultdict(dict)
+            for ordinal, vec in enumerate(self.doc_vectors.values()):
+                for term, tf_val in vec.items():
+                    index[term][ordinal] = tf_val
+            self.index = dict(index)
+            self.norms = [0.0] * len(self.doc_ids)
+            self._refresh_norms()
 
     def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
-        query_tokens = self._tokenize(query)
+        """Top-k documents sharing at least one weighted term with the query, by cosine similarity."""
+        query_tokens = self._tokenize(query, query=True)
         if not query_tokens:
             return []
-            
+
         # Query Vector (TF only is usually enough for query, but let's use IDF too)
         query_vec = defaultdict(float)
         for t in query_tokens:
             query_vec[t] += 1
-        
-        # Normalize Query Vector
-        total = sum(query_vec.values())
-        query_vec = {t: (c/total) * self.idf.get(t, 0) for t, c in query_vec.items()}
-        
-        # Cosine Similarity
-        scores = defaultdict(float)
-        query_norm = math.sqrt(sum(v**2 for v in query_vec.values()))
-        
-        if query_norm == 0:
-            return []
 
-        # Find candidate docs (any doc containing query terms)
-        candidate_docs = set()
-        for t in query_vec.keys():
-            # In a real inverted index we'd look up docs here. 
-            # Since we iterate all docs for simplicity in this MVP:
-            pass 
-
-        for doc_id, doc_vec in self.doc_vectors.items():
-            dot_product = 0
-            doc_norm = math.sqrt(sum(v**2 for v in doc_vec.values()))
-            
-            common_terms = set(query_vec.keys()) & set(doc_vec.keys())
-            for term in common_terms:
-                dot_product += query_vec[term] * doc_vec[term]
-                
-            if doc_norm > 0:
-                scores[doc_id] = dot_product / (query_norm * doc_norm)
-                
-        # Sort and return top K
-        results = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        with self._lock:
+            self._refresh_norms_if_due()
+
+            # Normalize Query Vector
+            total = sum(query_vec.values())
+            query_vec = {t: (c/total) * self._current_idf(t) for t, c in query_vec.items()}
+
+            # Cosine Similarity
+            query_norm = math.sqrt(sum(v**2 for v in query_vec.values()))
+            if query_norm == 0:
+                return []
+
+            # 질의어의 postings 만 누적 (문서 수가 아니라 질의어 문서 빈도에 비례), 문서 norm 은 후보에만 적용
+            dots = defaultdict(float)
+            for term, weight in query_vec.items():
+                if not weight:
+                    continue
+                idf_weight = weight * self._current_idf(term)
+                for ordinal, tf_val in self.index[term].items():
+                    dots[ordinal] += idf_weight * tf_val
+            norms = self.norms
+            scores = {ordinal: dot / norms[ordinal] for ordinal, dot in dots.items() if norms[ordinal]}
+
+            # Top K (ties: earlier documents first)
+            top = heapq.nlargest(top_k, scores.items(), key=lambda item: (item[1], -item[0]))
+            return [(self.doc_ids[ordinal], score / query_norm) for ordinal, score in top]
+
+    def _current_matrices(self):
+        if sparse is None:
+            raise RuntimeError("scipy is required for sparse matrix search")
+        if self._matrices is None or self._matrices[0] != self._revision:
+            # 행 = 문서 ordinal, 열 = 용어. 값은 search() 와 같은 가중치 (TF x 현재 IDF / 문서 norm) 이므로
+            # 단위 질의 벡터와의 내적이 곧 코사인 점수다. 변경이 없으면 캐시를 재사용한다.
+            vocabulary = {term: col for col, term in enumerate(self.index)}
+            lengths = np.fromiter((len(postings) for postings in self.index.values()), dtype=np.int64, count=len(vocabulary))
+            nnz = int(lengths.sum())
+            rows = np.fromiter((o for postings in self.index.values() for o in postings), dtype=np.int64, count=nnz)
+            tfs = np.fromiter((tf for postings in self.index.values() for tf in postings.values()), dtype=np.float64, count=nnz)
+            cols = np.repeat(np.arange(len(vocabulary)), lengths)
+            idf = np.fromiter((self._current_idf(term) for term in self.index), dtype=np.float64, count=len(vocabulary))
+            norms = np.asarray(self.norms, dtype=np.float64)
+            inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+            term_docs = sparse.csr_matrix((tfs * idf[cols] * inverse_norms[rows], (cols, rows)),
+                                          shape=(len(vocabulary), len(self.doc_ids)))
+            term_docs.eliminate_zeros()
+            self._matrices = (self._revision, vocabulary, idf, term_docs.T.tocsr(), term_docs)
+        return self._matrices
+
+    def document_term_matrix(self):
+        """
+        (CSR matrix, terms): row i = document ordinal i (see doc_ids; removed documents are empty rows),
+        column j = terms[j], values = TF-IDF weights divided by the document norm (what search() scores with).
+        """
+        with self._lock:
+            self._refresh_norms_if_due()
+            _, vocabulary, _, doc_terms, _ = self._current_matrices()
+            return doc_terms, list(vocabulary)
+
+    def search_many(self, queries: List[str], top_k: int = 5) -> List[List[Tuple[str, float]]]:
+        """search() for a batch of queries: sparse matrix multiplies (SEARCH_MANY_CHUNK queries each), then top-k per row."""
+        with self._lock:
+            self._refresh_norms_if_due()
+            _, vocabulary, idf, _, term_docs = self._current_matrices()
+            doc_ids = list(self.doc_ids)
+
+        # 질의 행렬 (질의 x 용어): 단위 길이로 정규화한 TF-IDF
+        rows, cols, counts = [], [], []
+        for row, query in enumerate(queries):
+            query_vec = defaultdict(int)
+            for t in self._tokenize(query, query=True):
+                if t in vocabulary:
+                    query_vec[vocabulary[t]] += 1
+            rows.extend([row] * len(query_vec))
+            cols.extend(query_vec)
+            counts.extend(query_vec.values())
+        rows, cols = np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)
+        weights = np.asarray(counts, dtype=np.float64) * idf[cols]
+        query_norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=len(queries)))
+        weights = np.divide(weights, query_norms[rows], out=np.zeros_like(weights), where=query_norms[rows] > 0)
+        query_terms = sparse.csr_matrix((weights, (rows, cols)), shape=(len(queries), len(vocabulary)))
+
+        results = []
+        for chunk in range(0, len(queries), SEARCH_MANY_CHUNK):
+            scores = query_terms[chunk:chunk + SEARCH_MANY_CHUNK] @ term_docs
+            scores.eliminate_zeros()
+            scores.sort_indices()
+            for row in range(scores.shape[0]):
+                start, end = scores.indptr[row], scores.indptr[row + 1]
+                results.append(self._top_k(scores.data[start:end], scores.indices[start:end], top_k, doc_ids))
+        return results
+
+    @staticmethod
+    def _top_k(data, ordinals, top_k, doc_ids) -> List[Tuple[str, float]]:
+        if top_k <= 0:
+            return []
+        if len(data) > top_k:
+            # k 번째 점수와 같은 동점은 search() 와 같이 앞선 문서 (낮은 ordinal) 를 고른다
+            kth = data[np.argpartition(-data, top_k - 1)[:top_k]].min()
+            above = np.flatnonzero(data > kth)
+            picked = np.concatenate([above, np.flatnonzero(data == kth)[:top_k - len(above)]])
+        else:
+            picked = np.arange(len(data))
+        picked = picked[np.lexsort((ordinals[picked], -data[picked]))]
+        return [(doc_ids[ordinals[i]], float(data[i])) for i in picked]
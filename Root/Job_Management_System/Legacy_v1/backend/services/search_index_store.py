@@ -0,0 +1,347 @@
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: 한 호스트에 워커 하나인 개발 환경만 가정
+    fcntl = None
+
+import numpy as np
+
+from .search_engine import TOKENIZERS, TFIDFEngine, tokenize
+
+# Persistent search index shared across workers
+# TFIDFEngine 스냅샷을 평탄한 배열로 파일에 쓰고, 각 워커는 mmap 으로 열어 페이지 캐시를 공유한다.
+# 워커별 파싱/복사가 없어서 여는 비용은 파일 크기와 무관하고, N 개 워커가 메모리에 한 벌만 둔다.
+# 게시(publish)는 임시 파일에 다 쓴 뒤 os.replace 로 바꿔치기하므로 읽는 쪽은 항상 완전한 파일만 본다.
+# 헤더의 version 이 더 큰 파일이 보이면 SharedIndex 가 새로 열어 참조를 교체한다 (이전 매핑은 진행 중인 검색이 끝나면 해제).
+#
+# 문서 번호는 term 별로 오름차순이라 차이(delta)만 VByte(7비트 + 연속 비트)로 저장한다.
+# 흔한 term 은 간격이 작아 대부분 1바이트가 되고, 디코딩은 numpy 로 term 단위 일괄 처리한다.
+#
+# Layout (little-endian, every section 8-byte aligned):
+#   header   magic, version, tokenizer, docs, terms, postings, posting bytes, term blob bytes, doc id blob bytes
+#   idf             float64[terms]        (terms sorted by UTF-8 bytes)
+#   term_offsets    uint64[terms + 1]     -> term blob
+#   posting_starts  uint64[terms + 1]     -> postings of term i: [start[i], start[i + 1]) in posting_weights
+#   posting_byte_starts uint64[terms + 1] -> the same postings in posting_docs
+#   posting_docs    uint8[posting bytes]  document ordinals, ascending per term, delta + VByte encoded
+#   posting_weights float64[postings]     TF-IDF / document norm
+#   norms           float64[docs]
+#   doc_offsets     uint64[docs + 1]      -> doc id blob
+#   term blob, doc id blob                UTF-8
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TFIDX\x00\x02\x00"
+HEADER = struct.Struct("<8sQQQQQQQQ")
+
+def _layout(docs: int, terms: int, postings: int, posting_bytes: int, term_bytes: int, doc_bytes: int):
+    sections = [
+        ("idf", np.float64, terms),
+        ("term_offsets", np.uint64, terms + 1),
+        ("posting_starts", np.uint64, terms + 1),
+        ("posting_byte_starts", np.uint64, terms + 1),
+        ("posting_docs", np.uint8, posting_bytes),
+        ("posting_weights", np.float64, postings),
+        ("norms", np.float64, docs),
+        ("doc_offsets", np.uint64, docs + 1),
+        ("term_blob", np.uint8, term_bytes),
+        ("doc_blob", np.uint8, doc_bytes),
+    ]
+    layout, offset = {}, HEADER.size
+    for name, dtype, count in sections:
+        offset = (offset + 7) & ~7
+        layout[name] = (offset, dtype, count)
+        offset += np.dtype(dtype).itemsize * count
+    return layout, offset
+
+def _blob(strings: List[str]) -> Tuple[np.ndarray, bytes]:
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return offsets, b"".join(encoded)
+
+def encode_deltas(ordinals: np.ndarray, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Delta + VByte encodes ordinals (ascending within each [starts[i], starts[i + 1]) run).
+    Returns the byte stream and the byte offset of every run.
+    """
+    ordinals = ordinals.astype(np.uint64)
+    gaps = ordinals.copy()
+    gaps[1:] -= ordinals[:-1]
+    run_heads = starts[:-1][starts[:-1] < starts[1:]].astype(np.int64)
+    gaps[run_heads] = ordinals[run_heads]  # 각 term 의 첫 문서는 절대값
+    sizes = np.ones(len(gaps), dtype=np.int64)
+    for bits in (7, 14, 21, 28):
+        sizes += gaps >= (1 << bits)
+    value_starts = np.zeros(len(gaps) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=value_starts[1:])
+    stream = np.zeros(int(value_starts[-1]), dtype=np.uint8)
+    for k in range(5):
+        has_byte = sizes > k
+        chunk = (gaps[has_byte] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (sizes[has_byte] > k + 1).astype(np.uint64) << np.uint64(7)
+        stream[value_starts[:-1][has_byte] + k] = (chunk | more).astype(np.uint8)
+    return stream, value_starts[starts.astype(np.int64)].astype(np.uint64)
+
+def decode_deltas(stream: np.ndarray) -> np.ndarray:
+    """Ordinals of one run encoded by encode_deltas."""
+    if not len(stream):
+        return np.zeros(0, dtype=np.int64)
+    ends = (stream & 0x80) == 0
+    value_index = np.concatenate(([0], np.cumsum(ends)[:-1]))
+    value_starts = np.flatnonzero(np.concatenate(([True], ends[:-1])))
+    shifts = (7 * (np.arange(len(stream)) - value_starts[value_index])).astype(np.int64)
+    parts = (stream & 0x7F).astype(np.int64) << shifts
+    return np.cumsum(np.add.reduceat(parts, value_starts))
+
+def read_version(path: str) -> int:
+    """Version in the header of the index at path (0 when there is none)."""
+    try:
+        with open(path, "rb") as f:
+            magic, version, *_ = HEADER.unpack(f.read(HEADER.size))
+    except (FileNotFoundError, struct.error):
+        return 0
+    return version if magic == MAGIC else 0
+
+def publish(engine: TFIDFEngine, path: str, version: Optional[int] = None) -> int:
+    """
+    Writes the engine's current index to path atomically and returns the published version
+    (by default one more than the version already at path).
+    """
+    tokenizer = TOKENIZERS.index(engine.tokenizer)
+    with engine._lock:
+        engine._refresh_norms()
+        live = [(doc_id, engine.norms[engine.ordinals[doc_id]]) for doc_id in engine.doc_ids if doc_id is not None]
+        ordinal_map = {doc_id: new for new, (doc_id, _) in enumerate(live)}
+        terms = sorted(engine.index)
+        idf = np.array([engine.idf[term] for term in terms], dtype=np.float64)
+        posting_starts = np.zeros(len(terms) + 1, dtype=np.uint64)
+        docs, weights = [], []
+        for i, term in enumerate(terms):
+            postings = sorted(
+                (ordinal_map[engine.doc_ids[ordinal]], tf_val) for ordinal, tf_val in engine.index[term].items()
+            )
+            for new_ordinal, tf_val in postings:
+                norm = live[new_ordinal][1]
+                weight = tf_val * idf[i] / norm if norm else 0.0
+                if weight:
+                    docs.append(new_ordinal)
+                    weights.append(weight)
+            posting_starts[i + 1] = len(docs)
+
+    term_offsets, term_blob = _blob(terms)
+    doc_offsets, doc_blob = _blob([doc_id for doc_id, _ in live])
+    posting_docs, posting_byte_starts = encode_deltas(np.array(docs, dtype=np.uint64), posting_starts)
+    if version is None:
+        version = read_version(path) + 1
+    counts = (len(live), len(terms), len(docs), len(posting_docs), len(term_blob), len(doc_blob))
+    layout, size = _layout(*counts)
+    arrays = {
+        "idf": idf,
+        "term_offsets": term_offsets,
+        "posting_starts": posting_starts,
+        "posting_byte_starts": posting_byte_starts,
+        "posting_docs": posting_docs,
+        "posting_weights": np.array(weights, dtype=np.float64),
+        "norms": np.array([norm for _, norm in live], dtype=np.float64),
+        "doc_offsets": doc_offsets,
+        "term_blob": np.frombuffer(term_blob, dtype=np.uint8),
+        "doc_blob": np.frombuffer(doc_blob, dtype=np.uint8),
+    }
+
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, version, tokenizer, *counts))
+            for name, (offset, dtype, count) in layout.items():
+                f.seek(offset)
+                f.write(np.ascontiguousarray(arrays[name], dtype=dtype).tobytes())
+            f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return version
+
+@contextmanager
+def publish_lock(path: str):
+    """
+    Serializes rebuild + publish of the index at path across the workers of a host,
+    so a slower rebuild from an older snapshot never replaces a newer one.
+    """
+    with open(f"{path}.lock", "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+class Debounced:
+    """
+    Runs fn on a background thread `delay` seconds after the first schedule() call;
+    calls made while it is pending are folded into that run.
+    """
+
+    def __init__(self, fn: Callable[[], object], delay: float):
+        self.fn = fn
+        self.delay = delay
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> bool:
+        return self._timer is not None
+
+    def schedule(self):
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.delay, self._run)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run(self):
+        with self._lock:
+            self._timer = None
+        try:
+            self.fn()
+        except Exception:
+            logger.exception("Deferred search index publish failed")
+
+    def flush(self):
+        """Runs a pending call right away (shutdown, tests)."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            self._run()
+
+class MappedIndex:
+    """Read-only, memory-mapped view of a published index with the TFIDFEngine.search API."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.version, tokenizer, *counts = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or tokenizer >= len(TOKENIZERS):
+            raise ValueError(f"{path} is not a search index file (or was written by another format version)")
+        self.tokenizer = TOKENIZERS[tokenizer]
+        terms = counts[1]
+        layout, size = _layout(*counts)
+        if len(self._mmap) < size:
+            raise ValueError(f"{path} is truncated ({len(self._mmap)} < {size} bytes)")
+        for name, (offset, dtype, count) in layout.items():
+            setattr(self, name, np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset))
+        self.term_count = terms
+
+    def __len__(self) -> int:
+        return len(self.norms)
+
+    def _term_id(self, term: str) -> int:
+        # 정렬된 term blob 에서 이진 탐색 (워커마다 사전을 만들지 않는다)
+        key = term.encode("utf-8")
+        lo, hi = 0, self.term_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = self.term_blob[int(self.term_offsets[mid]):int(self.term_offsets[mid + 1])].tobytes()
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def doc_id(self, ordinal: int) -> str:
+        return self.doc_blob[int(self.doc_offsets[ordinal]):int(self.doc_offsets[ordinal + 1])].tobytes().decode("utf-8")
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        query_tokens = tokenize(query, self.tokenizer, query=True)
+        if not query_tokens:
+            return []
+
+        query_vec = {}
+        for term, count in Counter(query_tokens).items():
+            term_id = self._term_id(term)
+            if term_id >= 0 and self.idf[term_id]:
+                query_vec[term_id] = count / len(query_tokens) * self.idf[term_id]
+        if not query_vec:
+            return []
+        query_norm = math.sqrt(sum(v**2 for v in query_vec.values()))
+
+        ordinals, scores = [], []
+        for term_id, weight in query_vec.items():
+            start, end = int(self.posting_starts[term_id]), int(self.posting_starts[term_id + 1])
+            byte_start, byte_end = int(self.posting_byte_starts[term_id]), int(self.posting_byte_starts[term_id + 1])
+            ordinals.append(decode_deltas(self.posting_docs[byte_start:byte_end]))
+            scores.append(self.posting_weights[start:end] * weight)
+        if len(ordinals) == 1:
+            candidates, totals = ordinals[0], scores[0]
+        else:
+            candidates, inverse = np.unique(np.concatenate(ordinals), return_inverse=True)
+            totals = np.bincount(inverse, weights=np.concatenate(scores))
+
+        # Top K (ties: earlier documents first)
+        top = np.lexsort((candidates, -totals))[:top_k]
+        return [(self.doc_id(int(candidates[i])), float(totals[i]) / query_norm) for i in top]
+
+class SharedIndex:
+    """
+    The index published at path, reloaded when a newer version appears
+    (the file is checked at most every check_interval seconds).
+    """
+
+    def __init__(self, path: str, check_interval: float = 1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._index: Optional[MappedIndex] = None
+        self._file_key = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._reload()
+
+    def _reload(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if file_key == self._file_key:
+            return
+        self._file_key = file_key
+        try:
+            index = MappedIndex(self.path)
+        except ValueError:
+            return  # another format version: keep serving what we have until it is republished
+        if self._index is None or index.version > self._index.version:
+            self._index = index  # 참조 교체는 원자적: 진행 중인 검색은 이전 매핑으로 끝난다
+
+    def current(self) -> Optional[MappedIndex]:
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            with self._lock:
+                if now - self._checked_at >= self.check_interval:
+                    self._checked_at = now
+                    self._reload()
+        return self._index
+
+    def refresh(self) -> Optional[MappedIndex]:
+        """Checks the file right away (e.g. after publishing from this process)."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            self._reload()
+        return self._index
@@ -0,0 +1,22 @@
+from typing import Iterable
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# /ai/search 인덱스의 증분 반영은 ORM flush 이벤트로 변경을 모은다 (routers_legacy/ai.py).
+# Core insert()/update() 로 쓰는 경로(분류 매트릭스 일괄 저장 등)는 flush 를 거치지 않으므로,
+# 쓴 쪽에서 mark_search_changed 로 (모델, id) 를 남기고 ai 쪽이 커밋 직전에 행을 다시 읽어 반영한다.
+SEARCH_REFRESH_KEY = "search_refresh"
+
+def mark_search_changed(session: Session, model, ids: Iterable[str]):
+    """For writes that bypass the flush: re-read these rows into the search index when the session commits."""
+    ids = set(ids)
+    if ids:
+        session.info.setdefault(SEARCH_REFRESH_KEY, {}).setdefault(model, set()).update(ids)
+
+@event.listens_for(Session, "after_commit")
+def _clear_search_refresh(session):
+    session.info.pop(SEARCH_REFRESH_KEY, None)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_search_refresh(session, previous_transaction):
+    session.info.pop(SEARCH_REFRESH_KEY, None)
@@ -1,66 +1,103 @@
 from typing import List, Dict, Any, Optional
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 from .. import models
+from .current_position import current_positions
+
+Closure = models.ReportingClosure
 
 class SpanOfControlService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_span_of_control_analysis(self) -> List[Dict[str, Any]]:
+    def get_span_of_control_analysis(self, root_id: Optional[str] = None, max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Builds the complete organizational hierarchy based on reporting lines (User.reports_to_id).
-        Returns a list of root nodes (typically the CEO or top-level execs), each containing their full subtree.
+        Builds the organizational hierarchy based on reporting lines (User.reports_to_id).
+        Without root_id: every root node (no manager, or a manager that does not exist) with its subtree.
+        With root_id: only that manager's subtree. max_depth limits how many levels below the root are returned;
+        span_count / total_descendants always describe the full organization.
+        Uses the reporting_closure table: a fixed number of queries, no recursion.
         """
-        users = self.db.query(models.User).all()
-        
-        # 1. Index users by ID for quick lookup and by reports_to_id for children finding
-        user_map = {u.id: u for u in users}
-        children_map: Dict[str, List[models.User]] = {}
-        
-        for u in users:
-            if u.reports_to_id:
-                if u.reports_to_id not in children_map:
-                    children_map[u.reports_to_id] = []
-                children_map[u.reports_to_id].append(u)
-        
-        # 2. Identify Root Nodes (No reports_to_id or reports_to_id pointing to non-existent user)
-        roots = [u for u in users if not u.reports_to_id or u.reports_to_id not in user_map]
-        
-        # 3. Recursive Build
+        # 1. Nodes + depth below their root
+        if root_id:
+            nodes = select(Closure.descendant_id.label("user_id"), Closure.depth.label("depth"))\
+                .where(Closure.ancestor_id == root_id)
+            if max_depth is not None:
+                nodes = nodes.where(Closure.depth <= max_depth)
+        else:
+            # 루트로부터의 깊이 = 조상 행 중 최대 depth
+            nodes = select(Closure.descendant_id.label("user_id"), func.max(Closure.depth).label("depth"))\
+                .group_by(Closure.descendant_id)
+            if max_depth is not None:
+                nodes = nodes.having(func.max(Closure.depth) <= max_depth)
+        nodes = nodes.subquery("nodes")
+        node_ids = select(nodes.c.user_id)
+
+        rows = self.db.execute(
+            select(models.User.id, models.User.name, models.User.reports_to_id, models.OrgUnit.name.label("org_unit"), nodes.c.depth)
+            .join(nodes, nodes.c.user_id == models.User.id)
+            .outerjoin(models.OrgUnit, models.OrgUnit.id == models.User.org_unit_id)
+            .order_by(nodes.c.depth)
+        ).all()
+        if not rows:
+            return []
+
+        # 2. Direct reports and total descendants for every returned node (one grouped query)
+        stats = {
+            ancestor_id: (span, total)
+            for ancestor_id, span, total in self.db.execute(
+                select(
+                    Closure.ancestor_id,
+                    func.sum(case((Closure.depth == 1, 1), else_=0)),
+                    func.count() - 1,
+                ).where(Closure.ancestor_id.in_(node_ids)).group_by(Closure.ancestor_id)
+            )
+        }
+
+        # 3. Position title (current job position per user)
+        current = current_positions(models.JobPosition.user_id.in_(node_ids))
+        titles: Dict[str, str] = dict(self.db.execute(
+            select(current.c.user_id, models.JobPosition.title)
+            .join(models.JobPosition, models.JobPosition.id == current.c.position_id)
+        ).all())
+
+        # 4. Iterative tree assembly (parents are processed before children because rows are sorted by depth)
+        built: Dict[str, Dict[str, Any]] = {}
         result_tree = []
-        for root in roots:
-            node = self._build_node(root, children_map, 0)
-            result_tree.append(node)
-            
+        for row in rows:
+            span_count, total_descendants = stats.get(row.id, (0, 0))
+            node = {
+                "id": row.id,
+                "name": row.name,
+                "title": titles.get(row.id, "N/A"),
+                "org_unit": row.org_unit or "N/A",
+                "depth": row.depth,
+                "span_count": span_count,
+                "total_descendants": total_descendants,
+                "span_status": self._span_status(span_count),
+                "children": []
+            }
+            built[row.id] = node
+            parent = built.get(row.reports_to_id) if row.id != root_id else None
+            if parent is not None:
+                parent["children"].append(node)
+            else:
+                result_tree.append(node)
+
         return result_tree
 
-    def _build_node(self, user: models.User, children_map: Dict[str, List[models.User]], depth: int) -> Dict[str, Any]:
-        direct_reports = children_map.get(user.id, [])
-        
-        children_nodes = []
-        total_descendants = 0
-        
-        for child in direct_reports:
-            child_node = self._build_node(child, children_map, depth + 1)
-            children_nodes.append(child_node)
-            total_descendants += 1 + child_node['total_descendants']
-            
-        span_status = "OPTIMAL"
-        if len(direct_reports) == 0:
-            span_status = "LEAF" # Individual Contributor
-        elif len(direct_reports) < 3:
-            span_status = "NARROW"
-        elif len(direct_reports) > 15:
-            span_status = "WIDE"
-            
-        return {
-            "id": user.id,
-            "name": user.name,
-            "title": user.job_positions[0].title if user.job_positions else "N/A",
-            "org_unit": user.org_unit.name if user.org_unit else "N/A",
-            "depth": depth,
-            "span_count": len(direct_reports),
-            "total_descendants": total_descendants,
-            "span_status": span_status, 
-            "children": children_nodes
-        }
+    def get_descendant_ids(self, manager_id: str, max_depth: Optional[int] = None) -> List[str]:
+        """Everyone under manager_id (excluding the manager), via the closure table."""
+        query = select(Closure.descendant_id).where(Closure.ancestor_id == manager_id, Closure.depth > 0)
+        if max_depth is not None:
+            query = query.where(Closure.depth <= max_depth)
+        return list(self.db.execute(query).scalars())
+
+    def _span_status(self, span_count: int) -> str:
+        if span_count == 0:
+            return "LEAF" # Individual Contributor
+        if span_count < 3:
+            return "NARROW"
+        if span_count > 15:
+            return "WIDE"
+        return "OPTIMAL"
@@ -0,0 +1,189 @@
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, Optional
+from sqlalchemy import Integer, cast, delete, event, extract, func, insert, inspect, select, update
+from sqlalchemy.orm import Session
+from .. import models
+
+# Workforce gap summary maintenance
+# workforce_gap_summary 는 (조직, 연도)별 현원 / 정원 / 적정인력(FTE) 을 미리 집계해 둔 테이블이다.
+#   - WorkloadEntry 추가/수정/삭제 : 해당 (조직, 연도) 행의 required_fte 에 FTE 증감분만 더한다 (행이 없으면 조직 재계산)
+#   - User.org_unit_id 변경/입퇴사  : 이전 조직과 새 조직의 행을 다시 계산
+#   - HeadcountPlan 추가/수정/삭제  : 해당 조직의 행을 다시 계산
+# 재계산은 영향받은 조직의 행만 고정된 쿼리 수로 처리한다 (조직 수와 무관).
+# 연도: 정원은 HeadcountPlan.year, 적정인력은 SurveyPeriod.start_date 의 연도(조사 기간이 없는 항목은 올해),
+# 현원은 현재 인원을 모든 연도 행에 기록한다.
+
+Summary = models.WorkforceGapSummary
+
+def _survey_year(current_year: int):
+    # 조사 기간이 없는 항목(survey_period_id NULL)은 올해 적정인력에 포함한다
+    return func.coalesce(cast(extract("year", models.SurveyPeriod.start_date), Integer), current_year)
+
+def refresh_units(conn, unit_ids: Iterable[Optional[str]], current_year: Optional[int] = None):
+    """Recomputes every summary row of the given org units (rows for plan years, survey years and the current year)."""
+    unit_ids = {unit_id for unit_id in unit_ids if unit_id}
+    if not unit_ids:
+        return
+    current_year = current_year or date.today().year
+
+    headcounts = dict(conn.execute(
+        select(models.User.org_unit_id, func.count(models.User.id))
+        .where(models.User.org_unit_id.in_(unit_ids))
+        .group_by(models.User.org_unit_id)
+    ).all())
+    authorized = {
+        (unit_id, year): value
+        for unit_id, year, value in conn.execute(
+            select(models.HeadcountPlan.org_unit_id, models.HeadcountPlan.year, func.max(models.HeadcountPlan.authorized_count))
+            .where(models.HeadcountPlan.org_unit_id.in_(unit_ids))
+            .group_by(models.HeadcountPlan.org_unit_id, models.HeadcountPlan.year)
+        )
+    }
+    required = {
+        (unit_id, year): value
+        for unit_id, year, value in conn.execute(
+            select(models.User.org_unit_id, _survey_year(current_year), func.sum(models.WorkloadEntry.fte))
+            .select_from(models.WorkloadEntry)
+            .join(models.User, models.User.id == models.WorkloadEntry.user_id)
+            .outerjoin(models.SurveyPeriod, models.SurveyPeriod.id == models.WorkloadEntry.survey_period_id)
+            .where(models.User.org_unit_id.in_(unit_ids))
+            .group_by(models.User.org_unit_id, _survey_year(current_year))
+        )
+    }
+
+    keys = set(authorized) | set(required) | {(unit_id, current_year) for unit_id in headcounts}
+    conn.execute(delete(Summary).where(Summary.org_unit_id.in_(unit_ids)))
+    if keys:
+        conn.execute(insert(Summary), [
+            {
+                "org_unit_id": unit_id,
+                "year": year,
+                "current_count": headcounts.get(unit_id, 0),
+                "authorized_count": authorized.get((unit_id, year)) or 0.0,
+                "required_fte": required.get((unit_id, year)) or 0.0,
+            }
+            for unit_id, year in keys
+        ])
+
+def refresh_for_users(conn, user_ids: Iterable[str]):
+    """Refreshes the org units of the given users (used after bulk inserts that bypass the ORM)."""
+    user_ids = set(user_ids)
+    if user_ids:
+        refresh_units(conn, conn.execute(
+            select(models.User.org_unit_id).where(models.User.id.in_(user_ids)).distinct()
+        ).scalars())
+
+def rebuild(db: Session) -> int:
+    """
+    Recomputes the whole summary table.
+    Needed once for existing databases, after bulk loads that bypass the ORM, and at the turn of the year.
+    """
+    conn = db.connection()
+    conn.execute(delete(Summary))
+    refresh_units(conn, db.execute(select(models.OrgUnit.id)).scalars().all())
+    db.commit()
+    return db.query(func.count()).select_from(Summary).scalar()
+
+def _history_values(obj, attr):
+    history = inspect(obj).attrs[attr].history
+    return list(history.added) + list(history.deleted) + list(history.unchanged)
+
+def _old_value(obj, attr):
+    history = inspect(obj).attrs[attr].history
+    return (list(history.deleted) + list(history.unchanged) + [None])[0]
+
+def _new_value(obj, attr):
+    history = inspect(obj).attrs[attr].history
+    return (list(history.added) + list(history.unchanged) + [None])[0]
+
+def _fte_deltas(new, dirty, deleted):
+    """
+    {(user_id, survey_period_id): FTE change} of the flushed WorkloadEntry rows, and the users of rows
+    whose previous values were not loaded (expired before the change): their units are recomputed instead.
+    """
+    deltas, unknown_users = defaultdict(float), set()
+    for obj in new:
+        if isinstance(obj, models.WorkloadEntry):
+            deltas[(obj.user_id, obj.survey_period_id)] += obj.fte or 0.0
+    for obj in list(deleted) + list(dirty):
+        if not isinstance(obj, models.WorkloadEntry):
+            continue
+        state = inspect(obj)
+        histories = {attr: state.attrs[attr].history for attr in ("fte", "user_id", "survey_period_id")}
+        if obj in dirty and not any(history.has_changes() for history in histories.values()):
+            continue
+        if any(attr in state.unloaded or (history.has_changes() and not history.deleted)
+               for attr, history in histories.items()):
+            unknown_users.update(_history_values(obj, "user_id"))
+            continue
+        deltas[(_old_value(obj, "user_id"), _old_value(obj, "survey_period_id"))] -= _old_value(obj, "fte") or 0.0
+        if obj in dirty:
+            deltas[(_new_value(obj, "user_id"), _new_value(obj, "survey_period_id"))] += _new_value(obj, "fte") or 0.0
+    unknown_users.discard(None)
+    return {key: delta for key, delta in deltas.items() if key[0] is not None and delta}, unknown_users
+
+def apply_fte_deltas(conn, deltas, skip_units=(), current_year: Optional[int] = None) -> set:
+    """
+    Adds FTE changes to the matching summary rows instead of re-summing the units.
+    Returns the org units that have no row for the year yet (the caller recomputes those).
+    """
+    current_year = current_year or date.today().year
+    user_ids = {user_id for user_id, _ in deltas}
+    period_ids = {period_id for _, period_id in deltas if period_id}
+    units = dict(conn.execute(select(models.User.id, models.User.org_unit_id).where(models.User.id.in_(user_ids))).all())
+    years = dict(conn.execute(
+        select(models.SurveyPeriod.id, models.SurveyPeriod.start_date).where(models.SurveyPeriod.id.in_(period_ids))
+    ).all()) if period_ids else {}
+    by_row = defaultdict(float)
+    for (user_id, period_id), delta in deltas.items():
+        unit_id = units.get(user_id)
+        if unit_id is None or unit_id in skip_units:
+            continue
+        start = years.get(period_id)
+        by_row[(unit_id, start.year if start else current_year)] += delta
+
+    missing = set()
+    for (unit_id, year), delta in by_row.items():
+        result = conn.execute(
+            update(Summary)
+            .where(Summary.org_unit_id == unit_id, Summary.year == year)
+            .values(required_fte=Summary.required_fte + delta)
+        )
+        if result.rowcount == 0:
+            missing.add(unit_id)
+    return missing
+
+@event.listens_for(Session, "before_flush")
+def _remove_deleted_units(session, flush_context, instances):
+    # Summary rows reference org_units.id, so they must go before the unit row is deleted
+    deleted = [obj.id for obj in session.deleted if isinstance(obj, models.OrgUnit)]
+    if deleted:
+        session.connection().execute(delete(Summary).where(Summary.org_unit_id.in_(deleted)))
+
+@event.listens_for(Session, "after_flush")
+def _maintain_workforce_summary(session, flush_context):
+    unit_ids = set()
+    new, dirty, deleted = session.new, session.dirty, session.deleted  # rebuilt on every access: read them once
+    for obj in list(new) + list(dirty) + list(deleted):
+        if isinstance(obj, models.HeadcountPlan):
+            unit_ids.update(_history_values(obj, "org_unit_id"))
+        elif isinstance(obj, models.User):
+            if obj in dirty and not inspect(obj).attrs.org_unit_id.history.has_changes():
+                continue
+            unit_ids.update(_history_values(obj, "org_unit_id"))
+    unit_ids.discard(None)
+    deltas, user_ids = _fte_deltas(new, dirty, deleted)
+    if not (unit_ids or deltas or user_ids):
+        return
+
+    conn = session.connection()
+    if user_ids:
+        unit_ids.update(conn.execute(
+            select(models.User.org_unit_id).where(models.User.id.in_(user_ids)).distinct()
+        ).scalars())
+        unit_ids.discard(None)
+    if deltas:
+        # 다시 계산할 조직은 증감분을 건너뛴다 (재계산이 이미 flush 된 값을 읽는다)
+        unit_ids |= apply_fte_deltas(conn, deltas, skip_units=unit_ids)
+    refresh_units(conn, unit_ids)
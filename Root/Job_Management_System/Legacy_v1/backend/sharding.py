@@ -0,0 +1,318 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy import and_, delete, event, insert, or_, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from . import models
+from .database import (
+    SQLALCHEMY_DATABASE_URL, ReadSessionLocal, SessionLocal, Base,
+    create_profiled_engine, engine, read_only_url,
+)
+
+# Per-institution sharding (SHARD_MODE)
+# - off             : 기본값. 모든 기관이 하나의 DB 를 공유한다.
+# - sqlite          : 기관마다 SHARD_DIR/{institution_id}.db 파일을 사용한다.
+# - postgres-schema : 같은 Postgres DB 안에서 기관마다 tenant_{institution_id} 스키마를 사용한다
+#                     (schema_translate_map 으로 모델의 기본 스키마를 치환, 커넥션 풀은 공유).
+# 기관 단위 분석은 해당 기관 데이터만 읽게 되고, 큰 기관의 배치 작업이 다른 기관의 잠금/캐시를 건드리지 않는다.
+SHARD_MODE = os.getenv("SHARD_MODE", "off").lower()
+SHARD_DIR = os.getenv("SHARD_DIR", "./shards")
+SHARD_ENGINE_CACHE_SIZE = int(os.getenv("SHARD_ENGINE_CACHE_SIZE", "64"))
+
+_SAFE_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+# Shard directory
+# 요청에 institution_id 가 없으면 라우트가 가리키는 부모 행(경로 / 쿼리 / JSON 본문의 *_id)으로 샤드를 찾는다.
+# 부모 행 → 기관 매핑은 공유 DB 의 shard_directory 에 있고, 테넌트 세션이 커밋할 때마다 갱신된다.
+DIRECTORY_KEYS = {
+    "group_id": models.JobGroup,
+    "series_id": models.JobSeries,
+    "position_id": models.JobPosition,
+    "job_position_id": models.JobPosition,
+    "task_id": models.JobTask,
+    "job_task_id": models.JobTask,
+    "work_id": models.WorkItem,
+    "survey_id": models.SurveyPeriod,
+    "survey_period_id": models.SurveyPeriod,
+    "user_id": models.User,
+    "org_unit_id": models.OrgUnit,
+}
+DIRECTORY_MODELS = tuple(set(DIRECTORY_KEYS.values()))
+
+class ShardRouter:
+    """Maps an institution_id to its own engine / session factory."""
+
+    def __init__(self, mode: str = SHARD_MODE, shard_dir: str = SHARD_DIR, base_url: str = SQLALCHEMY_DATABASE_URL,
+                 cache_size: int = SHARD_ENGINE_CACHE_SIZE, shared_bind=None):
+        if mode not in ("off", "sqlite", "postgres-schema"):
+            raise ValueError(f"Unknown SHARD_MODE '{mode}'. Choose one of: off, sqlite, postgres-schema")
+        if mode == "postgres-schema" and not base_url.startswith("postgres"):
+            raise ValueError("SHARD_MODE=postgres-schema requires a PostgreSQL DATABASE_URL")
+        self.mode = mode
+        self.shard_dir = shard_dir
+        self.base_url = base_url
+        self.cache_size = cache_size
+        # 공유 DB: 기관을 알 수 없는 요청과 shard_directory 가 사용한다
+        self.shared_bind = shared_bind or engine
+        if shared_bind is None:
+            self._shared = {False: SessionLocal, True: ReadSessionLocal}
+        else:
+            shared = sessionmaker(autocommit=False, autoflush=False, bind=shared_bind)
+            self._shared = {False: shared, True: shared}
+        self._factories = OrderedDict()  # (institution_id, read_only) -> sessionmaker
+        self._in_use = {}  # engine -> sessions opened by open_session and not yet closed
+        self._retired = set()  # evicted engines that still had open sessions: disposed when the last one closes
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def shard_key(self, institution_id: str) -> str:
+        # 파일 경로 / 스키마 이름에 그대로 들어가므로 허용 문자만 통과시킨다
+        if not institution_id or not _SAFE_ID.match(institution_id):
+            raise ValueError(f"Invalid institution_id for sharding: {institution_id!r}")
+        return institution_id
+
+    def shard_url(self, institution_id: str) -> str:
+        key = self.shard_key(institution_id)
+        if self.mode == "sqlite":
+            return f"sqlite:///{os.path.join(self.shard_dir, key + '.db')}"
+        return self.base_url
+
+    def schema_name(self, institution_id: str) -> str:
+        return f"tenant_{self.shard_key(institution_id).replace('-', '_').lower()}"
+
+    def _build_engine(self, institution_id: str, read_only: bool):
+        if self.mode == "sqlite":
+            url = self.shard_url(institution_id)
+            if read_only:
+                return create_profiled_engine(read_only_url(url), read_only=True)
+            return create_profiled_engine(url)
+        # postgres-schema: 공유 엔진에 스키마 치환 옵션만 입힌 파생 엔진 (풀은 공유)
+        return engine.execution_options(schema_translate_map={None: self.schema_name(institution_id)})
+
+    def session_factory(self, institution_id: str, read_only: bool = False):
+        """Session factory for the institution's shard (default factories when sharding is off)."""
+        if not self.enabled:
+            return self._shared[read_only]
+        with self._lock:
+            return self._factory(institution_id, read_only)
+
+    def _factory(self, institution_id: str, read_only: bool):
+        # caller holds self._lock
+        cache_key = (self.shard_key(institution_id), read_only)
+        factory = self._factories.get(cache_key)
+        if factory is not None:
+            self._factories.move_to_end(cache_key)
+            return factory
+        factory = sessionmaker(autocommit=False, autoflush=False, bind=self._build_engine(institution_id, read_only))
+        self._factories[cache_key] = factory
+        if len(self._factories) > self.cache_size:
+            # 오래 안 쓴 기관의 엔진은 정리 (SQLite 파일 핸들 / 커넥션 반환)
+            _, evicted = self._factories.popitem(last=False)
+            if self.mode == "sqlite":
+                self._retire(evicted.kw["bind"])
+        return factory
+
+    def _retire(self, bind):
+        # 진행 중인 요청이 아직 세션을 쥐고 있으면 dispose 는 마지막 세션이 닫힐 때로 미룬다
+        if self._in_use.get(bind):
+            self._retired.add(bind)
+        else:
+            bind.dispose()
+
+    def open_session(self, institution_id: Optional[str], read_only: bool = False) -> Session:
+        """
+        A session on the institution's shard whose engine stays undisposed until close_session().
+        Without an institution_id (or with sharding off) the session is on the shared database.
+        """
+        if not self.enabled or not institution_id:
+            return self._shared[read_only]()
+        with self._lock:
+            factory = self._factory(institution_id, read_only)
+            bind = factory.kw["bind"]
+            self._in_use[bind] = self._in_use.get(bind, 0) + 1
+        db = factory()
+        db.info["institution_id"] = institution_id
+        return db
+
+    def close_session(self, db: Session):
+        bind = db.bind
+        tenant = db.info.get("institution_id")
+        db.close()
+        if not tenant:
+            return
+        with self._lock:
+            remaining = self._in_use.get(bind, 0) - 1
+            if remaining > 0:
+                self._in_use[bind] = remaining
+                return
+            self._in_use.pop(bind, None)
+            if bind in self._retired:
+                self._retired.discard(bind)
+                bind.dispose()
+
+    def create_shard(self, institution_id: str, metadata=None):
+        """Creates the shard's file/schema and tables. Used by `manage_db create-shard`."""
+        from . import schema_version
+        metadata = metadata or Base.metadata
+        if self.mode == "sqlite":
+            os.makedirs(self.shard_dir, exist_ok=True)
+        elif self.mode == "postgres-schema":
+            with engine.begin() as conn:
+                conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{self.schema_name(institution_id)}"'))
+        bind = self.session_factory(institution_id).kw["bind"]
+        return schema_version.upgrade(bind, metadata)
+
+    def locate(self, refs: Iterable[Tuple[str, str]]) -> Optional[str]:
+        """Institution of the first (table_name, row_id) found in shard_directory, or None."""
+        D = models.ShardDirectory
+        refs = list(refs)
+        if not refs:
+            return None
+        with self.shared_bind.connect() as conn:
+            return conn.execute(
+                select(D.institution_id)
+                .where(or_(*(and_(D.table_name == table, D.row_id == row_id) for table, row_id in refs)))
+                .limit(1)
+            ).scalar()
+
+    def record(self, changes):
+        """Applies {(table_name, row_id): institution_id or None (deleted)} to shard_directory."""
+        D = models.ShardDirectory
+        keys = list(changes)
+        added = [{"table_name": t, "row_id": r, "institution_id": inst} for (t, r), inst in changes.items() if inst]
+        with self.shared_bind.begin() as conn:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                conn.execute(delete(D).where(or_(*(and_(D.table_name == t, D.row_id == r) for t, r in chunk))))
+            if added:
+                conn.execute(insert(D), added)
+
+    def index_shard(self, institution_id: str) -> int:
+        """Re-registers every parent row of the shard in shard_directory (after loading rows into a shard)."""
+        D = models.ShardDirectory
+        db = self.open_session(institution_id, read_only=True)
+        try:
+            rows = [
+                {"table_name": model.__tablename__, "row_id": str(row_id), "institution_id": institution_id}
+                for model in DIRECTORY_MODELS
+                for row_id in db.execute(select(model.id)).scalars()
+            ]
+        finally:
+            self.close_session(db)
+        with self.shared_bind.begin() as conn:
+            conn.execute(delete(D).where(D.institution_id == institution_id))
+            if rows:
+                conn.execute(insert(D), rows)
+        return len(rows)
+
+shard_router = ShardRouter()
+
+def institution_from_request(request: Request) -> Optional[str]:
+    """institution_id from the path, the query string or the X-Institution-ID header."""
+    return (
+        request.path_params.get("institution_id")
+        or request.query_params.get("institution_id")
+        or request.headers.get("X-Institution-ID")
+    )
+
+class TenantHints(NamedTuple):
+    institution_id: Optional[str]
+    refs: List[Tuple[str, str]]  # (table_name, row_id) of the parent rows the request points at
+
+async def _json_body(request: Request) -> dict:
+    if request.method not in ("POST", "PUT", "PATCH") or "json" not in request.headers.get("content-type", ""):
+        return {}
+    try:
+        body = await request.json()  # FastAPI 가 이미 읽은 본문 (Request 에 캐시됨)
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+async def tenant_hints(request: Request) -> TenantHints:
+    """
+    What identifies the request's institution: path / query / X-Institution-ID, then the JSON body's
+    institution_id, then the parent ids (group_id, survey_id, ...) of the path, query and body.
+    """
+    body = await _json_body(request)
+    institution_id = institution_from_request(request) or body.get("institution_id")
+    refs = []
+    for source in (request.path_params, request.query_params, body):
+        for key, model in DIRECTORY_KEYS.items():
+            value = source.get(key)
+            if isinstance(value, (str, int)) and not isinstance(value, bool):
+                refs.append((model.__tablename__, str(value)))
+    return TenantHints(institution_id, refs)
+
+def resolve_institution(hints: TenantHints) -> Optional[str]:
+    """Explicit institution_id first, else the shard that holds a referenced parent row (None: shared DB)."""
+    if hints.institution_id or not shard_router.enabled:
+        return hints.institution_id
+    return shard_router.locate(hints.refs)
+
+def _tenant_session(hints: TenantHints, read_only: bool):
+    # 기관을 특정할 수 없는 요청은 400 대신 공유 DB 로 보낸다 (샤딩 이전과 같은 동작)
+    try:
+        return shard_router.open_session(resolve_institution(hints), read_only=read_only)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def get_tenant_db(hints: TenantHints = Depends(tenant_hints)):
+    """Write session on the shard of the request's institution (see tenant_hints)."""
+    db = _tenant_session(hints, read_only=False)
+    try:
+        yield db
+    finally:
+        shard_router.close_session(db)
+
+def get_tenant_read_db(hints: TenantHints = Depends(tenant_hints)):
+    """Read-only counterpart of get_tenant_db for tenant-scoped reads."""
+    db = _tenant_session(hints, read_only=True)
+    try:
+        yield db
+    finally:
+        shard_router.close_session(db)
+
+def run_on_tenant_shard(hints: TenantHints, fn, read_only: bool = False):
+    """
+    fn(session) on the request's shard. Blocking: async routes call it through run_in_threadpool
+    (the shards have no async engines).
+    """
+    db = _tenant_session(hints, read_only=read_only)
+    try:
+        return fn(db)
+    finally:
+        shard_router.close_session(db)
+
+# Shard directory maintenance: flush 에서 모으고, commit 후 공유 DB 에 반영, rollback 이면 버린다
+def _directory_key(obj):
+    return (obj.__tablename__, str(obj.id))
+
+@event.listens_for(Session, "after_flush")
+def _collect_directory_rows(session, flush_context):
+    institution_id = session.info.get("institution_id")
+    if not institution_id:
+        return
+    pending = session.info.setdefault("shard_directory", {})
+    for obj in session.new:
+        if isinstance(obj, DIRECTORY_MODELS):
+            pending[_directory_key(obj)] = institution_id
+    for obj in session.deleted:
+        if isinstance(obj, DIRECTORY_MODELS):
+            pending[_directory_key(obj)] = None
+
+@event.listens_for(Session, "after_commit")
+def _publish_directory_rows(session):
+    pending = session.info.pop("shard_directory", None)
+    if pending:
+        shard_router.record(pending)
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_directory_rows(session, previous_transaction):
+    session.info.pop("shard_directory", None)
@@ -2,16 +2,22 @@
 import pytest
 import os
 import sys
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 # Ensure backend modules can be imported
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
+# Tests build their own in-memory schema per function; skip the startup stamp check
+os.environ.setdefault("SCHEMA_STARTUP", "skip")
+
 from backend.main import app
-from backend.database import Base, get_db
+from backend.database import Base, get_db, get_read_db
+from backend.dependencies import get_current_user
+from backend.sharding import get_tenant_db, get_tenant_read_db
 
 # Use an in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
@@ -39,7 +45,7 @@ def db_session():
 @pytest.fixture(scope="function")
 def client(db_session):
     """
-    FastAPI TestClient with database override.
+    FastAPI TestClient with database override, authenticated as a SUPER_ADMIN (RBAC is covered elsewhere).
     """
     def override_get_db():
         try:
@@ -48,6 +54,36 @@ def client(db_session):
             db_session.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_tenant_db] = override_get_db
+    app.dependency_overrides[get_tenant_read_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: {"id": "test-admin", "roles": ["SUPER_ADMIN"]}
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
+
+@pytest.fixture
+def query_budget():
+    """
+    Fails the test when the wrapped block runs more SQL statements than declared (N+1 guard).
+
+        with query_budget(3):
+            client.get("/scientific/talent/")
+    """
+    @contextmanager
+    def budget(max_queries: int):
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        if len(statements) > max_queries:
+            listing = "\n".join(f"  {i + 1}. {sql.strip()[:150]}" for i, sql in enumerate(statements))
+            pytest.fail(f"Query budget exceeded: {len(statements)} statements (budget {max_queries})\n{listing}")
+
+    return budget
@@ -0,0 +1,70 @@
+import pytest
+from fastapi import HTTPException
+
+from backend import models
+from backend.routers_legacy import analytics
+
+def seed_org(db):
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add(models.Institution(id="inst_2", name="Other Inst", code="TI02", category="MARKET"))
+    db.add(models.OrgUnit(id="dept_1", institution_id="inst_1", name="IT Team", unit_type="TEAM"))
+    db.add(models.OrgUnit(id="dept_2", institution_id="inst_1", name="HR Team", unit_type="TEAM"))
+    db.add_all([
+        models.User(id="boss", institution_id="inst_1", org_unit_id="dept_1", email="boss@example.com", name="Boss"),
+        models.User(id="u1", institution_id="inst_1", org_unit_id="dept_1", email="u1@example.com", name="U1", reports_to_id="boss"),
+        models.User(id="u2", institution_id="inst_1", org_unit_id="dept_1", email="u2@example.com", name="U2", reports_to_id="boss"),
+        models.User(id="u3", institution_id="inst_1", org_unit_id="dept_2", email="u3@example.com", name="U3", reports_to_id="u1"),
+        models.User(id="other_boss", institution_id="inst_2", email="ob@example.com", name="Other Boss"),
+        models.User(id="o1", institution_id="inst_2", email="o1@example.com", name="O1", reports_to_id="other_boss"),
+    ])
+    db.add(models.JobPosition(id="pos_boss", user_id="boss", title="Director", grade=models.JobGrade.G1))
+    db.add_all([
+        models.HeadcountPlan(institution_id="inst_1", year=2024, org_unit_id="dept_1", authorized_count=4),
+        models.HeadcountPlan(institution_id="inst_1", year=2025, org_unit_id="dept_1", authorized_count=3),
+        models.HeadcountPlan(institution_id="inst_1", year=2025, org_unit_id="dept_2", authorized_count=2),
+        models.HeadcountPlan(institution_id="inst_2", year=2025, authorized_count=10),
+    ])
+    db.commit()
+
+def test_fill_rate_single_year_in_one_query(db_session, query_budget):
+    seed_org(db_session)
+    with query_budget(1):
+        rows = analytics.get_headcount_fill_rate(institution_id="inst_1", year=2025, years=None, db=db_session)
+
+    by_unit = {r["org_unit"]: r for r in rows}
+    assert set(by_unit) == {"IT Team", "HR Team"}
+    assert by_unit["IT Team"] == {"org_unit": "IT Team", "authorized": 3, "actual": 3, "fill_rate": 100.0}
+    assert by_unit["HR Team"]["actual"] == 1
+    assert by_unit["HR Team"]["fill_rate"] == 50.0
+
+def test_fill_rate_trend_in_one_query(db_session, query_budget):
+    seed_org(db_session)
+    with query_budget(1):
+        trend = analytics.get_headcount_fill_rate(institution_id="inst_1", year=None, years=[2025, 2024], db=db_session)
+
+    assert trend["years"] == [2024, 2025]
+    units = {u["org_unit_id"]: u for u in trend["org_units"]}
+    assert [p["year"] for p in units["dept_1"]["series"]] == [2024, 2025]
+    assert [p["fill_rate"] for p in units["dept_1"]["series"]] == [75.0, 100.0]
+    assert [p["year"] for p in units["dept_2"]["series"]] == [2025]
+    totals = {t["year"]: t for t in trend["totals"]}
+    assert totals[2024] == {"year": 2024, "authorized": 4, "actual": 3, "fill_rate": 75.0}
+    assert totals[2025]["authorized"] == 5
+    assert totals[2025]["actual"] == 4
+
+def test_fill_rate_requires_a_year(db_session):
+    with pytest.raises(HTTPException) as exc:
+        analytics.get_headcount_fill_rate(institution_id="inst_1", year=None, years=None, db=db_session)
+    assert exc.value.status_code == 422
+
+def test_span_of_control_is_scoped_to_institution(db_session, query_budget):
+    seed_org(db_session)
+    with query_budget(1):
+        rows = analytics.get_span_of_control(institution_id="inst_1", db=db_session)
+
+    by_manager = {r["manager_name"]: r for r in rows}
+    assert set(by_manager) == {"Boss", "U1"}
+    assert by_manager["Boss"]["span"] == 2
+    assert by_manager["Boss"]["job_title"] == "Director"
+    assert by_manager["Boss"]["grade"] == models.JobGrade.G1
+    assert by_manager["U1"] == {"manager_name": "U1", "job_title": "Unknown", "grade": "N/A", "span": 1}
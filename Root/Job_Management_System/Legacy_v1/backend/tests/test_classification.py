@@ -0,0 +1,159 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import crud, models
+from backend.dependencies import get_current_user
+from backend.routers_legacy import classification
+from backend.services.classification_service import ClassificationCache, ClassificationService, classification_cache
+from backend.sharding import get_tenant_read_db
+
+def seed_classification(db):
+    db.add(models.JobGroup(id="g_admin", name="Administration"))
+    db.add(models.JobGroup(id="g_empty", name="Empty Group"))
+    db.add(models.JobSeries(id="s_hr", group_id="g_admin", name="HR", ncs_code="0202"))
+    db.add(models.JobPosition(id="p_recruit", series_id="s_hr", title="Recruiter", grade=models.JobGrade.G3))
+    db.add(models.JobTask(id="t_screen", job_position_id="p_recruit", task_name="Screening"))
+    db.add(models.JobTask(id="t_plan", job_position_id="p_recruit", task_name="Planning"))
+    db.add(models.WorkItem(id="w_cv", job_task_id="t_screen", name="CV review", frequency=models.TaskFrequency.DAILY))
+    db.add(models.WorkItem(id="w_call", job_task_id="t_screen", name="Phone call", frequency=models.TaskFrequency.WEEKLY))
+    db.commit()
+
+@pytest.fixture
+def api(db_session):
+    app = FastAPI()
+    app.include_router(classification.router)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "admin", "roles": ["ADMIN"]}
+    app.dependency_overrides[get_tenant_read_db] = lambda: db_session
+    classification_cache.bump()
+    with TestClient(app) as c:
+        yield c
+
+def test_hierarchy_is_one_query(db_session, query_budget):
+    seed_classification(db_session)
+    with query_budget(1):
+        tree = ClassificationService(db_session).get_hierarchy()
+
+    assert [g["name"] for g in tree] == ["Administration", "Empty Group"]
+    assert tree[1]["children"] == []
+    position = tree[0]["children"][0]["children"][0]
+    assert position["name"] == "Recruiter"
+    tasks = {t["name"]: t for t in position["children"]}
+    assert tasks["Planning"]["children"] == []
+    assert [i["name"] for i in tasks["Screening"]["children"]] == ["CV review", "Phone call"]
+
+def test_matrix_is_one_query(db_session, query_budget):
+    seed_classification(db_session)
+    with query_budget(1):
+        matrix = ClassificationService(db_session).get_matrix()
+
+    assert [(r["task_name"], r["work_item_name"]) for r in matrix] == [
+        ("Planning", None), ("Screening", "CV review"), ("Screening", "Phone call")
+    ]
+
+def test_etag_and_invalidation_on_write(db_session, api, query_budget):
+    seed_classification(db_session)
+    first = api.get("/classification/hierarchy")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    # Cached: no query, and the client's copy is still current
+    with query_budget(0):
+        cached = api.get("/classification/hierarchy", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    db_session.add(models.JobSeries(id="s_fin", group_id="g_empty", name="Finance"))
+    db_session.commit()
+    changed = api.get("/classification/hierarchy", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()[1]["children"][0]["name"] == "Finance"
+
+def test_rollback_keeps_cache(db_session, api):
+    seed_classification(db_session)
+    etag = api.get("/classification/matrix").headers["etag"]
+    version = classification_cache.version
+    db_session.add(models.JobGroup(id="g_tmp", name="Temp"))
+    db_session.flush()
+    db_session.rollback()
+    assert classification_cache.version == version
+    assert api.get("/classification/matrix", headers={"If-None-Match": etag}).status_code == 304
+
+def test_commit_in_another_worker_invalidates_cache(tmp_path):
+    stamp = str(tmp_path / "classification.version")
+    worker_a = ClassificationCache(stamp_path=stamp, check_interval=0)
+    worker_b = ClassificationCache(stamp_path=stamp, check_interval=0)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"n": len(builds)}
+
+    worker_a.get_or_build(None, "matrix", build)
+    worker_a.get_or_build(None, "matrix", build)
+    assert len(builds) == 1
+
+    worker_b.bump()  # a classification write committed in worker B
+    worker_b.bump()  # twice within the same mtime tick
+    _, body = worker_a.get_or_build(None, "matrix", build)
+    assert len(builds) == 2 and body == b'{"n":2}'
+    worker_a.get_or_build(None, "matrix", build)
+    assert len(builds) == 2
+
+def test_cache_entries_expire_after_ttl():
+    cache = ClassificationCache(ttl=0, stamp_path=None)
+    builds = []
+    cache.get_or_build(None, "hierarchy", lambda: builds.append(1) or [])
+    cache.get_or_build(None, "hierarchy", lambda: builds.append(1) or [])
+    assert len(builds) == 2
+
+def matrix_row(**values):
+    row = {"group_name": "Administration", "series_name": "HR", "position_title": "Recruiter",
+           "task_name": "Screening", "work_item_name": "CV review", "frequency": "DAILY", "workload": 0.0}
+    row.update(values)
+    return classification.JobMatrixItem(**row)
+
+def test_save_matrix_bulk_upsert(db_session, query_budget):
+    seed_classification(db_session)
+    items = [
+        matrix_row(workload=0.5),                                   # update hours of an existing item
+        matrix_row(work_item_name="Phone call", frequency="WEEKLY"),  # unchanged
+        matrix_row(position_grade="G2", task_name="Onboarding", work_item_name="Orientation", frequency="MONTHLY"),
+        matrix_row(series_name="Payroll", position_title="Payroll Officer", task_name="Payroll run",
+                   work_item_name=None, position_grade="G4"),
+        matrix_row(group_name="Finance", series_name="Accounting", position_title="Accountant",
+                   task_name="Closing", work_item_name="Ledger", frequency="MONTHLY"),
+        matrix_row(group_name="Finance", series_name="Accounting", position_title="Accountant",
+                   task_name="Closing", work_item_name="Ledger", frequency="YEARLY"),  # repeated row: last wins
+    ]
+    # 5 preloads + 5 inserts + 2 updates, whatever the row count
+    with query_budget(12):
+        summary = ClassificationService(db_session).save_matrix(items)
+
+    assert summary == {
+        "groups": {"created": 1, "updated": 0},
+        "series": {"created": 2, "updated": 0},
+        "positions": {"created": 2, "updated": 1},
+        "tasks": {"created": 3, "updated": 0},
+        "work_items": {"created": 2, "updated": 1},
+    }
+    db_session.expire_all()
+    assert db_session.get(models.JobPosition, "p_recruit").grade == models.JobGrade.G2
+    assert crud.get_by_id(db_session, models.WorkItem, "w_cv").estimated_hours_per_occurrence == 0.5
+    ledger = db_session.query(models.WorkItem).filter(models.WorkItem.name == "Ledger").one()
+    assert ledger.frequency == models.TaskFrequency.YEARLY
+    assert db_session.query(models.JobGroup).filter(models.JobGroup.name == "Finance").count() == 1
+
+    # Saving the same matrix again changes nothing
+    assert ClassificationService(db_session).save_matrix(items) == {
+        level: {"created": 0, "updated": 0} for level in ("groups", "series", "positions", "tasks", "work_items")
+    }
+
+def test_save_matrix_invalidates_cache(db_session, api):
+    seed_classification(db_session)
+    etag = api.get("/classification/matrix").headers["etag"]
+    ClassificationService(db_session).save_matrix([matrix_row(work_item_name="Interview", frequency="WEEKLY")])
+    response = api.get("/classification/matrix", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "Interview" in [row["work_item_name"] for row in response.json()]
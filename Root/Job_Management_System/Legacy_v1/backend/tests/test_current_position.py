@@ -0,0 +1,47 @@
+from datetime import date
+
+from backend import models
+from backend.routers_legacy import analytics, career
+from backend.services.span_service import SpanOfControlService
+
+def seed_positions(db):
+    """
+    boss: "a_old" (2015) < "m_undated" (no date) < "z_new" (2023) by id; "b_future" is a future model dated 2030.
+    staff: only an undated position.
+    """
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add(models.User(id="boss", institution_id="inst_1", email="boss@example.com", name="Boss"))
+    db.add(models.User(id="staff", institution_id="inst_1", email="staff@example.com", name="Staff", reports_to_id="boss"))
+    db.add_all([
+        models.JobPosition(id="a_old", user_id="boss", title="Team Lead", grade=models.JobGrade.G3, start_date=date(2015, 3, 1)),
+        models.JobPosition(id="m_undated", user_id="boss", title="Acting Lead", grade=models.JobGrade.G3),
+        models.JobPosition(id="z_new", user_id="boss", title="Director", grade=models.JobGrade.G2, start_date=date(2023, 1, 1)),
+        models.JobPosition(id="b_future", user_id="boss", title="Chief", grade=models.JobGrade.G1,
+                           start_date=date(2030, 1, 1), is_future_model=True),
+        models.JobPosition(id="s_only", user_id="staff", title="Analyst", grade=models.JobGrade.G4),
+    ])
+    db.add(models.PerformanceReview(user_id="boss", year=2024, status=models.ReviewStatus.FINAL, grade="S"))
+    db.commit()
+
+def test_every_reader_picks_the_newest_started_position(db_session):
+    seed_positions(db_session)
+
+    # MIN(id) 였다면 a_old (2015) 가 선택됨
+    promotion = career.get_promotion_candidates(performance_grades=["S"], position_grades=None, series_id=None,
+                                                institution_id=None, db=db_session)
+    assert [(row["user_id"], row["current_title"]) for row in promotion] == [("boss", "Director")]
+
+    spans = analytics.get_span_of_control(institution_id="inst_1", db=db_session)
+    assert [(row["manager_name"], row["job_title"]) for row in spans] == [("Boss", "Director")]
+
+    tree = SpanOfControlService(db_session).get_span_of_control_analysis()
+    assert tree[0]["title"] == "Director"
+    assert tree[0]["children"][0]["title"] == "Analyst"  # 날짜가 없어도 유일한 직위는 현재 직위
+
+def test_dated_position_wins_over_undated_and_future(db_session):
+    seed_positions(db_session)
+    db_session.delete(db_session.get(models.JobPosition, "z_new"))
+    db_session.commit()
+
+    tree = SpanOfControlService(db_session).get_span_of_control_analysis()
+    assert tree[0]["title"] == "Team Lead"
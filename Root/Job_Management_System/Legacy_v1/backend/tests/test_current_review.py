@@ -0,0 +1,99 @@
+import subprocess
+import sys
+
+from backend import crud, models
+from backend.routers_legacy import career
+from backend.services import current_review
+
+FINAL, DRAFT = models.ReviewStatus.FINAL, models.ReviewStatus.DRAFT
+
+def seed_staff(db):
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add_all([
+        models.User(id="emp_1", institution_id="inst_1", email="a@example.com", name="Star"),
+        models.User(id="emp_2", institution_id="inst_1", email="b@example.com", name="Average"),
+        models.User(id="emp_3", institution_id="inst_1", email="c@example.com", name="Future Only"),
+    ])
+    db.add_all([
+        models.JobPosition(id="pos_1", user_id="emp_1", title="Engineer", grade=models.JobGrade.G3),
+        models.JobPosition(id="pos_1_future", user_id="emp_1", title="Architect", grade=models.JobGrade.G2, is_future_model=True),
+        models.JobPosition(id="pos_2", user_id="emp_2", title="Analyst", grade=models.JobGrade.G4),
+        models.JobPosition(id="pos_3", user_id="emp_3", title="Planner", grade=models.JobGrade.G4, is_future_model=True),
+    ])
+    db.add_all([
+        models.PerformanceReview(id="r1_2023", user_id="emp_1", year=2023, status=FINAL, grade="B"),
+        models.PerformanceReview(id="r1_2024", user_id="emp_1", year=2024, status=FINAL, grade="S"),
+        models.PerformanceReview(id="r2_2024", user_id="emp_2", year=2024, status=FINAL, grade="A"),
+        models.PerformanceReview(id="r2_2025", user_id="emp_2", year=2025, status=DRAFT, grade="B"),
+        models.PerformanceReview(id="r3_2024", user_id="emp_3", year=2024, status=FINAL, grade="S"),
+    ])
+    db.commit()
+
+def projection(db):
+    return {row.user_id: (row.review_id, row.final_review_id) for row in db.query(models.CurrentReview)}
+
+def candidates(db, **params):
+    params = {"performance_grades": ["S", "A"], "position_grades": None, "series_id": None, "institution_id": None, **params}
+    return {row["user_id"]: row for row in career.get_promotion_candidates(db=db, **params)}
+
+def test_projection_follows_review_writes(db_session):
+    seed_staff(db_session)
+    assert projection(db_session) == {
+        "emp_1": ("r1_2024", "r1_2024"),
+        "emp_2": ("r2_2025", "r2_2024"),
+        "emp_3": ("r3_2024", "r3_2024"),
+    }
+
+    # Finalizing the draft moves the FINAL pointer
+    crud.get_by_id(db_session, models.PerformanceReview, "r2_2025").status = FINAL
+    db_session.add(models.PerformanceReview(id="r1_2025", user_id="emp_1", year=2025, status=DRAFT))
+    db_session.commit()
+    assert projection(db_session)["emp_2"] == ("r2_2025", "r2_2025")
+    assert projection(db_session)["emp_1"] == ("r1_2025", "r1_2024")
+
+    db_session.delete(crud.get_by_id(db_session, models.PerformanceReview, "r1_2025"))
+    db_session.delete(crud.get_by_id(db_session, models.PerformanceReview, "r3_2024"))
+    db_session.commit()
+    assert projection(db_session)["emp_1"] == ("r1_2024", "r1_2024")
+    assert "emp_3" not in projection(db_session)
+
+    incremental = projection(db_session)
+    current_review.rebuild(db_session)
+    assert projection(db_session) == incremental
+
+def test_promotion_candidates_in_one_query(db_session, query_budget):
+    seed_staff(db_session)
+    with query_budget(1):
+        rows = candidates(db_session)
+
+    # emp_2's latest review is the 2025 draft (grade B); emp_3 has no current position
+    assert set(rows) == {"emp_1"}
+    assert rows["emp_1"]["current_title"] == "Engineer"
+    assert rows["emp_1"]["performance_grade"] == "S"
+    assert rows["emp_1"]["performance_year"] == 2024
+
+def test_promotion_candidates_filters(db_session):
+    seed_staff(db_session)
+    assert set(candidates(db_session, performance_grades=["A", "B"])) == {"emp_2"}
+    assert set(candidates(db_session, performance_grades=["S", "B"], position_grades=[models.JobGrade.G4])) == {"emp_2"}
+    assert candidates(db_session, institution_id="other") == {}
+
+PLAIN_WRITE = """
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from backend import models
+from backend.database import Base
+
+engine = create_engine("sqlite://")
+Base.metadata.create_all(engine)
+with Session(engine) as db:
+    db.add(models.User(id="u1", email="u1@example.com", name="U1"))
+    db.add(models.PerformanceReview(id="r1", user_id="u1", year=2024, status=models.ReviewStatus.FINAL))
+    db.commit()
+    print(db.query(models.CurrentReview.final_review_id).scalar(), db.query(models.ReportingClosure).count())
+"""
+
+def test_plain_session_writes_keep_the_projections():
+    # 새 인터프리터에서 모델만 import 하고 쓰기 (performance 라우터처럼 서비스 모듈을 거치지 않는 경로)
+    result = subprocess.run([sys.executable, "-c", PLAIN_WRITE], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["r1", "1"]
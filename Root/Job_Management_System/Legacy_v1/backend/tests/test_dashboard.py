@@ -0,0 +1,138 @@
+import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import models
+from backend.database import get_db, get_read_db
+from backend.dependencies import get_current_user
+from backend.routers_legacy import users
+from backend.sharding import get_tenant_db, get_tenant_read_db
+from backend.services import dashboard_service
+from backend.services.dashboard_service import DashboardCache, dashboard_cache
+
+COMPLETED, PLANNED = models.TrainingStatus.COMPLETED, models.TrainingStatus.PLANNED
+
+def seed_employee(db):
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add_all([
+        models.User(id="emp_1", institution_id="inst_1", email="a@example.com", name="Kim"),
+        models.User(id="emp_2", institution_id="inst_1", email="b@example.com", name="Lee"),
+    ])
+    db.add(models.PerformanceReview(id="rev_1", user_id="emp_1", year=2024))
+    db.add_all([
+        models.PerformanceGoal(review_id="rev_1", category="MBO", goal_text=f"Goal {i}") for i in range(3)
+    ])
+    db.add_all([
+        models.TrainingProgram(id="prog_8h", name="Security", duration_hours=8),
+        models.TrainingProgram(id="prog_4h", name="Writing", duration_hours=4.5),
+    ])
+    db.add_all([
+        models.EmployeeTraining(id="tr_1", user_id="emp_1", program_id="prog_8h", status=COMPLETED,
+                                completion_date=datetime.date(2024, 3, 1)),
+        models.EmployeeTraining(id="tr_2", user_id="emp_1", program_id="prog_4h", status=COMPLETED),
+        models.EmployeeTraining(id="tr_3", user_id="emp_1", program_id="prog_8h", status=PLANNED),
+        models.EmployeeTraining(id="tr_4", user_id="emp_2", program_id="prog_8h", status=COMPLETED),
+    ])
+    db.commit()
+
+@pytest.fixture
+def cached(db_session):
+    """Fills the shared cache for both employees with a marker payload."""
+    seed_employee(db_session)
+    dashboard_cache.clear()
+    for user_id in ("emp_1", "emp_2"):
+        dashboard_cache.get_or_build(user_id, lambda: {"user": user_id})
+    yield dashboard_cache
+    dashboard_cache.clear()
+
+@pytest.fixture
+def api(db_session):
+    app = FastAPI()
+    app.include_router(users.router)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "admin", "roles": ["ADMIN"]}
+    for dependency in (get_db, get_read_db, get_tenant_db, get_tenant_read_db):
+        app.dependency_overrides[dependency] = lambda: db_session
+    dashboard_cache.clear()
+    with TestClient(app) as c:
+        yield c
+    dashboard_cache.clear()
+
+def test_stats_in_one_query(db_session, query_budget):
+    seed_employee(db_session)
+    with query_budget(1):
+        stats = dashboard_service.dashboard_stats(db_session, "emp_1")
+    assert stats == {"goals_completed": 3, "training_hours": 12.5}
+    assert dashboard_service.dashboard_stats(db_session, "nobody") == {"goals_completed": 0, "training_hours": 0.0}
+
+def test_cache_hit_does_not_rebuild():
+    cache = DashboardCache()
+    builds = []
+    build = lambda: builds.append(1) or {"n": len(builds)}
+    assert cache.get_or_build("emp_1", build) == {"n": 1}
+    assert cache.get_or_build("emp_1", build) == {"n": 1}
+    assert len(builds) == 1
+
+    cache.ttl = 0
+    cache.invalidate(["emp_1"])
+    cache.get_or_build("emp_1", build)
+    cache.get_or_build("emp_1", build)
+    assert len(builds) == 3
+
+def test_lru_eviction():
+    cache = DashboardCache(size=2)
+    for user_id in ("a", "b", "a", "c"):
+        cache.get_or_build(user_id, lambda: {})
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+def test_training_write_invalidates_only_that_user(db_session, cached):
+    db_session.get(models.EmployeeTraining, "tr_3").status = COMPLETED
+    db_session.commit()
+    assert "emp_1" not in cached
+    assert "emp_2" in cached
+
+def test_goal_write_invalidates_review_owner(db_session, cached):
+    db_session.add(models.PerformanceGoal(review_id="rev_1", category="MBO", goal_text="New goal"))
+    db_session.commit()
+    assert "emp_1" not in cached
+    assert "emp_2" in cached
+
+def test_program_hours_change_clears_all(db_session, cached):
+    db_session.get(models.TrainingProgram, "prog_8h").duration_hours = 16
+    db_session.commit()
+    assert "emp_1" not in cached and "emp_2" not in cached
+
+def test_rollback_keeps_cache(db_session, cached):
+    db_session.add(models.EmployeeTraining(user_id="emp_2", program_id="prog_4h", status=COMPLETED))
+    db_session.flush()
+    db_session.rollback()
+    assert "emp_1" in cached and "emp_2" in cached
+
+def test_dashboard_and_pulse_endpoints(db_session, api, query_budget):
+    seed_employee(db_session)
+    db_session.add(models.JobPosition(id="pos_1", user_id="emp_1", title="Recruiter", start_date=datetime.date(2020, 1, 1)))
+    db_session.add(models.JobTask(job_position_id="pos_1", task_name="Screening"))
+    db_session.commit()
+
+    # 사용자 조회 + 집계 4회 (프로필, 통계, 오늘의 기분, 핵심 업무)
+    with query_budget(5):
+        first = api.get("/users/me/dashboard")
+    assert first.status_code == 200
+    body = first.json()
+    assert body["user"]["title"] == "Recruiter" and body["key_tasks"] == ["Screening"]
+    assert body["stats"] == {"goals_completed": 3, "training_hours": 12.5, "pulse_score": "N/A"}
+    with query_budget(1):
+        assert api.get("/users/me/dashboard").json() == body
+
+    # 사용자 + 오늘 기록 여부 + INSERT + refresh
+    with query_budget(4):
+        pulse = api.post("/users/me/pulse", json={"mood_score": 4, "workload_level": "HIGH"})
+    assert pulse.status_code == 200
+    assert pulse.json()["user_id"] == "emp_1" and pulse.json()["date"] == datetime.date.today().isoformat()
+    assert api.post("/users/me/pulse", json={"mood_score": 2}).status_code == 400
+
+    # 기분 기록 커밋 시 캐시가 무효화되어 다시 계산됨
+    with query_budget(5):
+        after = api.get("/users/me/dashboard").json()
+    assert after["stats"]["pulse_score"] == dashboard_service.PULSE_EMOJIS[4]
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from backend.database import create_profiled_engine, read_only_url
+
+def test_production_profile_enables_wal_pragmas(tmp_path):
+    engine = create_profiled_engine(f"sqlite:///{tmp_path / 'profile.db'}", profile="production")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1 # NORMAL
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -64000
+    engine.dispose()
+
+def test_default_profile_keeps_rollback_journal(tmp_path):
+    engine = create_profiled_engine(f"sqlite:///{tmp_path / 'default.db'}", profile="default")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    engine.dispose()
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        create_profiled_engine("sqlite:///:memory:", profile="turbo")
+
+def test_read_only_url_for_sqlite_files():
+    assert read_only_url("sqlite:///./hr.db") == "sqlite:///file:./hr.db?mode=ro&uri=true"
+    assert read_only_url("sqlite:///:memory:") == "sqlite:///:memory:"
+    assert read_only_url("postgresql://hr@db/hr") == "postgresql://hr@db/hr"
+
+def test_read_engine_sees_data_but_cannot_write(tmp_path):
+    db_url = f"sqlite:///{tmp_path / 'rw.db'}"
+    writer = create_profiled_engine(db_url, profile="production")
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO items VALUES (1)"))
+
+    reader = create_profiled_engine(read_only_url(db_url), profile="production", read_only=True)
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO items VALUES (2)"))
+    reader.dispose()
+    writer.dispose()
@@ -0,0 +1,89 @@
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import crud, models
+from backend.database import get_db
+from backend.dependencies import get_current_user
+from backend.routers_legacy import evaluation
+
+def seed_session(db):
+    db.add(models.JobGroup(id="g1", name="Administration"))
+    db.add(models.JobSeries(id="s1", group_id="g1", name="HR"))
+    for job_id in ("p1", "p2", "p3", "p4"):
+        db.add(models.JobPosition(id=job_id, series_id="s1", title=job_id.upper(), grade=models.JobGrade.G3))
+    db.add(models.User(id="rater", email="rater@example.com", name="Rater"))
+    db.add(models.EvaluationSession(id="sess", name="2025 Committee", start_date=date(2025, 1, 1)))
+    # 평가자는 p1, p2, p4만 배정받음 (p3은 미배정)
+    for job_id in ("p1", "p2", "p4"):
+        db.add(models.EvaluationAssignment(session_id="sess", rater_user_id="rater", target_job_position_id=job_id))
+    # p2는 이전 제출분이 있어 갱신 대상
+    db.add(models.JobEvaluation(id="ev_p2", job_position_id="p2", session_id="sess"))
+    db.add(models.JobEvaluationScore(id="sc_p2", evaluation_id="ev_p2", rater_type=models.RaterType.SUPERVISOR_1,
+                                     rater_user_id="rater", factor_scores={"Knowledge": 1.0}, raw_total=1.0))
+    db.commit()
+
+@pytest.fixture
+def api(db_session):
+    app = FastAPI()
+    app.include_router(evaluation.router)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "admin", "roles": ["ADMIN"]}
+    app.dependency_overrides[get_db] = lambda: db_session
+    with TestClient(app) as c:
+        yield c
+
+def submission(ratings, rater_user_id="rater", rater_type="SUPERVISOR_1"):
+    return {
+        "session_id": "sess", "rater_type": rater_type, "rater_user_id": rater_user_id,
+        "ratings": [{"job_position_id": job_id, "factor_scores": scores} for job_id, scores in ratings],
+    }
+
+def test_submit_skips_unassigned_jobs_and_reloads_the_matrix(db_session, api, query_budget):
+    seed_session(db_session)
+    body = submission([
+        ("p1", {"Knowledge": 4.0, "Impact": 3.0}),
+        ("p2", {"Knowledge": 5.0, "Impact": 5.0}),
+        ("p3", {"Knowledge": 9.0, "Impact": 9.0}),
+    ])
+    # 조회 3회(배정, 평가, 기존 점수) + 일괄 INSERT 평가/점수 + UPDATE 점수: 행 수와 무관
+    with query_budget(6):
+        response = api.post("/sessions/sess/matrix_submission", json=body)
+    assert response.status_code == 200
+    assert response.json()["processed_count"] == 2
+
+    # 미배정 p3은 평가도 점수도 생기지 않음, p2는 기존 점수가 갱신됨
+    assert db_session.query(models.JobEvaluation).filter_by(job_position_id="p3").count() == 0
+    db_session.expire_all()
+    updated = crud.get_by_id(db_session, models.JobEvaluationScore, "sc_p2")
+    assert updated.factor_scores == {"Knowledge": 5.0, "Impact": 5.0}
+    assert updated.raw_total == 10.0
+    assert db_session.query(models.JobEvaluationScore).count() == 2
+
+    with query_budget(1):
+        reloaded = api.get("/sessions/sess/matrix_submission", params={"rater_type": "SUPERVISOR_1", "rater_user_id": "rater"})
+    assert reloaded.status_code == 200
+    ratings = {r["job_position_id"]: r["factor_scores"] for r in reloaded.json()["ratings"]}
+    assert ratings == {"p1": {"Knowledge": 4.0, "Impact": 3.0}, "p2": {"Knowledge": 5.0, "Impact": 5.0}}
+
+def test_resubmit_updates_instead_of_duplicating(db_session, api):
+    seed_session(db_session)
+    for knowledge in (2.0, 7.0):
+        body = submission([("p1", {"Knowledge": knowledge}), ("p1", {"Knowledge": knowledge + 1})])
+        assert api.post("/sessions/sess/matrix_submission", json=body).json()["processed_count"] == 2
+
+    rows = db_session.query(models.JobEvaluationScore).join(models.JobEvaluation).filter(
+        models.JobEvaluation.job_position_id == "p1").all()
+    assert [r.factor_scores for r in rows] == [{"Knowledge": 8.0}]
+
+def test_external_rater_matrix_is_stored_without_a_user(db_session, api):
+    seed_session(db_session)
+    body = submission([("p3", {"Knowledge": 6.0})], rater_user_id=None, rater_type="EXTERNAL")
+    assert api.post("/sessions/sess/matrix_submission", json=body).json()["processed_count"] == 1
+
+    reloaded = api.get("/sessions/sess/matrix_submission", params={"rater_type": "EXTERNAL"}).json()
+    assert reloaded["ratings"] == [{"job_position_id": "p3", "factor_scores": {"Knowledge": 6.0}}]
+    # 내부 평가자의 매트릭스에는 섞이지 않음
+    internal = api.get("/sessions/sess/matrix_submission", params={"rater_type": "SUPERVISOR_1", "rater_user_id": "rater"}).json()
+    assert [r["job_position_id"] for r in internal["ratings"]] == ["p2"]
@@ -0,0 +1,99 @@
+import datetime
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend import models
+from backend.database import get_db
+from backend.dependencies import get_current_user
+from backend.routers_legacy import reporting
+
+def seed_team(db, n_staff=6):
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add(models.OrgUnit(id="dept_1", institution_id="inst_1", name="IT Team", unit_type="TEAM"))
+    db.add(models.OrgUnit(id="dept_2", institution_id="inst_1", name="HR Team", unit_type="TEAM"))
+    db.add(models.JobGroup(id="g_it", name="IT"))
+    db.add(models.JobSeries(id="s_dev", group_id="g_it", name="Development"))
+    db.add(models.TrainingProgram(id="prog_1", name="Security Basics", duration_hours=8))
+    for i in range(n_staff):
+        user_id = f"emp_{i}"
+        db.add(models.User(id=user_id, institution_id="inst_1", org_unit_id="dept_1",
+                           email=f"e{i}@example.com", name=f"Staff {i}"))
+        db.add(models.JobPosition(id=f"pos_{i}", user_id=user_id, series_id="s_dev", title="Engineer",
+                                  grade=models.JobGrade.G3))
+        db.add(models.PerformanceReview(id=f"rev_{i}", user_id=user_id, year=2024,
+                                        status=models.ReviewStatus.FINAL, grade="A", total_score=80 + i))
+        db.add(models.EmployeeTraining(user_id=user_id, program_id="prog_1", status=models.TrainingStatus.COMPLETED,
+                                       completion_date=datetime.date(2024, 3, 1)))
+    db.add(models.JobEvaluation(job_position_id="pos_0", grade=models.JobGrade.G2))
+    db.add(models.User(id="emp_hr", institution_id="inst_1", org_unit_id="dept_2", email="hr@example.com", name="HR Staff"))
+    db.commit()
+
+@pytest.fixture
+def api(db_session):
+    app = FastAPI()
+    app.include_router(reporting.router)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "admin", "roles": ["ADMIN"]}
+    app.dependency_overrides[get_db] = lambda: db_session
+    with TestClient(app) as c:
+        yield c
+
+def ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+@pytest.mark.parametrize("n_staff", [2, 12])
+def test_org_unit_cards_fixed_query_count(db_session, api, query_budget, n_staff):
+    seed_team(db_session, n_staff)
+    db_session.expire_all()
+    with query_budget(6):
+        response = api.get("/reporting/job-cards", params={"org_unit_id": "dept_1"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    cards = ndjson(response)
+    assert len(cards) == n_staff
+    first = cards[0]
+    assert first["user_id"] == "emp_0"
+    assert first["profile"]["department"] == "IT Team"
+    assert first["position"] == {"title": "Engineer", "series": "Development", "group": "IT", "grade": "G2"}
+    assert first["performance"] == {"year": 2024, "grade": "A", "score": 80}
+    assert first["trainings"] == [{"program": "Security Basics", "date": "2024-03-01", "status": "COMPLETED"}]
+    assert cards[1]["position"]["grade"] == "G3"
+
+def test_cards_by_user_ids_match_single_card(db_session, api):
+    seed_team(db_session)
+    response = api.get("/reporting/job-cards", params=[("user_ids", "emp_hr"), ("user_ids", "emp_1")])
+    cards = {card.pop("user_id"): card for card in ndjson(response)}
+    assert set(cards) == {"emp_hr", "emp_1"}
+    assert cards["emp_1"] == api.get("/reporting/job-card/emp_1").json()
+    assert cards["emp_hr"]["position"]["title"] == "No Position"
+    assert cards["emp_hr"]["performance"]["grade"] == "N/A"
+
+def test_cards_require_a_selection(db_session, api):
+    assert api.get("/reporting/job-cards").status_code == 422
+    assert api.get("/reporting/job-card/unknown").status_code == 404
+
+def test_cards_show_the_current_position(db_session, api):
+    seed_team(db_session, n_staff=1)
+    # 이전 직위 / 날짜 없는 직위 / 미래모델 사이에서 start_date 가 가장 최근인 직위가 현재 직위
+    db_session.add_all([
+        models.JobPosition(id="a_old", user_id="emp_0", title="Junior Engineer", grade=models.JobGrade.G4,
+                           start_date=datetime.date(2015, 3, 1)),
+        models.JobPosition(id="z_new", user_id="emp_0", title="Lead Engineer", grade=models.JobGrade.G2,
+                           start_date=datetime.date(2023, 1, 1)),
+        models.JobPosition(id="b_future", user_id="emp_0", title="Architect", grade=models.JobGrade.G1,
+                           start_date=datetime.date(2030, 1, 1), is_future_model=True),
+        models.JobPosition(id="f_only", user_id="emp_hr", title="HR Partner", grade=models.JobGrade.G3,
+                           is_future_model=True),
+    ])
+    db_session.commit()
+
+    card = api.get("/reporting/job-card/emp_0").json()
+    assert card["position"]["title"] == "Lead Engineer"
+    assert [h["title"] for h in card["history"] if h["period"] != "Past"] == ["Lead Engineer"]
+    response = api.get("/reporting/job-cards", params=[("user_ids", "emp_0"), ("user_ids", "emp_hr")])
+    cards = {c.pop("user_id"): c for c in ndjson(response)}
+    assert cards["emp_0"] == card
+    assert cards["emp_hr"]["position"]["title"] == "No Position"
@@ -0,0 +1,100 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend import crud, models
+from backend.database import Base, create_profiled_async_engine, get_async_db, get_async_read_db
+from backend.routers_legacy import nine_box
+from backend.services.nine_box_service import NineBoxService
+
+def seed_reviews(db):
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add(models.OrgUnit(id="dept_1", institution_id="inst_1", name="IT Team", unit_type="TEAM"))
+    db.add(models.User(id="emp_1", institution_id="inst_1", org_unit_id="dept_1", email="a@example.com", name="Star"))
+    db.add(models.User(id="emp_2", institution_id="inst_1", email="b@example.com", name="No Dept"))
+    db.add(models.User(id="emp_3", institution_id="inst_1", email="c@example.com", name="Draft Only"))
+    FINAL, DRAFT = models.ReviewStatus.FINAL, models.ReviewStatus.DRAFT
+    db.add_all([
+        # emp_1: the 2024 FINAL review wins over the older FINAL and the newer DRAFT
+        models.PerformanceReview(id="r1_2023", user_id="emp_1", year=2023, status=FINAL, total_score=50, score_potential=50),
+        models.PerformanceReview(id="r1_2024", user_id="emp_1", year=2024, status=FINAL, total_score=90, score_potential=85),
+        models.PerformanceReview(id="r1_2025", user_id="emp_1", year=2025, status=DRAFT, total_score=10, score_potential=10),
+        models.PerformanceReview(id="r2_2024", user_id="emp_2", year=2024, status=FINAL, total_score=65, score_potential=40,
+                                 nine_box_position=4),
+        models.PerformanceReview(id="r3_2024", user_id="emp_3", year=2024, status=DRAFT, total_score=99, score_potential=99),
+    ])
+    db.commit()
+
+def test_grid_uses_latest_final_review_in_one_query(db_session, query_budget):
+    seed_reviews(db_session)
+    with query_budget(1):
+        grid = NineBoxService(db_session).get_grid_data()
+
+    employees = {e["id"]: e for e in grid["employees"]}
+    assert set(employees) == {"emp_1", "emp_2"}
+    assert employees["emp_1"]["review_id"] == "r1_2024"
+    assert employees["emp_1"]["dept"] == "IT Team"
+    assert employees["emp_1"]["box"] == 9
+    # Calibrated position is kept as stored
+    assert employees["emp_2"]["dept"] == "N/A"
+    assert employees["emp_2"]["box"] == 4
+    assert grid["distribution"]["Star"] == 1
+
+def test_auto_map_updates_latest_reviews_only(db_session):
+    seed_reviews(db_session)
+    result = NineBoxService(db_session).auto_map_all()
+    assert result == {"updated_count": 2}
+
+    boxes = {r.id: r.nine_box_position for r in db_session.query(models.PerformanceReview)}
+    assert boxes["r1_2024"] == 9
+    assert boxes["r2_2024"] == 2  # perf 65 (mid) / potential 40 (low)
+    assert boxes["r1_2023"] is None
+    assert boxes["r3_2024"] is None
+
+def test_sql_box_matches_python_thresholds(db_session):
+    seed_reviews(db_session)
+    service = NineBoxService(db_session)
+    for perf in (0, 59.9, 60, 79.9, 80, 100):
+        for pot in (0, 59.9, 60, 79.9, 80, 100):
+            review = crud.get_by_id(db_session, models.PerformanceReview, "r1_2024")
+            review.total_score, review.score_potential = perf, pot
+            db_session.commit()
+            service.auto_map_all()
+            db_session.expire_all()
+            expected, _, _ = service._calculate_box_position(perf, pot)
+            assert crud.get_by_id(db_session, models.PerformanceReview, "r1_2024").nine_box_position == expected
+
+def test_async_routes_await_their_queries(tmp_path):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    url = f"sqlite:///{tmp_path / 'nine_box.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    with sessionmaker(bind=sync_engine)() as db:
+        seed_reviews(db)
+
+    async_engine = create_profiled_async_engine(url)
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(nine_box.router)
+    app.dependency_overrides[get_async_db] = override
+    app.dependency_overrides[get_async_read_db] = override
+    with TestClient(app) as api:
+        grid = api.get("/scientific/talent/").json()
+        assert {e["id"]: e["box"] for e in grid["employees"]} == {"emp_1": 9, "emp_2": 4}
+        assert api.post("/scientific/talent/auto-map").json() == {"updated_count": 2}
+        moved = api.post("/scientific/talent/move", json={"review_id": "r2_2024", "target_box": 7}).json()
+        assert moved["box"] == 7
+
+    with sessionmaker(bind=sync_engine)() as db:
+        assert crud.get_by_id(db, models.PerformanceReview, "r1_2024").nine_box_position == 9
+        assert crud.get_by_id(db, models.PerformanceReview, "r2_2024").nine_box_position == 7
+    sync_engine.dispose()
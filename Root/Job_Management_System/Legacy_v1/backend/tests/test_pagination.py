@@ -0,0 +1,35 @@
+import pytest
+from fastapi import HTTPException
+from backend import models
+from backend.pagination import keyset_page, encode_cursor, decode_cursor
+
+def seed_users(db, count):
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add(models.Institution(id="inst_2", name="Other Inst", code="TI02", category="MARKET"))
+    for i in range(count):
+        db.add(models.User(id=f"u{i:03d}", institution_id="inst_1", email=f"u{i}@example.com", name=f"User {i}"))
+    db.add(models.User(id="x000", institution_id="inst_2", email="x@example.com", name="Other"))
+    db.commit()
+
+def test_cursor_walk_returns_every_row_once(db_session):
+    seed_users(db_session, 25)
+    query = db_session.query(models.User).filter(models.User.institution_id == "inst_1")
+
+    seen, cursor, pages = [], "", 0
+    while True:
+        rows, cursor = keyset_page(query, [models.User.id], cursor, limit=10)
+        seen.extend(r.id for r in rows)
+        pages += 1
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen == [f"u{i:03d}" for i in range(25)]
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor(["u010"]), 1) == ["u010"]
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor("not-a-cursor!!", 1)
+    assert exc.value.status_code == 400
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_cursor(["a", "b"]), 1)
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import text
+from backend.middleware.query_metrics import track_queries
+
+def test_server_timing_header_reports_queries(client):
+    response = client.get("/fairness-audit/job/unknown-job")
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="1 queries"' in timing
+
+def test_track_queries_counts_statements(db_session):
+    with track_queries() as stats:
+        db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 2"))
+    assert stats.count == 2
+    assert stats.duration >= 0.0
+
+    # Outside the block nothing is collected
+    db_session.execute(text("SELECT 3"))
+    assert stats.count == 2
+
+def test_query_budget_passes_and_fails(client, query_budget):
+    with query_budget(1):
+        client.get("/fairness-audit/job/unknown-job")
+
+    with pytest.raises(pytest.fail.Exception, match="Query budget exceeded"):
+        with query_budget(0):
+            client.get("/fairness-audit/job/unknown-job")
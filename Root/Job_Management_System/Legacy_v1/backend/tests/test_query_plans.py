@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import func, text
+from backend import models
+from backend.services.current_position import current_positions
+
+def explain(db, query):
+    """Returns the EXPLAIN QUERY PLAN detail lines for an ORM query."""
+    compiled = query.statement.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).fetchall()
+    return [row[-1] for row in rows]
+
+def assert_index_search(plan, table):
+    """Fails if the hot query falls back to a full table scan (or sorts in a temp b-tree)."""
+    assert any(line.startswith(f"SEARCH {table} USING") for line in plan), plan
+    assert not any(line.startswith(f"SCAN {table}") for line in plan), plan
+    assert not any("TEMP B-TREE" in line for line in plan), plan
+
+def test_workload_entries_by_user_and_survey(db_session):
+    query = db_session.query(models.WorkloadEntry).filter(
+        models.WorkloadEntry.user_id == "emp_1",
+        models.WorkloadEntry.survey_period_id == "survey_1"
+    )
+    assert_index_search(explain(db_session, query), "workload_entries")
+
+def test_latest_final_review_per_user(db_session):
+    query = db_session.query(models.PerformanceReview)\
+        .filter(models.PerformanceReview.user_id == "emp_1")\
+        .filter(models.PerformanceReview.status == models.ReviewStatus.FINAL)\
+        .order_by(models.PerformanceReview.year.desc())\
+        .limit(1)
+    assert_index_search(explain(db_session, query), "performance_reviews")
+
+def test_headcount_plan_by_org_unit_and_year(db_session):
+    query = db_session.query(models.HeadcountPlan).filter(
+        models.HeadcountPlan.org_unit_id == "dept_1",
+        models.HeadcountPlan.year == 2025
+    )
+    assert_index_search(explain(db_session, query), "headcount_plans")
+
+def test_matrix_score_lookup(db_session):
+    query = db_session.query(models.JobEvaluationScore).filter(
+        models.JobEvaluationScore.evaluation_id == "eval_1",
+        models.JobEvaluationScore.rater_type == models.RaterType.SUPERVISOR_1,
+        models.JobEvaluationScore.rater_user_id == "emp_1"
+    )
+    assert_index_search(explain(db_session, query), "job_evaluation_scores")
+
+@pytest.mark.parametrize("column", ["reports_to_id", "org_unit_id"])
+def test_user_reporting_and_org_filters(db_session, column):
+    query = db_session.query(func.count(models.User.id)).filter(getattr(models.User, column) == "x")
+    plan = explain(db_session, query)
+    assert any(line.startswith("SEARCH users USING") for line in plan), plan
+    assert not any(line.startswith("SCAN users") for line in plan), plan
+
+def test_user_keyset_page(db_session):
+    query = db_session.query(models.User)\
+        .filter(models.User.institution_id == "inst_1", models.User.id > "u100")\
+        .order_by(models.User.id)\
+        .limit(101)
+    assert_index_search(explain(db_session, query), "users")
+
+@pytest.mark.parametrize("column", ["ancestor_id", "descendant_id"])
+def test_reporting_closure_lookups(db_session, column):
+    query = db_session.query(models.ReportingClosure.depth)\
+        .filter(getattr(models.ReportingClosure, column) == "mgr_1", models.ReportingClosure.depth <= 2)
+    assert_index_search(explain(db_session, query), "reporting_closure")
+
+def test_current_position_per_user(db_session):
+    current = current_positions(models.JobPosition.user_id == "emp_1")
+    plan = explain(db_session, db_session.query(current))
+    assert any(line.startswith("SEARCH job_positions USING COVERING INDEX ix_job_positions_user_current_start") for line in plan), plan
+    # start_date 정렬은 사용자 한 명의 직위 몇 건에만 적용됨 (전체 정렬 아님)
+    assert not any("TEMP B-TREE" in line and "RIGHT PART" not in line for line in plan), plan
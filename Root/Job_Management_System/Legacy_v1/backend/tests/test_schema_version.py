@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import Column, Float, Index, Integer, MetaData, String, Table, create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from backend import schema_version
+
+def make_metadata(extra_column=False):
+    metadata = MetaData()
+    columns = [Column("id", String, primary_key=True)]
+    if extra_column:
+        columns.append(Column("name", String))
+    Table("widgets", metadata, *columns)
+    return metadata
+
+def make_engine():
+    return create_engine("sqlite:///:memory:", poolclass=StaticPool)
+
+def test_check_fails_on_unstamped_database():
+    engine = make_engine()
+    with pytest.raises(schema_version.SchemaVersionError):
+        schema_version.check(engine, make_metadata())
+
+def test_upgrade_stamps_and_check_passes():
+    engine = make_engine()
+    metadata = make_metadata()
+    fingerprint = schema_version.upgrade(engine, metadata)
+    assert schema_version.check(engine, metadata) == fingerprint
+    # Re-running upgrade on an up-to-date database does not add another stamp row
+    schema_version.upgrade(engine, metadata)
+    with engine.connect() as conn:
+        assert len(conn.execute(schema_version.schema_version_table.select()).fetchall()) == 1
+
+def test_model_change_invalidates_stamp():
+    engine = make_engine()
+    schema_version.upgrade(engine, make_metadata())
+    with pytest.raises(schema_version.SchemaVersionError):
+        schema_version.check(engine, make_metadata(extra_column=True))
+
+def test_upgrade_fills_projection_tables_it_creates():
+    from backend import models
+    engine = make_engine()
+    projections = {"reporting_closure", "workforce_gap_summary", "current_reviews"}
+    # An existing database from before the projections: source rows only
+    models.Base.metadata.create_all(engine, tables=[t for name, t in models.Base.metadata.tables.items() if name not in projections])
+    with engine.begin() as conn:
+        conn.execute(models.Institution.__table__.insert(), [{"id": "inst_1", "name": "Inst", "code": "I1"}])
+        conn.execute(models.OrgUnit.__table__.insert(), [{"id": "unit_1", "institution_id": "inst_1", "name": "Team", "unit_type": "TEAM"}])
+        conn.execute(models.User.__table__.insert(), [
+            {"id": "boss", "institution_id": "inst_1", "org_unit_id": "unit_1", "email": "b@x", "name": "Boss", "reports_to_id": None},
+            {"id": "emp", "institution_id": "inst_1", "org_unit_id": "unit_1", "email": "e@x", "name": "Emp", "reports_to_id": "boss"},
+        ])
+        conn.execute(models.PerformanceReview.__table__.insert(), [{"id": "rev_1", "user_id": "emp", "year": 2024, "status": "FINAL"}])
+
+    schema_version.upgrade(engine, models.Base.metadata)
+
+    with engine.connect() as conn:
+        assert len(conn.execute(models.ReportingClosure.__table__.select()).fetchall()) == 3  # boss, emp, boss->emp
+        assert conn.execute(models.CurrentReview.__table__.select()).fetchone().review_id == "rev_1"
+        assert conn.execute(models.WorkforceGapSummary.__table__.select()).fetchone().current_count == 2
+
+def test_upgrade_adds_missing_columns_and_indexes():
+    engine = make_engine()
+    schema_version.upgrade(engine, make_metadata())
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO widgets (id) VALUES ('w1')"))
+
+    metadata = make_metadata(extra_column=True)
+    Table("widgets", metadata, Column("score", Float, default=0.0), Index("ix_widgets_name", "name"), extend_existing=True)
+    fingerprint = schema_version.upgrade(engine, metadata)
+
+    assert schema_version.check(engine, metadata) == fingerprint
+    inspector = inspect(engine)
+    assert {c["name"] for c in inspector.get_columns("widgets")} == {"id", "name", "score"}
+    assert "ix_widgets_name" in {ix["name"] for ix in inspector.get_indexes("widgets")}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT name, score FROM widgets")).one() == (None, 0.0)
+
+def test_upgrade_refuses_changed_primary_key():
+    engine = make_engine()
+    schema_version.upgrade(engine, make_metadata())
+    metadata = MetaData()
+    Table("widgets", metadata, Column("pk", Integer, primary_key=True), Column("id", String, unique=True, nullable=False))
+    with pytest.raises(schema_version.SchemaVersionError, match="migrate_compact_keys"):
+        schema_version.upgrade(engine, metadata)
+    # Nothing was changed: the old stamp is still in place
+    assert schema_version.get_stamp(engine) == schema_version.schema_fingerprint(make_metadata())
+
+def test_upgrade_refuses_not_null_column_without_default():
+    engine = make_engine()
+    schema_version.upgrade(engine, make_metadata())
+    metadata = make_metadata()
+    Table("widgets", metadata, Column("code", String, nullable=False), extend_existing=True)
+    with pytest.raises(schema_version.SchemaVersionError, match="widgets.code"):
+        schema_version.upgrade(engine, metadata)
@@ -0,0 +1,200 @@
+import math
+import random
+
+import pytest
+
+from backend.services import search_engine
+from backend.services.search_engine import HANGUL_BIGRAM, NORM_REFRESH_MIN, TFIDFEngine, tokenize
+
+DOCS = {
+    "task:1": "Prepare monthly payroll report for finance",
+    "task:2": "Review payroll tax filing",
+    "task:3": "Recruit engineers and schedule interviews",
+    "position:1": "Payroll Specialist",
+    "jd:1": "Manage recruiting pipeline, interviews and onboarding of engineers",
+    "jd:2": "",
+}
+
+def build(docs=DOCS, tokenizer="words"):
+    engine = TFIDFEngine(tokenizer=tokenizer)
+    for doc_id, text in docs.items():
+        engine.add_document(doc_id, text)
+    engine.build_index()
+    return engine
+
+def brute_force(engine, query, top_k):
+    """Reference: cosine similarity against every document vector (the pre-index algorithm)."""
+    tokens = engine._tokenize(query)
+    counts = {t: tokens.count(t) for t in tokens}
+    query_vec = {t: c / len(tokens) * engine.idf.get(t, 0) for t, c in counts.items()}
+    query_norm = math.sqrt(sum(v ** 2 for v in query_vec.values()))
+    scores = []
+    for doc_id, tf in engine.doc_vectors.items():
+        doc_vec = {t: v * engine.idf[t] for t, v in tf.items()}
+        doc_norm = math.sqrt(sum(v ** 2 for v in doc_vec.values()))
+        dot = sum(w * doc_vec.get(t, 0) for t, w in query_vec.items())
+        if doc_norm and dot > 0:
+            scores.append((doc_id, dot / (query_norm * doc_norm)))
+    return sorted(scores, key=lambda item: item[1], reverse=True)[:top_k]
+
+def assert_same_ranking(actual, expected):
+    assert [doc_id for doc_id, _ in actual] == [doc_id for doc_id, _ in expected]
+    for (_, a), (_, b) in zip(actual, expected):
+        assert a == pytest.approx(b)
+
+def test_postings_only_hold_matching_documents():
+    engine = build()
+    assert {engine.doc_ids[o] for o in engine.index["payroll"]} == {"task:1", "task:2", "position:1"}
+    assert engine.norms[engine.doc_ids.index("jd:2")] == 0
+
+def test_search_ranks_by_cosine_similarity():
+    engine = build()
+    results = engine.search("payroll specialist", top_k=3)
+    assert results[0][0] == "position:1"
+    assert results[0][1] == pytest.approx(1.0)
+    assert_same_ranking(results, brute_force(engine, "payroll specialist", 3))
+    assert [doc_id for doc_id, _ in engine.search("interviews engineers")] == ["task:3", "jd:1"]
+
+def test_search_without_known_terms():
+    engine = build()
+    assert engine.search("the and of") == []
+    assert engine.search("astronomy") == []
+    assert engine.search("") == []
+
+def test_build_index_is_idempotent():
+    engine = build()
+    before = engine.search("payroll report")
+    engine.build_index()
+    assert engine.search("payroll report") == before
+
+def test_matches_brute_force_on_random_corpus():
+    rng = random.Random(7)
+    words = [f"{a}{b}" for a in "bcdfgh" for b in ("ar", "el", "im", "op", "un")]
+    docs = {f"doc:{i}": " ".join(rng.choices(words, k=rng.randint(1, 12))) for i in range(300)}
+    engine = build(docs)
+    for _ in range(30):
+        query = " ".join(rng.choices(words, k=rng.randint(1, 4)))
+        assert_same_ranking(engine.search(query, top_k=10), brute_force(engine, query, 10))
+
+def test_add_update_remove_are_searchable_immediately():
+    engine = build()
+    engine.add_document("task:4", "Audit payroll ledger")
+    assert "task:4" in [doc_id for doc_id, _ in engine.search("ledger")]
+
+    engine.update_document("task:4", "Audit vendor contracts")
+    assert engine.search("ledger") == []
+    assert engine.search("vendor")[0][0] == "task:4"
+
+    engine.remove_document("task:4")
+    engine.remove_document("task:unknown")
+    assert engine.search("vendor") == []
+    assert "audit" not in engine.index
+    assert "task:4" not in engine.documents
+
+def test_idf_follows_document_frequency():
+    engine = build()
+    indexed_idf = engine.idf["interviews"]
+    for i in range(4):
+        engine.add_document(f"jd:new{i}", "interviews interviews")
+    # Query weights use the live document frequency right away, norms keep the snapshot for now
+    assert engine._current_idf("interviews") == pytest.approx(math.log(10 / 6))
+    assert engine._current_idf("interviews") < indexed_idf
+    assert engine.idf["interviews"] == indexed_idf
+    assert engine.search("interviews", top_k=1)[0][0].startswith("jd:new")
+
+    for i in range(NORM_REFRESH_MIN):
+        engine.add_document(f"jd:bulk{i}", "onboarding")
+    engine.search("interviews")
+    assert engine.idf["interviews"] == pytest.approx(engine._current_idf("interviews"))
+
+def test_incremental_matches_full_rebuild():
+    rng = random.Random(11)
+    words = [f"{a}{b}" for a in "bcdfgh" for b in ("ar", "el", "im", "op", "un")]
+    text = lambda: " ".join(rng.choices(words, k=rng.randint(1, 12)))
+    engine = build({f"doc:{i}": text() for i in range(200)})
+    for i in range(150):
+        action = rng.random()
+        doc_id = f"doc:{rng.randrange(260)}"
+        if action < 0.3:
+            engine.remove_document(doc_id)
+        else:
+            engine.add_document(doc_id, text())
+
+    rebuilt = build({doc_id: engine.documents[doc_id] for doc_id in engine.doc_vectors})
+    engine.build_index()
+    for _ in range(20):
+        query = " ".join(rng.choices(words, k=rng.randint(1, 4)))
+        assert_same_ranking(engine.search(query, top_k=10), rebuilt.search(query, top_k=10))
+    assert None not in engine.doc_ids
+
+def test_hangul_bigram_tokenizer():
+    assert tokenize("노무관리를 담당", HANGUL_BIGRAM, query=True) == ["노무", "무관", "관리", "리를", "담당"]
+    assert tokenize("HRD교육 및 Payroll 팀", HANGUL_BIGRAM, query=True) == ["hrd", "payroll", "교육", "및", "팀"]
+    # Documents also index syllable unigrams
+    assert tokenize("인사 팀", HANGUL_BIGRAM) == ["인사", "인", "사", "팀"]
+    # The default tokenizer is unchanged (English words only)
+    assert tokenize("HRD교육 및 Payroll 팀") == ["payroll"]
+    with pytest.raises(ValueError):
+        TFIDFEngine(tokenizer="morphemes")
+
+def test_korean_search():
+    engine = build({
+        "ncs:1": "경영·회계·사무 > 인사·조직 > 노무관리",
+        "ncs:2": "경영·회계·사무 > 재무·회계 > 회계",
+        "task:1": "노사 협의회 운영 및 노무관리 규정 개정",
+        "task:2": "월별 결산 및 회계 전표 검토",
+        "task:3": "Payroll 정산 업무",
+    }, tokenizer=HANGUL_BIGRAM)
+    assert {doc_id for doc_id, _ in engine.search("노무관리를", top_k=5)} == {"ncs:1", "task:1"}
+    assert engine.search("전표", top_k=1)[0][0] == "task:2"
+    assert engine.search("payroll", top_k=1)[0][0] == "task:3"
+
+def test_single_syllable_korean_query():
+    engine = build({
+        "ncs:1": "경영·회계·사무 > 인사·조직 > 노무관리",
+        "ncs:2": "경영·회계·사무 > 재무·회계 > 회계",
+        "task:1": "신입사원 인사 발령",
+    }, tokenizer=HANGUL_BIGRAM)
+    # 한 음절 질의도 긴 단어 안에서 찾는다
+    assert {doc_id for doc_id, _ in engine.search("인", top_k=5)} == {"ncs:1", "task:1"}
+    assert [batch[0][0] for batch in engine.search_many(["발", "재"], top_k=1)] == ["task:1", "ncs:2"]
+    # 여러 음절 질의는 unigram 으로 넓어지지 않는다 ("사무" 의 "무" 가 "노무" 에 걸리지 않음)
+    assert {doc_id for doc_id, _ in engine.search("노무관리", top_k=5)} == {"ncs:1"}
+
+def test_document_term_matrix():
+    engine = build()
+    matrix, terms = engine.document_term_matrix()
+    assert matrix.format == "csr" and matrix.shape == (len(engine.doc_ids), len(terms))
+    row = matrix.getrow(engine.ordinals["position:1"])
+    assert {terms[col] for col in row.indices} == {"payroll", "specialist"}
+    assert (row.multiply(row)).sum() == pytest.approx(1.0)
+    assert matrix.getrow(engine.ordinals["jd:2"]).nnz == 0
+
+def test_search_many_matches_search(monkeypatch):
+    monkeypatch.setattr(search_engine, "SEARCH_MANY_CHUNK", 7)
+    rng = random.Random(13)
+    words = [f"{a}{b}" for a in "bcdfgh" for b in ("ar", "el", "im", "op", "un")]
+    engine = build({f"doc:{i}": " ".join(rng.choices(words, k=rng.randint(1, 12))) for i in range(300)})
+    queries = [" ".join(rng.choices(words, k=rng.randint(1, 4))) for _ in range(40)] + ["the of", "astronomy", ""]
+    results = engine.search_many(queries, top_k=10)
+    assert len(results) == len(queries)
+    for query, batch in zip(queries, results):
+        assert_same_ranking(batch, engine.search(query, top_k=10))
+    assert results[-3:] == [[], [], []]
+    assert engine.search_many([]) == []
+
+def test_search_many_follows_updates():
+    engine = build()
+    assert engine.search_many(["ledger"]) == [[]]
+    engine.add_document("task:4", "Audit payroll ledger")
+    engine.remove_document("task:1")
+    ledger, payroll = engine.search_many(["ledger", "payroll"], top_k=10)
+    assert ledger[0][0] == "task:4"
+    assert_same_ranking(payroll, engine.search("payroll", top_k=10))
+    assert "task:1" not in {doc_id for doc_id, _ in payroll}
+
+def test_search_many_breaks_ties_like_search():
+    engine = build({f"doc:{i}": "payroll report" if i % 2 else "payroll audit" for i in range(30)})
+    batch = engine.search_many(["payroll report"], top_k=4)[0]
+    assert batch == engine.search("payroll report", top_k=4)
+    assert [doc_id for doc_id, _ in batch] == ["doc:1", "doc:3", "doc:5", "doc:7"]
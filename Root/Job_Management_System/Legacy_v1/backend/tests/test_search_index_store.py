@@ -0,0 +1,121 @@
+import random
+
+import numpy as np
+import pytest
+
+from backend.services import search_index_store
+from backend.services.search_engine import HANGUL_BIGRAM, TFIDFEngine
+from backend.services.search_index_store import MappedIndex, SharedIndex
+
+WORDS = [f"{a}{b}" for a in "bcdfgh" for b in ("ar", "el", "im", "op", "un")]
+
+def random_engine(n_docs=300, seed=3):
+    rng = random.Random(seed)
+    engine = TFIDFEngine()
+    for i in range(n_docs):
+        engine.add_document(f"doc:{i}", " ".join(rng.choices(WORDS, k=rng.randint(1, 12))))
+    engine.build_index()
+    return engine
+
+def assert_same_results(actual, expected):
+    assert [doc_id for doc_id, _ in actual] == [doc_id for doc_id, _ in expected]
+    for (_, a), (_, b) in zip(actual, expected):
+        assert a == pytest.approx(b)
+
+def test_mapped_index_matches_engine(tmp_path):
+    engine = random_engine()
+    path = str(tmp_path / "search.idx")
+    assert search_index_store.publish(engine, path) == 1
+
+    index = MappedIndex(path)
+    assert index.version == 1 and len(index) == 300
+    rng = random.Random(5)
+    for _ in range(30):
+        query = " ".join(rng.choices(WORDS, k=rng.randint(1, 4)))
+        assert_same_results(index.search(query, top_k=10), engine.search(query, top_k=10))
+    assert index.search("unknownword") == []
+    assert index.search("the of") == []
+
+def test_publish_compacts_removed_documents(tmp_path):
+    engine = random_engine(50)
+    for i in range(0, 50, 2):
+        engine.remove_document(f"doc:{i}")
+    engine.add_document("doc:new", "barbar celcel")
+    path = str(tmp_path / "search.idx")
+    search_index_store.publish(engine, path)
+
+    index = MappedIndex(path)
+    assert len(index) == 26
+    assert {index.doc_id(o) for o in range(len(index))} == set(engine.documents)
+    assert_same_results(index.search("barbar celcel", top_k=5), engine.search("barbar celcel", top_k=5))
+
+def test_shared_index_reloads_newer_version(tmp_path):
+    path = str(tmp_path / "search.idx")
+    shared = SharedIndex(path, check_interval=0)
+    assert shared.current() is None
+
+    engine = TFIDFEngine()
+    engine.add_document("task:1", "payroll report")
+    engine.add_document("task:2", "safety inspection")
+    search_index_store.publish(engine, path)
+    first = shared.current()
+    assert first.version == 1
+    assert first.search("payroll")[0][0] == "task:1"
+
+    engine.add_document("task:3", "budget forecast")
+    search_index_store.publish(engine, path)
+    second = shared.current()
+    assert second.version == 2
+    assert second.search("budget")[0][0] == "task:3"
+    # Readers that still hold the old mapping keep working on the old snapshot
+    assert first.search("budget") == []
+    assert not list(tmp_path.glob("*.tmp"))
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "search.idx"
+    path.write_bytes(b"not an index" * 10)
+    with pytest.raises(ValueError):
+        MappedIndex(str(path))
+    assert search_index_store.read_version(str(path)) == 0
+
+def test_empty_index(tmp_path):
+    path = str(tmp_path / "search.idx")
+    search_index_store.publish(TFIDFEngine(), path)
+    index = MappedIndex(path)
+    assert len(index) == 0
+    assert index.search("payroll") == []
+
+def test_delta_encoding_round_trip():
+    rng = random.Random(9)
+    runs = [sorted(rng.sample(range(1 << 30), rng.randint(0, 50))) for _ in range(40)] + [[0, 1, 2, 300, 70000]]
+    starts = np.zeros(len(runs) + 1, dtype=np.uint64)
+    np.cumsum([len(run) for run in runs], out=starts[1:])
+    stream, byte_starts = search_index_store.encode_deltas(np.array(sum(runs, []), dtype=np.uint64), starts)
+    for i, run in enumerate(runs):
+        decoded = search_index_store.decode_deltas(stream[int(byte_starts[i]):int(byte_starts[i + 1])])
+        assert decoded.tolist() == run
+    # Dense runs cost about one byte per posting
+    dense, _ = search_index_store.encode_deltas(np.arange(1000, dtype=np.uint64), np.array([0, 1000], dtype=np.uint64))
+    assert len(dense) == 1000
+
+def test_korean_index_round_trip(tmp_path):
+    engine = TFIDFEngine(tokenizer=HANGUL_BIGRAM)
+    for i, text in enumerate(["노무관리 규정 개정", "회계 전표 검토", "채용 공고 작성", "HRD교육 계획 수립", "노사 협의회 운영"]):
+        engine.add_document(f"task:{i}", text)
+    path = str(tmp_path / "search.idx")
+    search_index_store.publish(engine, path)
+
+    index = MappedIndex(path)
+    assert index.tokenizer == HANGUL_BIGRAM
+    for query in ("노무관리를", "전표", "hrd", "협의회 운영", "노"):
+        assert_same_results(index.search(query), engine.search(query))
+
+def test_shared_index_ignores_unreadable_files(tmp_path):
+    path = tmp_path / "search.idx"
+    path.write_bytes(b"TFIDX\x00\x01\x00" + bytes(64))  # previous format version
+    shared = SharedIndex(str(path), check_interval=0)
+    assert shared.current() is None
+    engine = TFIDFEngine()
+    engine.add_document("task:1", "payroll")
+    search_index_store.publish(engine, str(path))
+    assert shared.refresh().version == 1
@@ -0,0 +1,121 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from backend import crud, models
+from backend.routers_legacy import ai, classification
+from backend.services import search_index_store
+from backend.services.classification_service import ClassificationService
+from backend.services.search_engine import TFIDFEngine
+
+def seed(db_session):
+    db_session.add(models.JobPosition(id="pos_1", title="Payroll Specialist"))
+    db_session.add(models.JobPosition(id="pos_2", title="Safety Inspector"))
+    db_session.add(models.JobPosition(id="pos_3", title="노무관리 담당"))
+    db_session.add(models.JobTask(id="task_1", job_position_id="pos_1", task_name="Prepare payroll", action_verb="prepare"))
+    db_session.add(models.JobDescription(id="jd_1", job_position_id="pos_1", summary="Runs monthly payroll",
+                                         qualification_requirements="Accounting degree"))
+    db_session.commit()
+
+@pytest.fixture
+def engine(db_session, monkeypatch):
+    monkeypatch.setattr(ai, "search_engine", TFIDFEngine(tokenizer=ai.SEARCH_TOKENIZER))
+    monkeypatch.setattr(ai, "is_indexed", False)
+    seed(db_session)
+    ai.ensure_index(db_session)
+    return ai.search_engine
+
+def found(engine, query):
+    return {doc_id for doc_id, _ in engine.search(query, top_k=20)}
+
+def test_full_build_reads_all_models(engine):
+    assert found(engine, "payroll") == {"position:pos_1", "task:task_1", "jd:pos_1"}
+    assert found(engine, "accounting") == {"jd:pos_1"}
+    assert found(engine, "노무관리") == {"position:pos_3"}
+
+def test_commits_update_the_index(db_session, engine):
+    db_session.add(models.JobTask(id="task_2", job_position_id="pos_1", task_name="Audit ledger", action_verb="audit"))
+    db_session.get(models.JobPosition, "pos_1").title = "Payroll Auditor"
+    jd = db_session.get(models.JobDescription, "jd_1")
+    jd.job_position_id = None
+    db_session.commit()
+
+    assert found(engine, "ledger") == {"task:task_2"}
+    assert found(engine, "auditor") == {"position:pos_1"}
+    assert "jd:pos_1" not in engine.documents
+    assert "jd:None" not in engine.documents
+
+    db_session.delete(crud.get_by_id(db_session, models.JobTask, "task_2"))
+    db_session.commit()
+    assert found(engine, "ledger") == set()
+
+def test_jd_without_position_is_not_indexed(db_session, monkeypatch):
+    monkeypatch.setattr(ai, "search_engine", TFIDFEngine(tokenizer=ai.SEARCH_TOKENIZER))
+    monkeypatch.setattr(ai, "is_indexed", False)
+    db_session.add(models.JobDescription(id="jd_draft", summary="Draft payroll description"))
+    db_session.commit()
+    ai.ensure_index(db_session)
+    assert ai.search_engine.documents == {}
+
+def test_core_matrix_import_updates_the_index(db_session, engine):
+    row = {"group_name": "Finance", "series_name": "Accounting", "position_title": "Ledger Accountant",
+           "task_name": "Reconcile ledger", "work_item_name": None, "frequency": "MONTHLY", "workload": 0.0}
+    ClassificationService(db_session).save_matrix([classification.JobMatrixItem(**row)])
+
+    hits = found(engine, "ledger")
+    assert len(hits) == 2
+    assert {doc_id.split(":")[0] for doc_id in hits} == {"position", "task"}
+
+def test_rollback_leaves_the_index(db_session, engine):
+    db_session.add(models.JobTask(id="task_3", job_position_id="pos_1", task_name="Forecast budget", action_verb="plan"))
+    db_session.flush()
+    db_session.rollback()
+    db_session.commit()
+    assert found(engine, "budget") == set()
+
+@pytest.fixture
+def shared(db_session, tmp_path, monkeypatch):
+    """SEARCH_INDEX_PATH mode on the test database; rebuilds read through their own sessions."""
+    path = str(tmp_path / "search.idx")
+    monkeypatch.setattr(ai, "SEARCH_INDEX_PATH", path)
+    monkeypatch.setattr(ai, "shared_index", search_index_store.SharedIndex(path, check_interval=0))
+    monkeypatch.setattr(ai, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+    monkeypatch.setattr(ai, "search_republisher", search_index_store.Debounced(ai.publish_search_index, 60))
+    return path
+
+def test_shared_index_is_published_at_startup(db_session, engine, shared):
+    app = FastAPI()
+    app.include_router(ai.router)
+    assert search_index_store.read_version(shared) == 0
+    with TestClient(app):
+        assert search_index_store.read_version(shared) == 1
+        index = ai.get_search_index(db_session)
+        assert isinstance(index, search_index_store.MappedIndex)
+        assert {doc_id for doc_id, _ in index.search("accounting")} == {"jd:pos_1"}
+    # 다른 워커의 기동은 게시된 파일을 그대로 쓴다
+    assert ai.publish_search_index(only_if_missing=True) == 1
+
+def test_commits_republish_the_shared_index(db_session, shared):
+    # 공유 인덱스만 읽는 워커 (자체 엔진 없음)
+    seed(db_session)
+    ai.publish_search_index()
+    db_session.add(models.JobTask(id="task_9", job_position_id="pos_2", task_name="Inspect scaffolding", action_verb="inspect"))
+    db_session.commit()
+    assert ai.search_republisher.pending
+    assert {doc_id for doc_id, _ in ai.get_search_index(db_session).search("scaffolding")} == set()
+
+    db_session.delete(crud.get_by_id(db_session, models.JobPosition, "pos_3"))
+    db_session.commit()
+    ai.search_republisher.flush()  # 여러 커밋이 한 번의 재게시로 합쳐짐
+    index = ai.get_search_index(db_session)
+    assert index.version == 2
+    assert {doc_id for doc_id, _ in index.search("scaffolding")} == {"task:task_9"}
+    assert index.search("노무관리") == []
+
+def test_rollback_does_not_republish(db_session, shared):
+    db_session.add(models.JobTask(id="task_8", job_position_id="pos_1", task_name="Forecast budget", action_verb="plan"))
+    db_session.flush()
+    db_session.rollback()
+    db_session.commit()
+    assert not ai.search_republisher.pending
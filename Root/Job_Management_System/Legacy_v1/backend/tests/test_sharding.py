@@ -0,0 +1,145 @@
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, text
+from backend.sharding import ShardRouter
+
+def make_metadata():
+    metadata = MetaData()
+    Table("widgets", metadata, Column("id", String, primary_key=True), Column("institution_id", String))
+    return metadata
+
+def test_sqlite_shards_are_isolated(tmp_path):
+    router = ShardRouter(mode="sqlite", shard_dir=str(tmp_path), base_url="sqlite:///:memory:")
+    metadata = make_metadata()
+    for inst in ("inst_a", "inst_b"):
+        router.create_shard(inst, metadata)
+
+    db = router.session_factory("inst_a")()
+    db.execute(text("INSERT INTO widgets (id, institution_id) VALUES ('w1', 'inst_a')"))
+    db.commit()
+    db.close()
+
+    read_a = router.session_factory("inst_a", read_only=True)()
+    read_b = router.session_factory("inst_b", read_only=True)()
+    assert read_a.execute(text("SELECT COUNT(*) FROM widgets")).scalar() == 1
+    assert read_b.execute(text("SELECT COUNT(*) FROM widgets")).scalar() == 0
+    read_a.close()
+    read_b.close()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["inst_a.db", "inst_b.db"]
+
+def test_factories_are_cached_and_evicted(tmp_path):
+    router = ShardRouter(mode="sqlite", shard_dir=str(tmp_path), base_url="sqlite:///:memory:", cache_size=2)
+    first = router.session_factory("inst_a")
+    assert router.session_factory("inst_a") is first
+    router.session_factory("inst_b")
+    router.session_factory("inst_c")
+    assert router.session_factory("inst_a") is not first
+
+@pytest.mark.parametrize("bad_id", ["", "../secrets", "a b", "x;DROP"])
+def test_unsafe_institution_ids_are_rejected(tmp_path, bad_id):
+    router = ShardRouter(mode="sqlite", shard_dir=str(tmp_path), base_url="sqlite:///:memory:")
+    with pytest.raises(ValueError):
+        router.session_factory(bad_id)
+
+def test_postgres_schema_mode_requires_postgres():
+    with pytest.raises(ValueError):
+        ShardRouter(mode="postgres-schema", base_url="sqlite:///:memory:")
+
+def test_evicted_engine_is_disposed_after_its_last_session(tmp_path, monkeypatch):
+    router = ShardRouter(mode="sqlite", shard_dir=str(tmp_path), base_url="sqlite:///:memory:", cache_size=1)
+    router.create_shard("inst_a", make_metadata())
+    db = router.open_session("inst_a")  # an in-flight request on inst_a
+    engine_a = db.bind
+    disposed = []
+    monkeypatch.setattr(engine_a, "dispose", lambda *args, **kwargs: disposed.append(engine_a))
+
+    router.close_session(router.open_session("inst_b"))  # evicts inst_a's engine while the request still runs
+    assert disposed == []
+    assert db.execute(text("SELECT COUNT(*) FROM widgets")).scalar() == 0
+
+    router.close_session(db)
+    assert disposed == [engine_a]
+
+@pytest.fixture
+def sharded_api(tmp_path, monkeypatch):
+    """organization + surveys routers on sqlite shards, with a shared database for the shard directory."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from backend import sharding
+    from backend.database import Base
+    from backend.dependencies import get_current_user
+    from backend.routers_legacy import organization, surveys
+
+    shared = create_engine(f"sqlite:///{tmp_path / 'shared.db'}")
+    Base.metadata.create_all(bind=shared)
+    router = ShardRouter(mode="sqlite", shard_dir=str(tmp_path / "shards"), base_url="sqlite:///:memory:", shared_bind=shared)
+    for inst in ("inst_a", "inst_b"):
+        router.create_shard(inst)
+    monkeypatch.setattr(sharding, "shard_router", router)
+
+    app = FastAPI()
+    app.include_router(organization.router)
+    app.include_router(surveys.router)
+    app.dependency_overrides[get_current_user] = lambda: {"id": "admin", "roles": ["ADMIN"]}
+    with TestClient(app) as c:
+        yield c, router
+    shared.dispose()
+
+def count_rows(router, institution_id, table):
+    db = router.open_session(institution_id, read_only=True)
+    try:
+        return db.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+    finally:
+        router.close_session(db)
+
+def test_writes_without_institution_find_the_shard_from_body_and_parent_rows(sharded_api):
+    api, router = sharded_api
+    # 본문의 institution_id 로 샤드 결정
+    group = api.post("/organization/groups", json={"name": "Admin", "institution_id": "inst_b"}).json()
+    assert count_rows(router, "inst_b", "job_groups") == 1
+
+    # 부모 행 (본문 group_id / 경로 group_id) 은 shard_directory 로 찾는다
+    series = api.post("/organization/series", json={"name": "HR", "group_id": group["id"]}).json()
+    assert count_rows(router, "inst_b", "job_series") == 1
+    assert api.put(f"/organization/groups/{group['id']}", json={"name": "Administration"}).status_code == 200
+    assert api.get(f"/organization/groups/detail/{group['id']}").json()["name"] == "Administration"
+    assert [s["id"] for s in api.get(f"/organization/series/{group['id']}").json()] == [series["id"]]
+    assert api.get("/organization/groups/inst_b").json()[0]["name"] == "Administration"
+    assert api.get("/organization/groups/inst_a").json() == []
+
+    # 설문 하위 경로도 설문이 있는 샤드로 간다
+    survey = api.post("/surveys/inst_a", json={"name": "2025", "start_date": "2025-01-01T00:00:00",
+                                                  "end_date": "2025-12-31T00:00:00", "institution_id": "inst_a"}).json()
+    entry = {"user_id": "u1", "task_id": "t1", "survey_period_id": survey["id"], "volume": 1, "standard_time": 2.0, "fte": 0.0}
+    assert api.post(f"/surveys/{survey['id']}/entries", json=entry).status_code == 200
+    assert count_rows(router, "inst_a", "workload_entries") == 1
+    assert len(api.get(f"/surveys/{survey['id']}/entries").json()) == 1
+
+    # 삭제하면 디렉터리에서도 빠진다
+    assert api.delete(f"/organization/series/{series['id']}").status_code == 200
+    assert router.locate([("job_series", series["id"])]) is None
+    assert router.locate([("job_groups", group["id"])]) == "inst_b"
+
+def test_unresolvable_requests_use_the_shared_database(sharded_api):
+    api, router = sharded_api
+    response = api.post("/organization/groups", json={"name": "Shared"})
+    assert response.status_code == 200
+    with router.shared_bind.connect() as conn:
+        assert conn.execute(text("SELECT name FROM job_groups")).scalars().all() == ["Shared"]
+    assert count_rows(router, "inst_a", "job_groups") == 0
+
+def test_index_shard_registers_loaded_rows(tmp_path):
+    from sqlalchemy import create_engine
+    from backend.database import Base
+
+    shared = create_engine(f"sqlite:///{tmp_path / 'shared.db'}")
+    Base.metadata.create_all(bind=shared)
+    router = ShardRouter(mode="sqlite", shard_dir=str(tmp_path), base_url="sqlite:///:memory:", shared_bind=shared)
+    router.create_shard("inst_a")
+    # 디렉터리를 거치지 않고 적재된 행 (마이그레이션)
+    with router.session_factory("inst_a").kw["bind"].begin() as conn:
+        conn.execute(text("INSERT INTO job_groups (id, name) VALUES ('g1', 'Loaded')"))
+    assert router.locate([("job_groups", "g1")]) is None
+    assert router.index_shard("inst_a") == 1
+    assert router.locate([("job_groups", "g1")]) == "inst_a"
+    shared.dispose()
@@ -0,0 +1,89 @@
+import pytest
+from backend import models
+from backend.services import reporting_closure
+from backend.services.span_service import SpanOfControlService
+
+def add_user(db, user_id, manager_id=None, org_unit_id=None):
+    db.add(models.User(id=user_id, institution_id="inst_1", org_unit_id=org_unit_id, reports_to_id=manager_id,
+                       email=f"{user_id}@example.com", name=user_id.upper()))
+
+def seed_org(db):
+    """
+    ceo
+    ├── hr
+    │   └── rec1, rec2
+    └── tech
+        └── dev_lead
+            └── dev1
+    """
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add(models.OrgUnit(id="unit_hr", institution_id="inst_1", name="HR Team", unit_type="TEAM"))
+    # Children before parents in the same flush: closure maintenance must not depend on order
+    add_user(db, "rec1", "hr", "unit_hr")
+    add_user(db, "rec2", "hr", "unit_hr")
+    add_user(db, "hr", "ceo", "unit_hr")
+    add_user(db, "ceo")
+    db.commit()
+    add_user(db, "tech", "ceo")
+    add_user(db, "dev_lead", "tech")
+    add_user(db, "dev1", "dev_lead")
+    db.commit()
+
+def closure_rows(db):
+    return {(r.ancestor_id, r.descendant_id, r.depth) for r in db.query(models.ReportingClosure)}
+
+def test_closure_is_maintained_on_insert_move_and_delete(db_session):
+    seed_org(db_session)
+    rows = closure_rows(db_session)
+    assert ("ceo", "dev1", 3) in rows
+    assert ("hr", "rec2", 1) in rows
+    assert len(rows) == 7 + 6 + 5  # self rows + parent links + deeper paths
+
+    # Move dev_lead (and dev1 with it) under hr
+    db_session.get(models.User, "dev_lead").reports_to_id = "hr"
+    db_session.commit()
+    rows = closure_rows(db_session)
+    assert ("tech", "dev1", 2) not in rows
+    assert ("hr", "dev1", 2) in rows and ("ceo", "dev1", 3) in rows
+
+    # Deleting a manager turns the direct reports into roots
+    db_session.delete(db_session.get(models.User, "hr"))
+    db_session.commit()
+    rows = closure_rows(db_session)
+    assert not any("hr" in (a, d) for a, d, _ in rows)
+    assert ("ceo", "rec1", 2) not in rows
+    assert ("dev_lead", "dev1", 1) in rows
+
+    # Incremental maintenance matches a full rebuild
+    incremental = closure_rows(db_session)
+    reporting_closure.rebuild(db_session)
+    assert closure_rows(db_session) == incremental
+
+def test_cycles_are_rejected(db_session):
+    seed_org(db_session)
+    db_session.get(models.User, "ceo").reports_to_id = "dev1"
+    with pytest.raises(reporting_closure.ReportingCycleError):
+        db_session.commit()
+    db_session.rollback()
+
+def test_tree_and_subtree_queries(db_session, query_budget):
+    seed_org(db_session)
+    service = SpanOfControlService(db_session)
+
+    with query_budget(3):
+        tree = service.get_span_of_control_analysis()
+    assert [n["id"] for n in tree] == ["ceo"]
+    ceo = tree[0]
+    assert ceo["span_count"] == 2 and ceo["total_descendants"] == 6
+    hr = next(c for c in ceo["children"] if c["id"] == "hr")
+    assert hr["org_unit"] == "HR Team" and hr["span_status"] == "NARROW"
+    assert {c["id"] for c in hr["children"]} == {"rec1", "rec2"}
+
+    subtree = service.get_span_of_control_analysis(root_id="tech", max_depth=1)
+    assert len(subtree) == 1 and subtree[0]["id"] == "tech" and subtree[0]["depth"] == 0
+    assert [c["id"] for c in subtree[0]["children"]] == ["dev_lead"]
+    assert subtree[0]["children"][0]["children"] == []
+    # Counts still cover the whole organization below the node
+    assert subtree[0]["total_descendants"] == 2
+
+    assert sorted(service.get_descendant_ids("ceo", max_depth=1)) == ["hr", "tech"]
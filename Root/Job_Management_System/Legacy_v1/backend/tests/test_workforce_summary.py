@@ -0,0 +1,153 @@
+from datetime import datetime
+import pytest
+from fastapi import HTTPException
+
+from backend import crud, models
+from backend.routers_legacy import workforce
+from backend.services import workforce_summary
+
+def seed_org(db):
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add_all([
+        models.OrgUnit(id="hq", institution_id="inst_1", name="HQ", unit_type=models.UnitType.HQ),
+        models.OrgUnit(id="team_a", institution_id="inst_1", parent_id="hq", name="Team A", unit_type=models.UnitType.TEAM),
+        models.OrgUnit(id="team_b", institution_id="inst_1", parent_id="hq", name="Team B", unit_type=models.UnitType.TEAM),
+    ])
+    db.add_all([
+        models.User(id="emp_1", institution_id="inst_1", org_unit_id="team_a", email="a@example.com", name="A"),
+        models.User(id="emp_2", institution_id="inst_1", org_unit_id="team_a", email="b@example.com", name="B"),
+        models.User(id="emp_3", institution_id="inst_1", org_unit_id="team_b", email="c@example.com", name="C"),
+    ])
+    db.add(models.JobTask(id="task_1", task_name="Coding"))
+    db.add_all([
+        models.SurveyPeriod(id="survey_2024", institution_id="inst_1", name="2024",
+                            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 31)),
+        models.SurveyPeriod(id="survey_2025", institution_id="inst_1", name="2025",
+                            start_date=datetime(2025, 1, 1), end_date=datetime(2025, 12, 31)),
+    ])
+    db.add_all([
+        models.WorkloadEntry(id="we_1", survey_period_id="survey_2025", user_id="emp_1", task_id="task_1", fte=0.75),
+        models.WorkloadEntry(id="we_2", survey_period_id="survey_2025", user_id="emp_2", task_id="task_1", fte=0.5),
+        models.WorkloadEntry(id="we_3", survey_period_id="survey_2024", user_id="emp_1", task_id="task_1", fte=2.0),
+        models.WorkloadEntry(id="we_4", survey_period_id="survey_2025", user_id="emp_3", task_id="task_1", fte=1.0),
+    ])
+    db.add_all([
+        models.HeadcountPlan(id="plan_a", institution_id="inst_1", org_unit_id="team_a", year=2025, authorized_count=3),
+        models.HeadcountPlan(id="plan_hq", institution_id="inst_1", org_unit_id="hq", year=2025, authorized_count=1),
+    ])
+    db.commit()
+
+def summary(db):
+    return {
+        (row.org_unit_id, row.year): (row.current_count, row.authorized_count, round(row.required_fte, 2))
+        for row in db.query(models.WorkforceGapSummary)
+    }
+
+def gap(db, **params):
+    params = {"year": 2025, "institution_id": None, "root_id": None, "rollup": False, **params}
+    return {row["id"]: row for row in workforce.get_gap_analysis(db=db, **params)}
+
+def test_summary_is_maintained_on_flush(db_session):
+    seed_org(db_session)
+    rows = summary(db_session)
+    assert rows[("team_a", 2025)] == (2, 3, 1.25)
+    assert rows[("team_a", 2024)] == (2, 0, 2.0)
+    assert rows[("team_b", 2025)] == (1, 0, 1.0)
+    assert rows[("hq", 2025)] == (0, 1, 0)
+
+    # Moving a user refreshes both units (headcount and the FTE that follows the user)
+    db_session.get(models.User, "emp_2").org_unit_id = "team_b"
+    db_session.commit()
+    rows = summary(db_session)
+    assert rows[("team_a", 2025)] == (1, 3, 0.75)
+    assert rows[("team_b", 2025)] == (2, 0, 1.5)
+
+    db_session.get(models.HeadcountPlan, "plan_a").authorized_count = 5
+    db_session.delete(crud.get_by_id(db_session, models.WorkloadEntry, "we_1"))
+    db_session.commit()
+    assert summary(db_session)[("team_a", 2025)] == (1, 5, 0)
+
+    incremental = summary(db_session)
+    workforce_summary.rebuild(db_session)
+    assert summary(db_session) == incremental
+
+def test_bulk_insert_refreshes_summary(db_session):
+    seed_org(db_session)
+    crud.create_workload_entries_bulk(db_session, "survey_2025", [
+        {"user_id": "emp_3", "task_id": "task_1", "volume": 240, "standard_time": 4.0},
+    ])
+    assert summary(db_session)[("team_b", 2025)] == (1, 0, 1.5)
+
+def test_entries_without_survey_period_count_this_year(db_session):
+    seed_org(db_session)
+    this_year = datetime.now().year
+    db_session.add(models.WorkloadEntry(id="we_5", user_id="emp_3", task_id="task_1", fte=0.25))
+    db_session.commit()
+    assert summary(db_session)[("team_b", this_year)] == (1, 0, 0.25)
+
+    incremental = summary(db_session)
+    workforce_summary.rebuild(db_session)
+    assert summary(db_session) == incremental
+
+def test_single_entry_write_applies_the_fte_delta(db_session, query_budget):
+    seed_org(db_session)
+    entry = crud.get_by_id(db_session, models.WorkloadEntry, "we_2")
+    entry.fte = 1.5
+    with query_budget(10) as statements:
+        db_session.commit()
+    assert not any("sum(" in sql.lower() for sql in statements)  # no re-sum of the unit's entries
+    assert summary(db_session)[("team_a", 2025)] == (2, 3, 2.25)
+
+    entry.survey_period_id = "survey_2024"
+    db_session.add(models.WorkloadEntry(id="we_6", survey_period_id="survey_2025", user_id="emp_3", task_id="task_1", fte=0.5))
+    db_session.commit()
+    rows = summary(db_session)
+    assert rows[("team_a", 2025)] == (2, 3, 0.75)
+    assert rows[("team_a", 2024)] == (2, 0, 3.5)
+    assert rows[("team_b", 2025)] == (1, 0, 1.5)
+
+    incremental = summary(db_session)
+    workforce_summary.rebuild(db_session)
+    assert summary(db_session) == incremental
+
+def test_gap_analysis_is_one_query(db_session, query_budget):
+    seed_org(db_session)
+    with query_budget(1):
+        rows = gap(db_session)
+    assert rows["team_a"]["current_count"] == 2
+    assert rows["team_a"]["required_count"] == 1.25
+    assert rows["team_a"]["gap"] == 1.75
+    assert rows["hq"]["gap"] == 1.0
+
+    older = gap(db_session, year=2024)
+    assert older["team_a"]["authorized_count"] == 0
+    assert older["team_a"]["required_count"] == 2.0
+    # No plan or survey for the year: zeros instead of a missing unit, headcount counted live
+    future = gap(db_session, year=2030)
+    assert future["team_b"]["required_count"] == 0
+    assert future["team_a"]["current_count"] == 2
+    assert gap(db_session, year=2030, rollup=True)["hq"]["current_count"] == 3
+
+def test_gap_analysis_subtree_rollup(db_session, query_budget):
+    seed_org(db_session)
+    with query_budget(1):
+        rows = gap(db_session, rollup=True)
+    assert rows["hq"]["current_count"] == 3
+    assert rows["hq"]["authorized_count"] == 4
+    assert rows["hq"]["required_count"] == 2.25
+    assert rows["team_a"]["required_count"] == 1.25
+
+    subtree = gap(db_session, root_id="team_a")
+    assert set(subtree) == {"team_a"}
+    assert set(gap(db_session, root_id="hq")) == {"hq", "team_a", "team_b"}
+
+def test_gap_analysis_unknown_root(db_session):
+    with pytest.raises(HTTPException) as exc:
+        gap(db_session, root_id="missing")
+    assert exc.value.status_code == 404
+
+def test_deleting_a_unit_drops_its_rows(db_session):
+    seed_org(db_session)
+    db_session.delete(db_session.get(models.OrgUnit, "hq"))
+    db_session.commit()
+    assert not any(unit_id == "hq" for unit_id, _ in summary(db_session))
@@ -0,0 +1,33 @@
+from datetime import datetime
+from backend import crud, models
+
+def setup_survey(db):
+    db.add(models.Institution(id="inst_1", name="Test Inst", code="TI01", category="MARKET"))
+    db.add(models.User(id="emp_1", institution_id="inst_1", email="a@example.com", name="A"))
+    db.add(models.User(id="emp_2", institution_id="inst_1", email="b@example.com", name="B"))
+    db.add(models.JobTask(id="task_1", task_name="Coding"))
+    db.add(models.SurveyPeriod(id="survey_1", institution_id="inst_1", name="2024 H1",
+                               start_date=datetime(2024, 1, 1), end_date=datetime(2024, 6, 30)))
+    db.commit()
+
+def test_bulk_insert_computes_fte_and_reports_bad_rows(db_session):
+    setup_survey(db_session)
+    rows = [
+        {"user_id": "emp_1", "task_id": "task_1", "volume": 240, "standard_time": 4.0},
+        {"user_id": "emp_2", "task_id": "task_1", "volume": 0, "standard_time": 2.0},
+        {"user_id": "ghost", "task_id": "task_1", "volume": 10, "standard_time": 1.0},
+        {"user_id": "emp_1", "task_id": "task_1", "volume": "many", "standard_time": 1.0},
+        {"user_id": "emp_1", "task_id": "task_1", "volume": 1, "standard_time": 1.0, "survey_period_id": "other"},
+        {"user_id": "emp_2", "task_id": "task_1", "volume": -5, "standard_time": 1.0},
+    ]
+    result = crud.create_workload_entries_bulk(db_session, "survey_1", rows)
+
+    assert result["inserted"] == 2
+    assert [e["index"] for e in result["errors"]] == [2, 3, 4, 5]
+
+    entries = {e.user_id: e for e in crud.get_workload_entries(db_session, "survey_1")}
+    assert abs(entries["emp_1"].fte - 240 * 4.0 / 1920.0) < 1e-9
+    assert entries["emp_2"].fte == 0.0
+
+def test_bulk_insert_unknown_survey(db_session):
+    assert crud.create_workload_entries_bulk(db_session, "missing", []) is None
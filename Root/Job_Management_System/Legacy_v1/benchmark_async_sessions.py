@@ -0,0 +1,117 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+# Benchmark database must be selected before backend.database creates its engines
+BENCH_DIR = tempfile.mkdtemp(prefix="bench_async_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+
+# Add root directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.database import Base, SessionLocal, engine, get_db
+from backend.routers_legacy import nine_box
+from backend.services.nine_box_service import NineBoxService
+
+N_USERS = int(os.getenv("BENCH_USERS", "3000"))
+HEAVY_REQUESTS = int(os.getenv("BENCH_HEAVY", "4"))
+PING_INTERVAL_SEC = 0.005
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        inst_id = str(uuid.uuid4())
+        unit_id = str(uuid.uuid4())
+        db.execute(insert(models.Institution), [{"id": inst_id, "name": "Bench Inst", "code": "BENCH"}])
+        db.execute(insert(models.OrgUnit), [{"id": unit_id, "institution_id": inst_id, "name": "Bench Team", "unit_type": "TEAM"}])
+        users, reviews = [], []
+        for i in range(N_USERS):
+            user_id = str(uuid.uuid4())
+            users.append({"id": user_id, "institution_id": inst_id, "org_unit_id": unit_id, "email": f"u{i}@bench.com", "name": f"User {i}"})
+            reviews.append({
+                "id": str(uuid.uuid4()), "user_id": user_id, "year": 2024, "status": models.ReviewStatus.FINAL,
+                "total_score": float(i % 100), "score_potential": float((i * 7) % 100),
+            })
+        db.execute(insert(models.User), users)
+        db.execute(insert(models.PerformanceReview), reviews)
+        db.commit()
+    finally:
+        db.close()
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(nine_box.router)
+
+    # Previous handler shape: `async def` route calling the blocking session directly
+    @app.get("/legacy/scientific/talent/")
+    async def legacy_grid(db: Session = Depends(get_db)):
+        return NineBoxService(db).get_grid_data()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+async def run_scenario(client: httpx.AsyncClient, grid_path: str):
+    """
+    Fires the heavy grid requests and pings the cheap endpoint on a fixed schedule.
+    Latency is measured from the *scheduled* send time, so time spent waiting for a blocked
+    event loop is counted against the cheap endpoint.
+    """
+    latencies = []
+    heavy = [asyncio.create_task(client.get(grid_path)) for _ in range(HEAVY_REQUESTS)]
+    start = time.perf_counter()
+    tick = 0
+    while not all(t.done() for t in heavy):
+        scheduled = start + tick * PING_INTERVAL_SEC
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await client.get("/ping")
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+        # Skip ticks that were missed while the loop was blocked (one sample per stall)
+        tick = max(tick + 1, int((time.perf_counter() - start) / PING_INTERVAL_SEC))
+    results = await asyncio.gather(*heavy)
+    assert all(r.status_code == 200 for r in results), [r.text[:200] for r in results]
+    return {
+        "grid_total_ms": (time.perf_counter() - start) * 1000,
+        "pings": len(latencies),
+        "p50": percentile(latencies, 50) if latencies else 0.0,
+        "p99": percentile(latencies, 99) if latencies else 0.0,
+        "max": max(latencies) if latencies else 0.0,
+    }
+
+async def run_benchmark():
+    print("=== Async Session Benchmark (cheap endpoint latency under heavy 9-box load) ===")
+    print(f"{N_USERS} employees, {HEAVY_REQUESTS} concurrent grid requests\n")
+    seed()
+    app = build_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await client.get("/scientific/talent/")  # warm-up both engines
+        await client.get("/legacy/scientific/talent/")
+        legacy = await run_scenario(client, "/legacy/scientific/talent/")
+        async_path = await run_scenario(client, "/scientific/talent/")
+
+    print(f"{'Path':<22} {'Grid total(ms)':>15} {'Pings':>7} {'p50(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}")
+    for label, r in [("sync session (legacy)", legacy), ("AsyncSession", async_path)]:
+        print(f"{label:<22} {r['grid_total_ms']:>15.1f} {r['pings']:>7} {r['p50']:>9.2f} {r['p99']:>9.2f} {r['max']:>9.2f}")
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
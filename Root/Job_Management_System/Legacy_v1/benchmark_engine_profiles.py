@@ -0,0 +1,94 @@
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+# Add root directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backend.database import ENGINE_PROFILES, create_profiled_engine
+
+# Benchmark runs against a copy of the dev database so the original file is never modified
+SOURCE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ai_native_hr.db")
+DURATION_SEC = float(os.getenv("BENCH_DURATION", "5"))
+READERS = int(os.getenv("BENCH_READERS", "8"))
+WRITERS = int(os.getenv("BENCH_WRITERS", "2"))
+
+READ_SQL = text("""
+    SELECT p.id, p.title, COUNT(t.id) AS task_count, AVG(t.importance) AS avg_importance
+    FROM job_positions p
+    LEFT JOIN job_tasks t ON t.job_id = p.id
+    GROUP BY p.id, p.title
+""")
+WRITE_SQL = text("""
+    INSERT INTO ai_generation_logs (id, target_type, target_id, prompt_context, reasoning, created_at)
+    VALUES (:id, 'BENCHMARK', :target_id, 'engine profile benchmark', 'n/a', CURRENT_TIMESTAMP)
+""")
+
+def _worker(engine, sql_fn, stop_at, counters, key):
+    ok = 0
+    errors = 0
+    while time.perf_counter() < stop_at:
+        try:
+            with engine.begin() as conn:
+                sql_fn(conn)
+            ok += 1
+        except OperationalError:
+            # "database is locked" under the rollback journal
+            errors += 1
+    with counters["lock"]:
+        counters[key] += ok
+        counters[key + "_errors"] += errors
+
+def run_profile(profile: str):
+    work_dir = tempfile.mkdtemp(prefix=f"bench_{profile}_")
+    db_path = os.path.join(work_dir, "bench.db")
+    shutil.copy(SOURCE_DB, db_path)
+
+    engine = create_profiled_engine(f"sqlite:///{db_path}", profile=profile)
+    counters = {"lock": threading.Lock(), "reads": 0, "reads_errors": 0, "writes": 0, "writes_errors": 0}
+
+    def do_read(conn):
+        conn.execute(READ_SQL).fetchall()
+
+    def do_write(conn):
+        conn.execute(WRITE_SQL, {"id": str(uuid.uuid4()), "target_id": str(uuid.uuid4())})
+
+    stop_at = time.perf_counter() + DURATION_SEC
+    threads = [threading.Thread(target=_worker, args=(engine, do_read, stop_at, counters, "reads")) for _ in range(READERS)]
+    threads += [threading.Thread(target=_worker, args=(engine, do_write, stop_at, counters, "writes")) for _ in range(WRITERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with engine.connect() as conn:
+        journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+    engine.dispose()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "profile": profile,
+        "journal_mode": journal_mode,
+        "reads_per_sec": counters["reads"] / DURATION_SEC,
+        "writes_per_sec": counters["writes"] / DURATION_SEC,
+        "lock_errors": counters["reads_errors"] + counters["writes_errors"],
+    }
+
+def run_benchmark():
+    print("=== Engine Profile Benchmark (concurrent read/write) ===")
+    print(f"Source: {SOURCE_DB} | {READERS} readers, {WRITERS} writers, {DURATION_SEC}s per profile\n")
+
+    results = [run_profile(name) for name in ENGINE_PROFILES]
+
+    print(f"{'Profile':<12} {'Journal':<8} {'Reads/s':>10} {'Writes/s':>10} {'Lock errors':>12}")
+    for r in results:
+        print(f"{r['profile']:<12} {r['journal_mode']:<8} {r['reads_per_sec']:>10.1f} {r['writes_per_sec']:>10.1f} {r['lock_errors']:>12}")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,144 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+
+# Add root directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+
+from backend import models, schemas
+from backend.database import Base, create_profiled_engine
+from backend.middleware.query_metrics import track_queries
+from backend.routers_legacy.evaluation import get_matrix_submission, submit_matrix
+from backend.services.evaluation_logic import EvaluationLogicService
+
+JOBS = int(os.getenv("BENCH_JOBS", "300"))
+FACTORS = int(os.getenv("BENCH_FACTORS", "12"))
+SESSION_ID = "bench-session"
+RATER_ID = "bench-rater"
+
+def seed(db):
+    """JOBS positions, one rater assigned to 90% of them (the rest exercise the unassigned skip)."""
+    db.add(models.JobGroup(id="g", name="Group"))
+    db.add(models.JobSeries(id="s", group_id="g", name="Series"))
+    db.add(models.User(id=RATER_ID, email="rater@example.com", name="Rater"))
+    db.add(models.EvaluationSession(id=SESSION_ID, name="Committee", start_date=date(2025, 1, 1)))
+    job_ids = [str(uuid.uuid4()) for _ in range(JOBS)]
+    for i, job_id in enumerate(job_ids):
+        db.add(models.JobPosition(id=job_id, series_id="s", title=f"Position {i}", grade=models.JobGrade.G3))
+        if i % 10:
+            db.add(models.EvaluationAssignment(session_id=SESSION_ID, rater_user_id=RATER_ID, target_job_position_id=job_id))
+    db.commit()
+    return job_ids
+
+def make_submission(job_ids, seed_value):
+    rng = random.Random(seed_value)
+    return schemas.MatrixSubmission(
+        session_id=SESSION_ID, rater_type=schemas.RaterType.SUPERVISOR_1, rater_user_id=RATER_ID,
+        ratings=[
+            schemas.MatrixRatingEntry(job_position_id=job_id,
+                                      factor_scores={f"Factor {f}": float(rng.randint(1, 10)) for f in range(FACTORS)})
+            for job_id in job_ids
+        ],
+    )
+
+def legacy_submit_matrix(session_id, submission, db):
+    """Previous implementation: assignment check, evaluation lookup (+flush) and score lookup per job."""
+    count = 0
+    for rating in submission.ratings:
+        if submission.rater_user_id and not EvaluationLogicService.validate_evaluation_access(
+                db, session_id, submission.rater_user_id, rating.job_position_id):
+            continue
+        db_eval = db.query(models.JobEvaluation).filter(
+            models.JobEvaluation.job_position_id == rating.job_position_id,
+            models.JobEvaluation.session_id == session_id
+        ).first()
+        if not db_eval:
+            db_eval = models.JobEvaluation(id=str(uuid.uuid4()), job_position_id=rating.job_position_id, session_id=session_id)
+            db.add(db_eval)
+            db.flush()
+        raw_total = sum(rating.factor_scores.values()) if rating.factor_scores else 0
+        db_score = db.query(models.JobEvaluationScore).filter(
+            models.JobEvaluationScore.evaluation_id == db_eval.id,
+            models.JobEvaluationScore.rater_type == submission.rater_type,
+            models.JobEvaluationScore.rater_user_id == submission.rater_user_id
+        ).first()
+        if db_score:
+            db_score.factor_scores = rating.factor_scores
+            db_score.raw_total = raw_total
+        else:
+            db.add(models.JobEvaluationScore(
+                id=str(uuid.uuid4()), evaluation_id=db_eval.id, rater_type=submission.rater_type,
+                rater_user_id=submission.rater_user_id, factor_scores=rating.factor_scores, raw_total=raw_total
+            ))
+        count += 1
+    db.commit()
+    return count
+
+def legacy_get_matrix_submission(session_id, rater_type, rater_user_id, db):
+    """Previous implementation: one score query per evaluation in the session."""
+    ratings = []
+    for ev in db.query(models.JobEvaluation).filter(models.JobEvaluation.session_id == session_id).all():
+        score = db.query(models.JobEvaluationScore).filter(
+            models.JobEvaluationScore.evaluation_id == ev.id,
+            models.JobEvaluationScore.rater_type == rater_type,
+            models.JobEvaluationScore.rater_user_id == rater_user_id
+        ).first()
+        if score:
+            ratings.append(schemas.MatrixRatingEntry(job_position_id=ev.job_position_id, factor_scores=score.factor_scores or {}))
+    return ratings
+
+def timed(session_factory, fn):
+    db = session_factory()
+    try:
+        with track_queries() as stats:
+            start = time.perf_counter()
+            result = fn(db)
+            elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+    return elapsed * 1000, stats.count, result
+
+def fresh_session_factory():
+    work_dir = tempfile.mkdtemp(prefix="bench_evaluation_")
+    engine = create_profiled_engine(f"sqlite:///{os.path.join(work_dir, 'bench.db')}")
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine, autoflush=False)
+
+def run_benchmark():
+    print(f"=== Committee Matrix Evaluation Benchmark ({JOBS} jobs x {FACTORS} factors) ===\n")
+    implementations = {
+        "legacy": (
+            lambda db, sub: legacy_submit_matrix(SESSION_ID, sub, db),
+            lambda db: legacy_get_matrix_submission(SESSION_ID, "SUPERVISOR_1", RATER_ID, db),
+        ),
+        "batched": (
+            lambda db, sub: submit_matrix(SESSION_ID, sub, db=db).processed_count,
+            lambda db: get_matrix_submission(SESSION_ID, "SUPERVISOR_1", RATER_ID, db=db).ratings,
+        ),
+    }
+    results = {}
+    for label, (submit, reload) in implementations.items():
+        engine, Session = fresh_session_factory()
+        with Session() as db:
+            job_ids = seed(db)
+        # First submission creates evaluations and scores, the second one updates every score
+        first = timed(Session, lambda db: submit(db, make_submission(job_ids, 1)))
+        second = timed(Session, lambda db: submit(db, make_submission(job_ids, 2)))
+        loaded = timed(Session, reload)
+        assert first[2] == second[2] == len(loaded[2]) == JOBS - len(job_ids[::10])
+        results[label] = [first, second, loaded]
+        engine.dispose()
+
+    print(f"{'Scenario':<22} {'Legacy(ms)':>11} {'Queries':>8} {'Batched(ms)':>12} {'Queries':>8} {'Speedup':>8}")
+    for i, scenario in enumerate(("submit (inserts)", "resubmit (updates)", "reload")):
+        (legacy_ms, legacy_q, _), (batched_ms, batched_q, _) = results["legacy"][i], results["batched"][i]
+        print(f"{scenario:<22} {legacy_ms:>11.0f} {legacy_q:>8} {batched_ms:>12.0f} {batched_q:>8} {legacy_ms / batched_ms:>7.1f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
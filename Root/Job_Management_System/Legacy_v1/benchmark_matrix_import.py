@@ -0,0 +1,103 @@
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+# Add root directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import sessionmaker
+
+from backend import models
+from backend.database import Base, create_profiled_engine
+from backend.middleware.query_metrics import track_queries
+from backend.routers_legacy.classification import JobMatrixItem
+from backend.services.classification_service import ClassificationService
+
+ROWS = int(os.getenv("BENCH_ROWS", "10000"))
+
+def make_items(n_rows, workload=1.0):
+    # 10 groups x 5 series x 10 positions x 5 tasks x 4 work items per 10k rows
+    return [
+        JobMatrixItem(
+            group_name=f"Group {i // 1000}", series_name=f"Series {i // 200}", position_title=f"Position {i // 20}",
+            position_grade="G3", task_name=f"Task {i // 4}", work_item_name=f"Item {i}",
+            frequency="MONTHLY", workload=workload,
+        )
+        for i in range(n_rows)
+    ]
+
+def legacy_save_job_matrix(db, items):
+    """Previous implementation: name lookups per row and level, flush after each insert."""
+    for item in items:
+        group = db.query(models.JobGroup).filter(models.JobGroup.name == item.group_name).first()
+        if not group:
+            group = models.JobGroup(id=str(uuid.uuid4()), name=item.group_name)
+            db.add(group)
+            db.flush()
+        series = db.query(models.JobSeries).filter(models.JobSeries.name == item.series_name, models.JobSeries.group_id == group.id).first()
+        if not series:
+            series = models.JobSeries(id=str(uuid.uuid4()), group_id=group.id, name=item.series_name)
+            db.add(series)
+            db.flush()
+        position = db.query(models.JobPosition).filter(models.JobPosition.title == item.position_title, models.JobPosition.series_id == series.id).first()
+        if not position:
+            position = models.JobPosition(id=str(uuid.uuid4()), series_id=series.id, title=item.position_title, grade=item.position_grade)
+            db.add(position)
+            db.flush()
+        elif item.position_grade:
+            position.grade = item.position_grade
+        task = db.query(models.JobTask).filter(models.JobTask.task_name == item.task_name, models.JobTask.job_position_id == position.id).first()
+        if not task:
+            task = models.JobTask(id=str(uuid.uuid4()), job_position_id=position.id, task_name=item.task_name)
+            db.add(task)
+            db.flush()
+        if item.work_item_name:
+            work_item = db.query(models.WorkItem).filter(models.WorkItem.name == item.work_item_name, models.WorkItem.job_task_id == task.id).first()
+            if not work_item:
+                db.add(models.WorkItem(id=str(uuid.uuid4()), job_task_id=task.id, name=item.work_item_name,
+                                       frequency=item.frequency, estimated_hours_per_occurrence=item.workload))
+            else:
+                work_item.frequency = item.frequency
+                work_item.estimated_hours_per_occurrence = item.workload
+    db.commit()
+
+def timed(session_factory, fn):
+    db = session_factory()
+    try:
+        with track_queries() as stats:
+            start = time.perf_counter()
+            fn(db)
+            elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+    return elapsed * 1000, stats.count
+
+def fresh_session_factory():
+    work_dir = tempfile.mkdtemp(prefix="bench_matrix_")
+    engine = create_profiled_engine(f"sqlite:///{os.path.join(work_dir, 'bench.db')}")
+    Base.metadata.create_all(bind=engine)
+    return engine, sessionmaker(bind=engine, autoflush=False)
+
+def run_benchmark():
+    print(f"=== Classification Matrix Import Benchmark ({ROWS} rows) ===\n")
+    print(f"{'Scenario':<22} {'Legacy(ms)':>11} {'Queries':>8} {'Bulk(ms)':>9} {'Queries':>8} {'Speedup':>8}")
+    results = {}
+    for label, save in (("legacy", legacy_save_job_matrix), ("bulk", lambda db, items: ClassificationService(db).save_matrix(items))):
+        engine, Session = fresh_session_factory()
+        # First import creates everything, the second one only updates the work item hours
+        results[label] = [
+            timed(Session, lambda db: save(db, make_items(ROWS))),
+            timed(Session, lambda db: save(db, make_items(ROWS, workload=2.0))),
+        ]
+        with Session() as db:
+            assert db.query(models.WorkItem).count() == ROWS
+        engine.dispose()
+
+    for i, scenario in enumerate(("initial import", "re-import (updates)")):
+        (legacy_ms, legacy_q), (bulk_ms, bulk_q) = results["legacy"][i], results["bulk"][i]
+        print(f"{scenario:<22} {legacy_ms:>11.0f} {legacy_q:>8} {bulk_ms:>9.0f} {bulk_q:>8} {legacy_ms / bulk_ms:>7.1f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,109 @@
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+# Add root directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from backend import models
+from backend.database import Base, create_profiled_engine
+from backend.middleware.query_metrics import track_queries
+from backend.services import current_review
+from backend.services.nine_box_service import NineBoxService
+
+SIZES = [int(n) for n in os.getenv("BENCH_SIZES", "10000,50000").split(",")]
+ORG_UNITS = 50
+
+def legacy_get_grid_data(db):
+    """Previous implementation: one review query per user + lazy-loaded org unit."""
+    service = NineBoxService(db)
+    grid_data = []
+    for user in db.query(models.User).all():
+        review = db.query(models.PerformanceReview)\
+            .filter(models.PerformanceReview.user_id == user.id)\
+            .filter(models.PerformanceReview.status == models.ReviewStatus.FINAL)\
+            .order_by(models.PerformanceReview.year.desc())\
+            .first()
+        if not review:
+            continue
+        box = review.nine_box_position
+        if not box:
+            box, category, color = service._calculate_box_position(review.total_score, review.score_potential)
+        grid_data.append({"id": user.id, "review_id": review.id, "dept": user.org_unit.name if user.org_unit else "N/A", "box": box})
+    return grid_data
+
+def legacy_auto_map_all(db):
+    service = NineBoxService(db)
+    count = 0
+    for user in db.query(models.User).all():
+        review = db.query(models.PerformanceReview)\
+            .filter(models.PerformanceReview.user_id == user.id)\
+            .filter(models.PerformanceReview.status == models.ReviewStatus.FINAL)\
+            .order_by(models.PerformanceReview.year.desc())\
+            .first()
+        if review:
+            box, _, _ = service._calculate_box_position(review.total_score, review.score_potential)
+            review.nine_box_position = box
+            db.add(review)
+            count += 1
+    db.commit()
+    return {"updated_count": count}
+
+def seed(engine, n_users):
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(models.Institution), [{"id": "bench-inst", "name": "Bench Inst", "code": "BENCH"}])
+        units = [{"id": f"unit-{i}", "institution_id": "bench-inst", "name": f"Team {i}", "unit_type": "TEAM"} for i in range(ORG_UNITS)]
+        conn.execute(insert(models.OrgUnit), units)
+        users, reviews = [], []
+        for i in range(n_users):
+            user_id = str(uuid.uuid4())
+            users.append({"id": user_id, "institution_id": "bench-inst", "org_unit_id": f"unit-{i % ORG_UNITS}",
+                          "email": f"u{i}@bench.com", "name": f"User {i}"})
+            # Two finalized years and an open draft per employee
+            for year, status in ((2023, models.ReviewStatus.FINAL), (2024, models.ReviewStatus.FINAL), (2025, models.ReviewStatus.DRAFT)):
+                reviews.append({"id": str(uuid.uuid4()), "user_id": user_id, "year": year, "status": status,
+                                "total_score": float((i * 13 + year) % 100), "score_potential": float((i * 7 + year) % 100)})
+        conn.execute(insert(models.User), users)
+        conn.execute(insert(models.PerformanceReview), reviews)
+        # Core executemany bypasses the flush listener
+        current_review.refresh_users(conn)
+
+def timed(session_factory, fn):
+    db = session_factory()
+    try:
+        with track_queries() as stats:
+            start = time.perf_counter()
+            result = fn(db)
+            elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+    return elapsed * 1000, stats.count, result
+
+def run_benchmark():
+    print("=== 9-Box Benchmark (per-user queries vs window function / bulk UPDATE) ===\n")
+    print(f"{'Employees':>10} {'Operation':<14} {'Legacy(ms)':>11} {'Queries':>8} {'Set-based(ms)':>14} {'Queries':>8} {'Speedup':>8}")
+    for n in SIZES:
+        work_dir = tempfile.mkdtemp(prefix="bench_ninebox_")
+        engine = create_profiled_engine(f"sqlite:///{os.path.join(work_dir, 'bench.db')}")
+        seed(engine, n)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        legacy_ms, legacy_q, legacy_rows = timed(Session, legacy_get_grid_data)
+        new_ms, new_q, grid = timed(Session, lambda db: NineBoxService(db).get_grid_data())
+        assert len(legacy_rows) == grid["total_employees"] == n
+        print(f"{n:>10} {'grid':<14} {legacy_ms:>11.0f} {legacy_q:>8} {new_ms:>14.0f} {new_q:>8} {legacy_ms / new_ms:>7.1f}x")
+
+        legacy_ms, legacy_q, legacy_result = timed(Session, legacy_auto_map_all)
+        new_ms, new_q, new_result = timed(Session, lambda db: NineBoxService(db).auto_map_all())
+        assert legacy_result == new_result
+        print(f"{n:>10} {'auto_map_all':<14} {legacy_ms:>11.0f} {legacy_q:>8} {new_ms:>14.0f} {new_q:>8} {legacy_ms / new_ms:>7.1f}x")
+        engine.dispose()
+
+if __name__ == "__main__":
+    run_benchmark()
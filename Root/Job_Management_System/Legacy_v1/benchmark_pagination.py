@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+# Benchmark database must be selected before backend.database creates its engines
+BENCH_DIR = tempfile.mkdtemp(prefix="bench_pagination_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(BENCH_DIR, 'bench.db')}"
+
+# Add root directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import insert
+
+from backend import crud, models
+from backend.database import Base, SessionLocal, engine
+from backend.pagination import encode_cursor
+
+N_USERS = int(os.getenv("BENCH_USERS", "500000"))
+PAGE_SIZE = int(os.getenv("BENCH_PAGE_SIZE", "100"))
+REPEATS = int(os.getenv("BENCH_REPEATS", "5"))
+DEPTHS = [0.0, 0.1, 0.5, 0.9, 0.999]  # fraction of the table already paged through
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        db.execute(insert(models.Institution), [{"id": "bench-inst", "name": "Bench Inst", "code": "BENCH"}])
+        batch = []
+        for i in range(N_USERS):
+            batch.append({"id": str(uuid.uuid4()), "institution_id": "bench-inst", "email": f"u{i}@bench.com", "name": f"User {i}"})
+            if len(batch) == 50000:
+                db.execute(insert(models.User), batch)
+                batch = []
+        if batch:
+            db.execute(insert(models.User), batch)
+        db.commit()
+    finally:
+        db.close()
+
+def best_ms(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def run_benchmark():
+    print("=== Pagination Benchmark (offset vs keyset cursor) ===")
+    print(f"{N_USERS} users in one institution, page size {PAGE_SIZE}, best of {REPEATS}\n")
+    seed()
+    db = SessionLocal()
+    try:
+        # Sorted ids give the cursor that a client would hold after paging to the same depth
+        ids = [row[0] for row in db.query(models.User.id).filter(models.User.institution_id == "bench-inst").order_by(models.User.id)]
+
+        print(f"{'Depth':>7} {'Offset':>9} {'Offset(ms)':>11} {'Cursor(ms)':>11} {'Speedup':>8}")
+        for depth in DEPTHS:
+            skip = min(int(N_USERS * depth), N_USERS - PAGE_SIZE)
+            cursor = encode_cursor([ids[skip - 1]]) if skip else ""
+
+            offset_ms = best_ms(lambda: crud.get_users(db, "bench-inst", skip=skip, limit=PAGE_SIZE))
+            cursor_ms = best_ms(lambda: crud.get_users_page(db, "bench-inst", cursor=cursor, limit=PAGE_SIZE))
+            rows, _ = crud.get_users_page(db, "bench-inst", cursor=cursor, limit=PAGE_SIZE)
+            assert [r.id for r in rows] == ids[skip:skip + PAGE_SIZE]
+            print(f"{depth:>7.1%} {skip:>9} {offset_ms:>11.2f} {cursor_ms:>11.2f} {offset_ms / cursor_ms:>7.1f}x")
+            db.expunge_all()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+
+# Add root directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from backend import models
+from backend.database import Base, create_profiled_engine
+from backend.middleware.query_metrics import track_queries
+from backend.routers_legacy import career
+from backend.services import current_review
+
+SIZES = [int(n) for n in os.getenv("BENCH_SIZES", "10000,50000").split(",")]
+GRADES = ["S", "A", "B", "B", "C"]
+
+def legacy_get_promotion_candidates(db):
+    """Previous implementation: every user + lazy-loaded positions + one latest-review query per user."""
+    candidates = []
+    for user in db.query(models.User).all():
+        current_pos = None
+        for pos in user.job_positions:
+            if not pos.is_future_model:
+                current_pos = pos
+                break
+        if not current_pos:
+            continue
+        latest_review = db.query(models.PerformanceReview)\
+            .filter(models.PerformanceReview.user_id == user.id)\
+            .order_by(models.PerformanceReview.year.desc())\
+            .first()
+        if latest_review and latest_review.grade in ['S', 'A']:
+            candidates.append(user.id)
+    return candidates
+
+def seed(engine, n_users):
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(models.Institution), [{"id": "bench-inst", "name": "Bench Inst", "code": "BENCH"}])
+        users, positions, reviews = [], [], []
+        for i in range(n_users):
+            user_id = str(uuid.uuid4())
+            users.append({"id": user_id, "institution_id": "bench-inst", "email": f"u{i}@bench.com", "name": f"User {i}"})
+            positions.append({"id": str(uuid.uuid4()), "user_id": user_id, "title": f"Role {i % 40}",
+                              "grade": list(models.JobGrade)[i % 5], "is_future_model": False,
+                              "start_date": date(2015 + i % 10, 1, 1)})
+            for year in (2023, 2024, 2025):
+                reviews.append({"id": str(uuid.uuid4()), "user_id": user_id, "year": year,
+                                "status": models.ReviewStatus.FINAL, "grade": GRADES[(i + year) % len(GRADES)]})
+        conn.execute(insert(models.User), users)
+        conn.execute(insert(models.JobPosition), positions)
+        conn.execute(insert(models.PerformanceReview), reviews)
+        # Core executemany bypasses the flush listener
+        current_review.refresh_users(conn)
+
+def timed(session_factory, fn):
+    db = session_factory()
+    try:
+        with track_queries() as stats:
+            start = time.perf_counter()
+            result = fn(db)
+            elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+    return elapsed * 1000, stats.count, result
+
+def run_benchmark():
+    print("=== Promotion Candidate Benchmark (per-user review lookups vs current_reviews projection) ===\n")
+    print(f"{'Employees':>10} {'Legacy(ms)':>11} {'Queries':>8} {'Projection(ms)':>15} {'Queries':>8} {'Speedup':>8}")
+    for n in SIZES:
+        work_dir = tempfile.mkdtemp(prefix="bench_promotion_")
+        engine = create_profiled_engine(f"sqlite:///{os.path.join(work_dir, 'bench.db')}")
+        seed(engine, n)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        legacy_ms, legacy_q, legacy_ids = timed(Session, legacy_get_promotion_candidates)
+        new_ms, new_q, rows = timed(Session, lambda db: career.get_promotion_candidates(
+            performance_grades=["S", "A"], position_grades=None, series_id=None, institution_id=None, db=db))
+        assert sorted(legacy_ids) == sorted(r["user_id"] for r in rows)
+        print(f"{n:>10} {legacy_ms:>11.0f} {legacy_q:>8} {new_ms:>15.0f} {new_q:>8} {legacy_ms / new_ms:>7.1f}x")
+        engine.dispose()
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,129 @@
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+# Add root directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from backend.ncs_data import get_ncs_job_list
+from backend.services import search_index_store
+from backend.services.search_engine import HANGUL_BIGRAM, WORDS, TFIDFEngine
+
+DOCS = int(os.getenv("BENCH_DOCS", "200000"))
+RELEVANT_PER_POSITION = 20
+TOP_K = 20
+
+TEMPLATES = [
+    "{position} 업무 계획 수립", "{position} 관련 규정 검토 및 개정", "{series} 현황 보고서 작성",
+    "{position}를 위한 교육 운영", "{group} 부문 {position} 성과 분석", "{position} 담당자 협의 및 조정",
+    "연간 {position} 예산 편성", "{position} 실적 점검 및 개선",
+]
+FILLER = ["월별", "분기", "주간", "보고", "점검", "개선", "관리", "지원", "운영", "회의", "자료", "준비", "검토",
+          "협조", "결재", "문서", "시스템", "현황", "ERP", "KPI", "audit", "report", "budget", "review"]
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히"
+
+def make_corpus(n, seed=42):
+    """
+    NCS hierarchy entries + RELEVANT_PER_POSITION task docs per NCS position (the relevance labels),
+    filled up to n with generic tasks that belong to no position.
+    """
+    rng = random.Random(seed)
+    jobs = get_ncs_job_list()
+    docs, labels = {}, {}
+    for job in jobs:
+        docs[f"ncs:{job['position_code']}"] = job["full_path"]
+        labels[f"ncs:{job['position_code']}"] = job["position_code"]
+        for i in range(RELEVANT_PER_POSITION):
+            text = rng.choice(TEMPLATES).format(position=job["position"], series=job["series"], group=job["group"])
+            docs[f"task:{job['position_code']}:{i}"] = f"{text} {' '.join(rng.choices(FILLER, k=rng.randint(0, 3)))}"
+            labels[f"task:{job['position_code']}:{i}"] = job["position_code"]
+    for i in range(n - len(docs)):
+        words = ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 3))) for _ in range(rng.randint(1, 3))]
+        docs[f"task:generic:{i}"] = " ".join(words + rng.choices(FILLER, k=rng.randint(2, 5)))
+    return jobs, docs, labels
+
+def make_queries(jobs):
+    """Per NCS position: the name, the name with a particle attached, and the name with a generic word."""
+    queries = []
+    for job in jobs:
+        for query in (job["position"], f"{job['position']}의", f"{job['position']} 업무"):
+            queries.append((query, job["position_code"]))
+    return queries
+
+def scan_search(docs, query, top_k=TOP_K):
+    """Fallback without a usable index: substring scan in corpus order."""
+    hits = []
+    for doc_id, text in docs.items():
+        if query in text:
+            hits.append((doc_id, 1.0))
+            if len(hits) == top_k:
+                break
+    return hits
+
+def evaluate(search, queries, labels):
+    recalls, latencies = [], []
+    for query, code in queries:
+        start = time.perf_counter()
+        results = search(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        relevant = sum(1 for doc_id, _ in results if labels.get(doc_id) == code)
+        recalls.append(relevant / min(TOP_K, RELEVANT_PER_POSITION + 1))
+    return statistics.mean(recalls), latencies
+
+def p95(latencies):
+    return sorted(latencies)[max(0, math.ceil(len(latencies) * 0.95) - 1)]
+
+def build(tokenizer, docs):
+    engine = TFIDFEngine(tokenizer=tokenizer)
+    start = time.perf_counter()
+    for doc_id, text in docs.items():
+        engine.add_document(doc_id, text)
+    engine.build_index()
+    return engine, (time.perf_counter() - start) * 1000
+
+def run_benchmark():
+    jobs, docs, labels = make_corpus(DOCS)
+    queries = make_queries(jobs)
+    print(f"=== Korean Search Benchmark: {len(jobs)} NCS positions, {len(queries)} queries, {len(docs)} documents ===\n")
+
+    words_engine, words_ms = build(WORDS, docs)
+    bigram_engine, bigram_ms = build(HANGUL_BIGRAM, docs)
+    path = os.path.join(tempfile.mkdtemp(prefix="bench_search_ko_"), "search.idx")
+    search_index_store.publish(bigram_engine, path)
+    mapped = search_index_store.MappedIndex(path)
+    print(f"Index build: words {words_ms:.0f} ms ({len(words_engine.index)} terms), "
+          f"hangul-bigram {bigram_ms:.0f} ms ({len(bigram_engine.index)} terms)")
+    raw_docs_bytes = len(mapped.posting_weights) * 4
+    print(f"Published postings: {len(mapped.posting_weights)} doc ids in {len(mapped.posting_docs) / 2**20:.1f} MB "
+          f"delta encoded vs {raw_docs_bytes / 2**20:.1f} MB as uint32 "
+          f"({len(mapped.posting_docs) / raw_docs_bytes:.0%}), file {os.path.getsize(path) / 2**20:.1f} MB\n")
+
+    print(f"{'Method':<24} {'Recall@20':>10} {'Mean(ms)':>9} {'p95(ms)':>8}")
+    methods = [
+        ("substring scan", lambda q: scan_search(docs, q)),
+        ("index, words", lambda q: words_engine.search(q, top_k=TOP_K)),
+        ("index, hangul-bigram", lambda q: bigram_engine.search(q, top_k=TOP_K)),
+        ("mmap, hangul-bigram", lambda q: mapped.search(q, top_k=TOP_K)),
+    ]
+    for label, search in methods:
+        recall, latencies = evaluate(search, queries, labels)
+        print(f"{label:<24} {recall:>10.2f} {statistics.mean(latencies):>9.2f} {p95(latencies):>8.2f}")
+
+    # Korean vs English queries on the same index: cost per posting walked
+    english = [(word, None) for word in ("audit", "report", "budget", "review", "erp", "kpi", "hrd")]
+    korean = [(query, None) for query, _ in queries]
+    print(f"\n{'Query set':<24} {'Postings':>9} {'Mean(ms)':>9} {'us/1k postings':>15}")
+    for label, group in (("Korean", korean), ("English", english)):
+        walked = statistics.mean(sum(len(bigram_engine.index.get(t, ())) for t in set(bigram_engine._tokenize(q)))
+                                 for q, _ in group)
+        for index_label, search in (("index", bigram_engine.search), ("mmap", mapped.search)):
+            _, latencies = evaluate(lambda q: search(q, top_k=TOP_K), group * 5, labels)
+            mean = statistics.mean(latencies)
+            print(f"{label + ', ' + index_label:<24} {walked:>9.0f} {mean:>9.2f} {mean * 1e6 / walked:>15.1f}")
+
+if __name__ == "__main__":
+    run_benchmark()
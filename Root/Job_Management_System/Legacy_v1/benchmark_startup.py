@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Startup time of the API workers: create_all on every start vs. the schema stamp check.
+# Each worker is a fresh interpreter that imports backend.main and runs the app lifespan,
+# which is what uvicorn/gunicorn do per worker before accepting requests.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DB = os.path.join(ROOT, "ai_native_hr.db")
+WORKER_COUNTS = [1, 8]
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "3"))
+
+WORKER_CODE = """
+import asyncio, json, time
+t0 = time.perf_counter()
+from backend.main import app
+t1 = time.perf_counter()
+async def boot():
+    async with app.router.lifespan_context(app):
+        pass
+asyncio.run(boot())
+t2 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "schema_ms": (t2 - t1) * 1000}))
+"""
+
+def start_workers(n, env):
+    start = time.perf_counter()
+    procs = [
+        subprocess.Popen([sys.executable, "-c", WORKER_CODE], cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for _ in range(n)
+    ]
+    results = []
+    for p in procs:
+        out, err = p.communicate()
+        if p.returncode != 0:
+            raise RuntimeError(err.strip().splitlines()[-1])
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    wall_ms = (time.perf_counter() - start) * 1000
+    return wall_ms, max(r["schema_ms"] for r in results)
+
+def run_benchmark():
+    print("=== Worker Startup Benchmark (SCHEMA_STARTUP=create vs check) ===")
+    work_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    db_path = os.path.join(work_dir, "bench.db")
+    shutil.copy(SOURCE_DB, db_path)
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}")
+    try:
+        # Stamp the copy once, as a deployment would before starting workers
+        subprocess.run([sys.executable, "-m", "backend.manage_db", "upgrade"], cwd=ROOT, env=env, check=True, capture_output=True)
+        print(f"Source: {SOURCE_DB} | best of {ROUNDS} rounds\n")
+        print(f"{'Mode':<8} {'Workers':>8} {'All ready(ms)':>14} {'Slowest schema step(ms)':>24}")
+        for mode in ["create", "check"]:
+            for n in WORKER_COUNTS:
+                runs = [start_workers(n, dict(env, SCHEMA_STARTUP=mode)) for _ in range(ROUNDS)]
+                wall_ms, schema_ms = min(runs)
+                print(f"{mode:<8} {n:>8} {wall_ms:>14.1f} {schema_ms:>24.2f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,162 @@
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+import uuid
+
+# Size / join-speed comparison of the key layouts for the high-volume tables.
+#   uuid_pk     : current layout, VARCHAR(36) primary key and VARCHAR foreign keys
+#   compact_pk  : COMPACT_KEYS=true layout, INTEGER pk + UNIQUE VARCHAR id, foreign keys still on id
+#   compact_fk  : INTEGER pk and INTEGER foreign keys (what the compact keys make possible for joins)
+N_ENTRIES = int(os.getenv("BENCH_ROWS", "1000000"))
+N_TASKS = int(os.getenv("BENCH_TASKS", "20000"))
+N_USERS = int(os.getenv("BENCH_USERS", "50000"))
+JOIN_REPEATS = int(os.getenv("BENCH_REPEATS", "3"))
+
+LAYOUTS = {
+    "uuid_pk": """
+        CREATE TABLE job_tasks (id VARCHAR NOT NULL PRIMARY KEY, task_name VARCHAR NOT NULL, category VARCHAR);
+        CREATE TABLE workload_entries (
+            id VARCHAR NOT NULL PRIMARY KEY, survey_period_id VARCHAR, user_id VARCHAR,
+            task_id VARCHAR REFERENCES job_tasks(id), volume FLOAT, standard_time FLOAT, fte FLOAT);
+        CREATE INDEX ix_workload_entries_user_survey ON workload_entries (user_id, survey_period_id);
+        CREATE INDEX ix_workload_entries_task ON workload_entries (task_id);
+    """,
+    "compact_pk": """
+        CREATE TABLE job_tasks (pk INTEGER PRIMARY KEY, id VARCHAR NOT NULL UNIQUE, task_name VARCHAR NOT NULL, category VARCHAR);
+        CREATE TABLE workload_entries (
+            pk INTEGER PRIMARY KEY, id VARCHAR NOT NULL UNIQUE, survey_period_id VARCHAR, user_id VARCHAR,
+            task_id VARCHAR REFERENCES job_tasks(id), volume FLOAT, standard_time FLOAT, fte FLOAT);
+        CREATE INDEX ix_workload_entries_user_survey ON workload_entries (user_id, survey_period_id);
+        CREATE INDEX ix_workload_entries_task ON workload_entries (task_id);
+    """,
+    "compact_fk": """
+        CREATE TABLE job_tasks (pk INTEGER PRIMARY KEY, id VARCHAR NOT NULL UNIQUE, task_name VARCHAR NOT NULL, category VARCHAR);
+        CREATE TABLE workload_entries (
+            pk INTEGER PRIMARY KEY, id VARCHAR NOT NULL UNIQUE, survey_period_id INTEGER, user_id INTEGER,
+            task_id INTEGER REFERENCES job_tasks(pk), volume FLOAT, standard_time FLOAT, fte FLOAT);
+        CREATE INDEX ix_workload_entries_user_survey ON workload_entries (user_id, survey_period_id);
+        CREATE INDEX ix_workload_entries_task ON workload_entries (task_id);
+    """,
+}
+
+# 업무(카테고리)별 총 FTE - 분석 화면에서 가장 자주 쓰이는 조인 형태
+JOIN_SQL = {
+    "uuid_pk": "SELECT t.category, SUM(w.fte) FROM workload_entries w JOIN job_tasks t ON t.id = w.task_id GROUP BY t.category",
+    "compact_pk": "SELECT t.category, SUM(w.fte) FROM workload_entries w JOIN job_tasks t ON t.id = w.task_id GROUP BY t.category",
+    "compact_fk": "SELECT t.category, SUM(w.fte) FROM workload_entries w JOIN job_tasks t ON t.pk = w.task_id GROUP BY t.category",
+}
+# 한 업무에 대한 입력 조회 (FK 인덱스 탐색)
+LOOKUP_SQL = {
+    "uuid_pk": "SELECT COUNT(*), SUM(w.fte) FROM workload_entries w WHERE w.task_id = ?",
+    "compact_pk": "SELECT COUNT(*), SUM(w.fte) FROM workload_entries w WHERE w.task_id = ?",
+    "compact_fk": "SELECT COUNT(*), SUM(w.fte) FROM workload_entries w WHERE w.task_id = ?",
+}
+
+def build_dataset():
+    """Same logical data for every layout: string IDs plus their 1-based ordinals."""
+    rng = random.Random(42)
+    task_ids = [str(uuid.uuid4()) for _ in range(N_TASKS)]
+    user_ids = [str(uuid.uuid4()) for _ in range(N_USERS)]
+    period_ids = [str(uuid.uuid4()) for _ in range(4)]
+    entries = []
+    for _ in range(N_ENTRIES):
+        entries.append((
+            str(uuid.uuid4()), rng.randrange(4), rng.randrange(N_USERS), rng.randrange(N_TASKS),
+            rng.uniform(1, 100), rng.uniform(0.1, 5.0),
+        ))
+    return task_ids, user_ids, period_ids, entries
+
+def load(conn, layout, dataset):
+    task_ids, user_ids, period_ids, entries = dataset
+    conn.executescript(LAYOUTS[layout])
+    if layout == "uuid_pk":
+        conn.executemany("INSERT INTO job_tasks (id, task_name, category) VALUES (?, ?, ?)",
+                         ((tid, f"Task {i}", f"C{i % 50}") for i, tid in enumerate(task_ids)))
+    else:
+        conn.executemany("INSERT INTO job_tasks (pk, id, task_name, category) VALUES (?, ?, ?, ?)",
+                         ((i + 1, tid, f"Task {i}", f"C{i % 50}") for i, tid in enumerate(task_ids)))
+
+    def rows():
+        for n, (eid, p, u, t, volume, std) in enumerate(entries):
+            fte = volume * std / 2080.0
+            if layout == "compact_fk":
+                yield (n + 1, eid, p + 1, u + 1, t + 1, volume, std, fte)
+            elif layout == "compact_pk":
+                yield (n + 1, eid, period_ids[p], user_ids[u], task_ids[t], volume, std, fte)
+            else:
+                yield (eid, period_ids[p], user_ids[u], task_ids[t], volume, std, fte)
+
+    if layout == "uuid_pk":
+        sql = "INSERT INTO workload_entries (id, survey_period_id, user_id, task_id, volume, standard_time, fte) VALUES (?, ?, ?, ?, ?, ?, ?)"
+    else:
+        sql = "INSERT INTO workload_entries (pk, id, survey_period_id, user_id, task_id, volume, standard_time, fte) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    conn.executemany(sql, rows())
+    conn.commit()
+    conn.execute("ANALYZE")
+
+def sizes(conn):
+    """Bytes per table / index from the DBSTAT virtual table."""
+    try:
+        rows = conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name").fetchall()
+    except sqlite3.OperationalError:
+        print("Warning: SQLite was built without DBSTAT; size columns will be 0.")
+        return {"table": 0, "index": 0}
+    kinds = dict(conn.execute("SELECT name, type FROM sqlite_master").fetchall())
+    table_bytes = sum(size for name, size in rows if kinds.get(name) == "table")
+    index_bytes = sum(size for name, size in rows if kinds.get(name) == "index")
+    return {"table": table_bytes, "index": index_bytes}
+
+def best_of(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def run_layout(layout, dataset, work_dir):
+    path = os.path.join(work_dir, f"{layout}.db")
+    conn = sqlite3.connect(path)
+    start = time.perf_counter()
+    load(conn, layout, dataset)
+    load_sec = time.perf_counter() - start
+    size = sizes(conn)
+
+    join_ms = best_of(lambda: conn.execute(JOIN_SQL[layout]).fetchall(), JOIN_REPEATS)
+
+    task_ids = dataset[0]
+    rng = random.Random(7)
+    probes = [rng.randrange(N_TASKS) for _ in range(2000)]
+    keys = [p + 1 for p in probes] if layout == "compact_fk" else [task_ids[p] for p in probes]
+    lookup_ms = best_of(lambda: [conn.execute(LOOKUP_SQL[layout], (k,)).fetchone() for k in keys], JOIN_REPEATS)
+    conn.close()
+
+    return {
+        "layout": layout,
+        "load_sec": load_sec,
+        "file_mb": os.path.getsize(path) / 1024 / 1024,
+        "table_mb": size["table"] / 1024 / 1024,
+        "index_mb": size["index"] / 1024 / 1024,
+        "join_ms": join_ms,
+        "lookup_ms": lookup_ms,
+    }
+
+def run_benchmark():
+    print("=== Surrogate Key Benchmark (workload_entries JOIN job_tasks) ===")
+    print(f"{N_ENTRIES} workload entries, {N_TASKS} tasks, {N_USERS} users\n")
+    dataset = build_dataset()
+    work_dir = tempfile.mkdtemp(prefix="bench_keys_")
+    try:
+        results = [run_layout(layout, dataset, work_dir) for layout in LAYOUTS]
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"{'Layout':<12} {'Load(s)':>8} {'File(MB)':>9} {'Tables(MB)':>11} {'Indexes(MB)':>12} {'Join(ms)':>9} {'2k lookups(ms)':>15}")
+    for r in results:
+        print(f"{r['layout']:<12} {r['load_sec']:>8.1f} {r['file_mb']:>9.1f} {r['table_mb']:>11.1f} {r['index_mb']:>12.1f} {r['join_ms']:>9.1f} {r['lookup_ms']:>15.1f}")
+
+if __name__ == "__main__":
+    run_benchmark()
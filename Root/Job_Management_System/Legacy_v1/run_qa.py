@@ -1,7 +1,6 @@
-
 import sys
 import os
-import pytest
+import subprocess
 
 # Add the current directory (Root/Job_Management_System) to sys.path
 # This ensures that 'backend' package can be imported from anywhere
@@ -9,6 +8,11 @@ sys.path.append(os.getcwd())
 
 if __name__ == "__main__":
     print(f"Running QA from {os.getcwd()}")
-    # Run pytest on the backend/tests folder
-    exit_code = pytest.main(["backend/tests"])
+    # Run pytest on the backend/tests folder once per key layout.
+    # COMPACT_KEYS 는 import 시점에 모델의 PK 구조를 정하므로 모드마다 별도 프로세스에서 실행한다.
+    exit_code = 0
+    for compact_keys in ("false", "true"):
+        print(f"--- COMPACT_KEYS={compact_keys} ---")
+        env = {**os.environ, "COMPACT_KEYS": compact_keys}
+        exit_code |= subprocess.call([sys.executable, "-m", "pytest", "backend/tests"], env=env)
     sys.exit(exit_code)